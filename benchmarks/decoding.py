@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+# Compare ways to turn large search and message pages into models: stdlib json
+# then validation of the dict (previous behaviour), validation straight from
+# bytes (`model_validate_json`, used by endpoints now) and orjson then
+# validation. Also compares dict decoding and request body encoding of stdlib
+# json and orjson.
+#
+# Requirements (optional, not installed with the SDK):
+#
+# pip install "i-unipile-sdk[orjson]"
+#
+# PYTHONPATH=. python benchmarks/decoding.py
+
+import json
+import timeit
+from typing import Any, Callable
+
+from payloads import messages_page, search_page
+
+from unipile_sdk.models import ChatsMessagesResponse, SearchResponse
+from unipile_sdk.models.search import LinkedinSalesNavSearchPayload, SalesNavPayloadCompany
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+NUMBER = 50
+
+PAGES = {
+    "search (100 people)": (SearchResponse, search_page(100)),
+    "messages (250)": (ChatsMessagesResponse, messages_page(250)),
+}
+
+
+def ms(function: Callable[[], Any]) -> float:
+    function()  # warm up
+    return min(timeit.repeat(function, number=NUMBER, repeat=3)) / NUMBER * 1000
+
+
+def main() -> None:
+    for name, (model, page) in PAGES.items():
+        content = json.dumps(page).encode()
+        print(f"{name}, {len(content) / 1024:.0f} KiB")
+
+        cases = {
+            "json.loads + validate dict": lambda m=model, c=content: m(**json.loads(c)),
+            "model_validate_json (bytes)": lambda m=model, c=content: m.model_validate_json(c),
+            "json.loads (dict only)": lambda c=content: json.loads(c),
+        }
+        if orjson is not None:
+            cases["orjson.loads + validate dict"] = lambda m=model, c=content: m(
+                **orjson.loads(c)
+            )
+            cases["orjson.loads (dict only)"] = lambda c=content: orjson.loads(c)
+
+        baseline = None
+        for case, function in cases.items():
+            elapsed = ms(function)
+            baseline = baseline or elapsed
+            print(f"  {case:<32}{elapsed:>8.2f} ms{baseline / elapsed:>8.1f}x")
+
+    body = LinkedinSalesNavSearchPayload(
+        keywords="python", company=SalesNavPayloadCompany(include=[str(i) for i in range(200)])
+    ).model_dump(exclude_none=True)
+    print("request body encoding")
+    print(f"  {'json.dumps':<32}{ms(lambda: json.dumps(body).encode()) * 1000:>8.1f} us")
+    if orjson is not None:
+        print(f"  {'orjson.dumps':<32}{ms(lambda: orjson.dumps(body)) * 1000:>8.1f} us")
+    else:
+        print("  orjson isn't installed")
+
+
+if __name__ == "__main__":
+    main()
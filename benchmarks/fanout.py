@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+
+# Sync time of relations of a fleet of accounts: a loop of `iterate_paginated_api`
+# runs, one per account, against `AccountFanOut`. Account N has N % 10 + 1 pages
+# and each page takes FETCH seconds to arrive.
+#
+# PYTHONPATH=. python benchmarks/fanout.py
+
+import asyncio
+import time
+from typing import Any
+
+from payloads import relations_page
+
+from unipile_sdk.fanout import AccountFanOut
+from unipile_sdk.helpers import async_iterate_paginated_api
+
+ACCOUNTS = [f"account-{i}" for i in range(50)]
+FETCH = 0.02  # Seconds per page request
+PAGE = relations_page(100)
+
+
+async def relations(account_id: str, cursor: str | None = None) -> dict[str, Any]:
+    await asyncio.sleep(FETCH)
+    pages = int(account_id.removeprefix("account-")) % 10 + 1
+    page = int(cursor or 0) + 1
+    return {**PAGE, "cursor": str(page) if page < pages else None}
+
+
+async def sequential() -> int:
+    items = 0
+    for account_id in ACCOUNTS:
+        async for _ in async_iterate_paginated_api(
+            relations, account_id=account_id, max_total=10**6
+        ):
+            items += 1
+    return items
+
+
+async def fan_out(max_concurrency: int) -> int:
+    items = 0
+    async for _ in AccountFanOut(max_concurrency).async_paginate(relations, ACCOUNTS):
+        items += 1
+    return items
+
+
+def main() -> None:
+    print(f"{'sync':<24}{'items':>8}{'seconds':>10}")
+    cases = {"sequential loop": sequential}
+    cases |= {f"fan-out ({n})": lambda n=n: fan_out(n) for n in (10, 50)}
+    for name, crawl in cases.items():
+        started = time.perf_counter()
+        items = asyncio.run(crawl())
+        print(f"{name:<24}{items:>8}{time.perf_counter() - started:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+
+# Compare HTTP/1.1 and HTTP/2 (`ClientOptions.http2`) against a local stand-in
+# for the unipile API. Reports opened connections and p50/p99 latency for 1, 10
+# and 100 in-flight requests.
+#
+# Requirements (not installed with the SDK):
+#
+# pip install "i-unipile-sdk[http2]" hypercorn
+#
+# openssl CLI is used to generate a throwaway self-signed certificate, because
+# HTTP/2 is negotiated over TLS (ALPN).
+
+import asyncio
+import logging
+import os
+import statistics
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from hypercorn.asyncio import serve
+from hypercorn.config import Config
+
+from unipile_sdk import AsyncClient
+from unipile_sdk.client import ClientOptions
+
+HOST = "localhost"
+PORT = 8443
+SERVER_DELAY = 0.02  # Simulated unipile processing time
+TOTAL_REQUESTS = 500
+IN_FLIGHT = (1, 10, 100)
+
+ME_PAYLOAD = (
+    b'{"object":"AccountOwnerProfile","provider":"LINKEDIN","provider_id":"ACoAA",'
+    b'"entity_urn":"urn:li:fsd_profile:ACoAA","object_urn":"urn:li:member:1",'
+    b'"first_name":"Jane","last_name":"Doe","email":"jane@example.com",'
+    b'"premium":false,"open_profile":false,"organizations":[]}'
+)
+
+connections: set[tuple[str, int]] = set()
+
+
+async def app(scope, receive, send):
+    if scope["type"] != "http":
+        return
+
+    connections.add(tuple(scope["client"]))
+    await asyncio.sleep(SERVER_DELAY)
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/json")],
+        }
+    )
+    await send({"type": "http.response.body", "body": ME_PAYLOAD})
+
+
+def generate_certificate(directory: Path) -> tuple[Path, Path]:
+    cert, key = directory / "cert.pem", directory / "key.pem"
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+            "-keyout", str(key), "-out", str(cert), "-days", "1",
+            "-subj", f"/CN={HOST}", "-addext", f"subjectAltName=DNS:{HOST}",
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return cert, key
+
+
+def start_server(cert: Path, key: Path) -> None:
+    config = Config()
+    config.bind = [f"{HOST}:{PORT}"]
+    config.certfile = str(cert)
+    config.keyfile = str(key)
+    config.alpn_protocols = ["h2", "http/1.1"]
+    config.loglevel = "WARNING"
+
+    # Never shut down, server dies with the daemon thread
+    shutdown_trigger = asyncio.Event().wait
+    thread = threading.Thread(
+        target=lambda: asyncio.run(serve(app, config, shutdown_trigger=shutdown_trigger)),
+        daemon=True,
+    )
+    thread.start()
+    time.sleep(1)
+
+
+async def run(http2: bool, in_flight: int) -> tuple[int, float, float]:
+    client = AsyncClient(
+        ClientOptions(
+            auth="token",
+            base_url=f"https://{HOST}:{PORT}",
+            default_account_id="account",
+            log_level=logging.WARNING,
+            http2=http2,
+        )
+    )
+    semaphore = asyncio.Semaphore(in_flight)
+    latencies: list[float] = []
+
+    async def call() -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await client.users.me()
+            latencies.append(time.perf_counter() - started)
+
+    connections.clear()
+    await asyncio.gather(*(call() for _ in range(TOTAL_REQUESTS)))
+    await client.aclose()
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    return len(connections), quantiles[49] * 1000, quantiles[98] * 1000
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        cert, key = generate_certificate(Path(directory))
+        os.environ["SSL_CERT_FILE"] = str(cert)
+        start_server(cert, key)
+
+        print(f"{'protocol':<10}{'in-flight':>10}{'connections':>13}{'p50 ms':>10}{'p99 ms':>10}")
+        for in_flight in IN_FLIGHT:
+            for http2 in (False, True):
+                opened, p50, p99 = asyncio.run(run(http2, in_flight))
+                protocol = "HTTP/2" if http2 else "HTTP/1.1"
+                print(f"{protocol:<10}{in_flight:>10}{opened:>13}{p50:>10.1f}{p99:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
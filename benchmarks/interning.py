@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+
+# Memory retained by a crawl kept in memory (search result and message pages) with
+# and without `ClientOptions.interning`, per response mode. Pages are served from
+# memory through `httpx.MockTransport`.
+#
+# PYTHONPATH=. python benchmarks/interning.py [pages per endpoint, default 200]
+
+import gc
+import json
+import logging
+import sys
+import tracemalloc
+from typing import Any
+
+import httpx
+from payloads import messages_page, search_page
+
+from unipile_sdk import Client
+from unipile_sdk.api_endpoints import compact_records
+from unipile_sdk.client import ClientOptions
+from unipile_sdk.interning import StringInterner
+from unipile_sdk.models.search import LinkedinSearchPayload
+
+BODIES = {
+    "/linkedin/search": json.dumps(search_page(50)).encode(),
+    "/chats/chat-1/messages": json.dumps(messages_page(100)).encode(),
+}
+MODES: dict[str, dict[str, Any]] = {
+    "validate": {},
+    "dict": {"validation": "dict"},
+    "compact": {"compact": True},
+}
+
+
+def make_client(interning: StringInterner | None) -> Client:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=BODIES[request.url.path.removeprefix("/api/v1")])
+
+    options = ClientOptions(
+        auth="token",
+        base_url="https://api.unipile.test",
+        default_account_id="account",
+        log_level=logging.WARNING,
+        coalesce_requests=False,
+        interning=interning,
+    )
+    return Client(options, client=httpx.Client(transport=httpx.MockTransport(handler)))
+
+
+def crawl(client: Client, pages: int, options: dict[str, Any]) -> int:
+    """
+    Bytes retained by `pages` pages of each endpoint.
+    """
+    gc.collect()
+    tracemalloc.start()
+    options = dict(options)
+    compact = options.pop("compact", False)
+    search = client.ln_search.with_options(**options).search
+    messages = client.messages.with_options(**options).messages
+    if compact:
+        search, messages = compact_records(search), compact_records(messages)
+    kept = []
+    for _ in range(pages):
+        kept.append(search(LinkedinSearchPayload(keywords="python"), limit=50))
+        kept.append(messages("chat-1"))
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size
+
+
+def main() -> None:
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    print(f"{pages} search pages (50) and message pages (100)")
+    print(f"{'mode':<12}{'plain MB':>10}{'interned MB':>13}{'saved':>8}{'reported MB':>13}")
+    for mode, options in MODES.items():
+        # NOTE: warm up pydantic's string cache, which is global and would otherwise be
+        # charged to the first crawl only
+        crawl(make_client(None), pages, options)
+        plain = crawl(make_client(None), pages, options)
+        interner = StringInterner()
+        interned = crawl(make_client(interner), pages, options)
+        print(
+            f"{mode:<12}{plain / 2**20:>10.1f}{interned / 2**20:>13.1f}"
+            f"{1 - interned / plain:>8.0%}{interner.saved_bytes / 2**20:>13.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+# Compare eager and lazy models (`ClientOptions.lazy`): pages are validated from
+# bytes and either only the commonly used fields are read, or every nested
+# collection is accessed too.
+#
+# PYTHONPATH=. python benchmarks/lazy.py
+
+import json
+import time
+from typing import Any, Callable
+
+from payloads import search_page
+from pydantic import BaseModel
+
+from unipile_sdk.models import LazySearchResponse, SearchResponse
+
+DURATION = 1.0  # Seconds per case
+
+CASES: dict[str, tuple[Any, ...]] = {
+    "search page (50)": (
+        SearchResponse,
+        LazySearchResponse,
+        json.dumps(search_page(50)).encode(),
+        lambda item: (item.id, item.name, item.network_distance),
+        lambda item: (item.current_positions, item.education, item.work_experience),
+    ),
+}
+
+
+def calls_per_second(call: Callable[[], Any]) -> float:
+    call()  # warm up
+    calls = 0
+    started = time.perf_counter()
+    while (elapsed := time.perf_counter() - started) < DURATION:
+        call()
+        calls += 1
+    return calls / elapsed
+
+
+def read(model: type[BaseModel], body: bytes, *fields: Callable[[Any], Any]) -> None:
+    for item in model.model_validate_json(body).items:
+        for field in fields:
+            field(item)
+
+
+def main() -> None:
+    print(f"{'page':<22}{'access':<10}{'eager /s':>12}{'lazy /s':>12}{'speedup':>10}")
+    for name, (eager, lazy, body, hot, nested) in CASES.items():
+        for access, fields in (("hot", (hot,)), ("all", (hot, nested))):
+            rates = [
+                calls_per_second(lambda m=m, b=body, f=fields: read(m, b, *f))
+                for m in (eager, lazy)
+            ]
+            print(
+                f"{name:<22}{access:<10}{rates[0]:>12.0f}{rates[1]:>12.0f}"
+                f"{rates[1] / rates[0]:>9.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+
+# Simulated export of 10k relations with fixed pages of 100 items and with pages
+# tuned by `PageSizeTuner`. A page takes OVERHEAD seconds plus a per item time
+# that depends on the account, pages slower than TIMEOUT fail and are retried.
+# Exports are stopped after 1000 requests.
+#
+# PYTHONPATH=. python benchmarks/pagesize.py
+
+from unipile_sdk.config import DEFAULT_PAGE_LIMIT
+from unipile_sdk.errors import RequestTimeoutError
+from unipile_sdk.pagesize import PageSizePolicy, PageSizeTuner
+
+ITEMS = 10_000
+OVERHEAD = 0.3  # Seconds per page request
+TIMEOUT = 5.0  # Seconds before a page request fails
+ACCOUNTS = {"fast": 0.002, "slow": 0.06}  # Seconds per item
+
+
+def export(per_item: float, tuner: PageSizeTuner | None) -> tuple[float, int, int]:
+    """
+    Simulated seconds, page requests and timeouts of an export.
+    """
+    elapsed, requests, timeouts, exported = 0.0, 0, 0, 0
+    while exported < ITEMS and requests < 1_000:
+        limit = tuner.limit("users.relations", "", DEFAULT_PAGE_LIMIT) if tuner else 100
+        latency = OVERHEAD + per_item * limit
+        requests += 1
+        if latency > TIMEOUT:
+            elapsed += TIMEOUT
+            timeouts += 1
+            if tuner:
+                tuner.record("users.relations", "", limit, TIMEOUT, None, RequestTimeoutError())
+            continue
+        elapsed += latency
+        exported += limit
+        if tuner:
+            tuner.record("users.relations", "", limit, latency, 300 * limit)
+    return elapsed, requests, timeouts
+
+
+def main() -> None:
+    print(f"{'account':<10}{'pages':<8}{'seconds':>10}{'requests':>10}{'timeouts':>10}")
+    for account, per_item in ACCOUNTS.items():
+        for name, tuner in (
+            ("fixed", None),
+            ("tuned", PageSizeTuner(PageSizePolicy(max_limit=1000, target_latency=2.0))),
+        ):
+            elapsed, requests, timeouts = export(per_item, tuner)
+            print(f"{account:<10}{name:<8}{elapsed:>10.1f}{requests:>10}{timeouts:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+"""
+Synthetic unipile responses shaped like real pages, shared by the benchmarks.
+"""
+
+from typing import Any
+
+
+def position(index: int) -> dict[str, Any]:
+    return {
+        "company": f"Company {index}",
+        "company_id": str(1000 + index),
+        "description": "Building data pipelines and APIs " * 4,
+        "role": "Senior Software Engineer",
+        "location": "Paris, Île-de-France, France",
+        "tenure_at_role": {"years": 2, "months": 3},
+        "tenure_at_company": {"years": 4, "months": 1},
+        "start": {"year": 2020, "month": 1},
+        "end": None,
+    }
+
+
+def people(index: int) -> dict[str, Any]:
+    return {
+        "object": "SearchResult",
+        "type": "PEOPLE",
+        "id": f"ACoAA{index:08d}",
+        "public_identifier": f"person-{index}",
+        "public_profile_url": f"https://www.linkedin.com/in/person-{index}",
+        "profile_url": f"https://www.linkedin.com/in/ACoAA{index:08d}",
+        "profile_picture_url": f"https://media.licdn.com/dms/image/{index}/profile.jpg",
+        "member_urn": f"urn:li:member:{index}",
+        "name": f"Person {index}",
+        "first_name": "Person",
+        "last_name": str(index),
+        "network_distance": "DISTANCE_2",
+        "location": "Paris, Île-de-France, France",
+        "industry": "Software Development",
+        "headline": "Senior Software Engineer at Company",
+        "connections_count": 500,
+        "shared_connections_count": 12,
+        "premium": False,
+        "open_profile": False,
+        "current_positions": [position(i) for i in range(2)],
+        "education": [
+            {
+                "degree": "Master of Science",
+                "school": "École Polytechnique",
+                "school_id": "12345",
+                "start": {"year": 2010},
+                "end": {"year": 2015},
+            }
+        ],
+        "work_experience": [
+            {
+                "company": f"Company {i}",
+                "company_id": str(2000 + i),
+                "role": "Software Engineer",
+                "industry": "Software Development",
+                "start": {"year": 2015 + i, "month": 9},
+                "end": {"year": 2016 + i, "month": 8},
+            }
+            for i in range(4)
+        ],
+    }
+
+
+def search_page(count: int = 50) -> dict[str, Any]:
+    return {
+        "object": "LinkedinSearch",
+        "items": [people(i) for i in range(count)],
+        "config": {"params": {"api": "sales_navigator", "category": "people"}},
+        "paging": {"start": 0, "page_count": count, "total_count": 2500},
+        "cursor": "eyJwYXJhbXMiOnsic3RhcnQiOjUwfX0=",
+    }
+
+
+def attachment(index: int) -> dict[str, Any]:
+    common = {"id": f"att-{index}", "file_size": 20480, "unavailable": False}
+    if index % 2:
+        return {**common, "type": "file", "file_name": "resume.pdf", "mimetype": "application/pdf"}
+    return {**common, "type": "img", "size": {"width": 640, "height": 480}, "sticker": False}
+
+
+def message(index: int) -> dict[str, Any]:
+    return {
+        "object": "Message",
+        "provider_id": f"2-{index:016d}",
+        "sender_id": f"ACoAA{index % 2:08d}",
+        "text": "Hi, thanks for connecting! Would you be open to a quick call next week? " * 2,
+        "attachments": [attachment(i) for i in range(index % 3)],
+        "id": f"message-{index}",
+        "account_id": "account-1",
+        "chat_id": "chat-1",
+        "chat_provider_id": "2-chat-provider",
+        "timestamp": "2025-01-01T00:00:00.000Z",
+        "is_sender": index % 2,
+        "quoted": {
+            "provider_id": f"2-{index - 1:016d}",
+            "sender_id": "ACoAA00000000",
+            "text": "Previous message",
+            "attachments": [attachment(1)],
+        }
+        if index % 5 == 0
+        else None,
+        "reactions": [{"value": "👍", "sender_id": "ACoAA00000001", "is_sender": False}],
+        "seen": 1,
+        "seen_by": {"ACoAA00000001": True},
+        "hidden": 0,
+        "deleted": 0,
+        "edited": 0,
+        "is_event": 0,
+        "delivered": 1,
+        "behavior": 0,
+        "original": "{}",
+        "sender_attendee_id": f"attendee-{index % 2}",
+    }
+
+
+def messages_page(count: int = 100) -> dict[str, Any]:
+    return {"object": "MessageList", "items": [message(i) for i in range(count)], "cursor": "c2"}
+
+
+def relations_page(count: int = 100) -> dict[str, Any]:
+    return {
+        "object": "UserRelationsList",
+        "items": [
+            {
+                "object": "UserRelation",
+                "first_name": "First",
+                "last_name": str(i),
+                "headline": "Engineering Manager at Company",
+                "public_identifier": f"relation-{i}",
+                "public_profile_url": f"https://www.linkedin.com/in/relation-{i}",
+                "created_at": 1700000000000 + i,
+                "member_id": f"ACoAA{i:08d}",
+                "member_urn": f"urn:li:member:{i}",
+                "connection_urn": f"urn:li:fsd_connection:{i}",
+                "profile_picture_url": f"https://media.licdn.com/dms/image/{i}/profile.jpg",
+            }
+            for i in range(count)
+        ],
+        "cursor": "c3",
+    }
+
+
+def chat_attendees_page(count: int = 100) -> dict[str, Any]:
+    return {
+        "object": "ChatAttendeeList",
+        "items": [
+            {
+                "object": "ChatAttendee",
+                "id": f"attendee-{i}",
+                "account_id": "account-1",
+                "provider_id": f"ACoAA{i:08d}",
+                "name": f"Attendee {i}",
+                "is_self": 0,
+                "picture_url": f"https://media.licdn.com/dms/image/{i}/profile.jpg",
+                "profile_url": f"https://www.linkedin.com/in/ACoAA{i:08d}",
+                "specifics": {
+                    "provider": "LINKEDIN",
+                    "member_urn": f"urn:li:member:{i}",
+                    "occupation": "Engineer",
+                    "network_distance": "DISTANCE_1",
+                },
+            }
+            for i in range(count)
+        ],
+        "cursor": "c4",
+    }
+
+
+def profile() -> dict[str, Any]:
+    return {
+        "object": "UserProfile",
+        "provider": "LINKEDIN",
+        "provider_id": "ACoAA00000001",
+        "public_identifier": "jane-doe",
+        "first_name": "Jane",
+        "last_name": "Doe",
+        "headline": "Senior Software Engineer",
+        "summary": "Engineer building things. " * 20,
+        "location": "Paris, Île-de-France, France",
+        "websites": ["https://example.com"],
+        "contact_info": {"emails": ["jane@example.com"], "socials": [{"type": "x", "name": "jd"}]},
+        "work_experience": [
+            {
+                "position": "Software Engineer",
+                "company": f"Company {i}",
+                "company_id": str(i),
+                "location": "Paris",
+                "description": "Building data pipelines and APIs " * 4,
+                "skills": ["python", "sql", "kubernetes"],
+                "start": "1/2015",
+                "end": "12/2016",
+            }
+            for i in range(10)
+        ],
+        "education": [
+            {"degree": "MSc", "school": "École Polytechnique", "start": "2010", "end": "2015"}
+        ],
+        "skills": [
+            {
+                "name": f"Skill {i}",
+                "endorsement_count": i,
+                "endorsement_id": i,
+                "insights": [],
+                "endorsed": False,
+            }
+            for i in range(20)
+        ],
+        "languages": [{"name": "English", "proficiency": "Full professional"}],
+        "follower_count": 1200,
+        "connections_count": 500,
+        "network_distance": "SECOND_DEGREE",
+    }
+
+
+def user_me(index: int) -> dict[str, Any]:
+    plans = [
+        {"owner_seat_id": f"seat-{index}", "contract_id": f"contract-{index}"},
+        {"error": "DISCONNECTED"},
+    ]
+    return {
+        "object": "AccountOwnerProfile",
+        "provider": "LINKEDIN",
+        "provider_id": f"ACoAA{index:08d}",
+        "entity_urn": f"urn:li:fsd_profile:ACoAA{index:08d}",
+        "object_urn": f"urn:li:member:{index}",
+        "first_name": "Jane",
+        "last_name": str(index),
+        "email": f"jane-{index}@example.com",
+        "premium": True,
+        "open_profile": False,
+        "organizations": [],
+        "recruiter": plans[index % 2],
+        "sales_navigator": plans[(index + 1) % 2],
+    }
+
+
+ORGANIZATION_TYPES = [
+    "PUBLIC_COMPANY",
+    "EDUCATIONAL",
+    "SELF_EMPLOYED",
+    "GOVERNMENT_AGENCY",
+    "NON_PROFIT",
+    "SELF_OWNED",
+    "PRIVATELY_HELD",
+    "PARTNERSHIP",
+]
+
+
+def company(index: int) -> dict[str, Any]:
+    return {
+        "object": "CompanyProfile",
+        "id": str(1000 + index),
+        "name": f"Company {index}",
+        "entity_urn": f"urn:li:fsd_company:{1000 + index}",
+        "public_identifier": f"company-{index}",
+        "profile_url": f"https://www.linkedin.com/company/company-{index}",
+        "messaging": {"is_enabled": True},
+        "claimed": True,
+        "viewer_permissions": {},
+        "organization_type": ORGANIZATION_TYPES[index % len(ORGANIZATION_TYPES)],
+    }
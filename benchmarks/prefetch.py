@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+
+# Crawl time of paginated relations with and without `prefetch`: each page takes
+# FETCH seconds to arrive and the consumer spends PROCESS seconds on its items,
+# so sequential pagination costs their sum and prefetching overlaps them.
+#
+# PYTHONPATH=. python benchmarks/prefetch.py
+
+import asyncio
+import time
+from typing import Any
+
+from payloads import relations_page
+
+from unipile_sdk.helpers import async_iterate_paginated_api, iterate_paginated_api
+
+PAGES = 20
+FETCH = 0.02  # Seconds per page request
+PROCESS = 0.02  # Seconds of processing per page
+PAGE = relations_page(100)
+
+
+def relations(cursor: str | None = None) -> dict[str, Any]:
+    time.sleep(FETCH)
+    page = int(cursor or 0) + 1
+    return {**PAGE, "cursor": str(page) if page < PAGES else None}
+
+
+async def async_relations(cursor: str | None = None) -> dict[str, Any]:
+    await asyncio.sleep(FETCH)
+    page = int(cursor or 0) + 1
+    return {**PAGE, "cursor": str(page) if page < PAGES else None}
+
+
+def crawl(prefetch: int) -> float:
+    started = time.perf_counter()
+    for index, _ in enumerate(iterate_paginated_api(relations, max_total=10**6, prefetch=prefetch)):
+        if index % len(PAGE["items"]) == 0:
+            time.sleep(PROCESS)
+    return time.perf_counter() - started
+
+
+async def async_crawl(prefetch: int) -> float:
+    started = time.perf_counter()
+    index = 0
+    async for _ in async_iterate_paginated_api(async_relations, max_total=10**6, prefetch=prefetch):
+        if index % len(PAGE["items"]) == 0:
+            await asyncio.sleep(PROCESS)
+        index += 1
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    print(f"{'prefetch':<10}{'sync s':>10}{'async s':>10}")
+    for prefetch in (0, 1, 2, 4):
+        elapsed = crawl(prefetch), asyncio.run(async_crawl(prefetch))
+        print(f"{prefetch:<10}{elapsed[0]:>10.2f}{elapsed[1]:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
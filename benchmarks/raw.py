@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+# Proxy throughput of a search page served by an in-process transport: the body
+# is validated into models and dumped back to JSON, or forwarded with
+# `request_raw()` without being decoded.
+#
+# PYTHONPATH=. python benchmarks/raw.py
+
+import json
+import logging
+import time
+from typing import Any, Callable
+
+import httpx
+from payloads import search_page
+
+from unipile_sdk import Client
+from unipile_sdk.api_endpoints import raw_response
+from unipile_sdk.client import ClientOptions
+from unipile_sdk.models.search import LinkedinSearchPayload
+
+DURATION = 1.0  # Seconds per case
+BODY = json.dumps(search_page(50)).encode()
+
+
+def calls_per_second(call: Callable[[], Any]) -> float:
+    call()  # warm up
+    calls = 0
+    started = time.perf_counter()
+    while (elapsed := time.perf_counter() - started) < DURATION:
+        call()
+        calls += 1
+    return calls / elapsed
+
+
+def main() -> None:
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=BODY))
+    options = ClientOptions(
+        auth="token",
+        base_url="https://api.unipile.test",
+        default_account_id="account",
+        log_level=logging.WARNING,
+    )
+    client = Client(options, client=httpx.Client(transport=transport))
+    payload = LinkedinSearchPayload(keywords="engineer")
+    cases = {
+        "validated + dumped": lambda: client.ln_search.search(payload).model_dump_json(),
+        "raw": lambda: raw_response(client.ln_search.search)(payload).content,
+    }
+
+    print(f"{'search page (50)':<22}{'proxied /s':>12}")
+    for name, call in cases.items():
+        print(f"{name:<22}{calls_per_second(call):>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
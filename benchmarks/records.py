@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+
+# Memory retained by N list items kept as pydantic models, decoded dicts and
+# compact records (`unipile_sdk.records`). Items are decoded from JSON pages, so
+# strings aren't shared between items, like in a real crawl.
+#
+# PYTHONPATH=. python benchmarks/records.py [items, default 1M] [kind]
+#
+# 1M search results as models need several GB, pass fewer items to extrapolate.
+
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from payloads import people, relations_page
+
+from unipile_sdk.models import PeopleSearchResult, UserRelation
+from unipile_sdk.records import PeopleSearchResultRecord, UserRelationRecord
+
+PAGE = 100  # Items per decoded page
+
+KINDS: dict[str, tuple[Any, ...]] = {
+    "UserRelation": (
+        json.dumps(relations_page(PAGE)["items"]).encode(),
+        UserRelation.model_validate,
+        UserRelationRecord.from_dict,
+    ),
+    "PeopleSearchResult": (
+        json.dumps([people(i) for i in range(PAGE)]).encode(),
+        PeopleSearchResult.model_validate,
+        PeopleSearchResultRecord.from_dict,
+    ),
+}
+
+
+def retained(count: int, body: bytes, build: Callable[[Any], Any]) -> tuple[int, float]:
+    """
+    Bytes retained by `count` built items and seconds spent building them.
+    """
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    items = []
+    for _ in range(count // PAGE):
+        items.extend(build(item) for item in json.loads(body))
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del items
+    return size, elapsed
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    kinds = sys.argv[2:] or list(KINDS)
+
+    print(f"{count} items")
+    print(f"{'kind':<20}{'format':<10}{'MB':>10}{'bytes/item':>12}{'seconds':>10}")
+    for kind in kinds:
+        body, model, record = KINDS[kind]
+        for name, build in (("model", model), ("dict", lambda item: item), ("record", record)):
+            size, elapsed = retained(count, body, build)
+            print(
+                f"{kind:<20}{name:<10}{size / 2**20:>10.0f}{size / count:>12.0f}{elapsed:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+# Cold start of `import unipile_sdk` in fresh interpreters: import time (median of
+# several runs) and memory allocated by the import. Fails (exit code 1) when a
+# measure exceeds its budget in startup_budget.json by more than the tolerance,
+# e.g. when a change imports every model at startup again.
+#
+# PYTHONPATH=. python benchmarks/startup.py [--record]
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BUDGET = Path(__file__).with_name("startup_budget.json")
+RUNS = 15
+# Regression allowed over the recorded budget, import time is noisy
+TOLERANCE = {"import_ms": 1.3, "import_mb": 1.05, "model_modules": 1.0}
+
+TIME_PROBE = """
+import time
+started = time.perf_counter()
+import unipile_sdk
+print(time.perf_counter() - started)
+"""
+
+MEMORY_PROBE = """
+import sys
+import tracemalloc
+tracemalloc.start()
+import unipile_sdk
+print(tracemalloc.get_traced_memory()[0])
+print(sum(name.startswith("unipile_sdk.models.") for name in sys.modules))
+"""
+
+
+def probe(code: str) -> list[str]:
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+    )
+    return result.stdout.split()
+
+
+def measure() -> dict[str, float]:
+    probe(TIME_PROBE)  # NOTE: warm up the OS file cache and bytecode
+    seconds = statistics.median(float(probe(TIME_PROBE)[0]) for _ in range(RUNS))
+    memory, model_modules = probe(MEMORY_PROBE)
+    return {
+        "import_ms": round(seconds * 1000, 1),
+        "import_mb": round(int(memory) / 2**20, 2),
+        "model_modules": int(model_modules),
+    }
+
+
+def main() -> None:
+    measured = measure()
+    if "--record" in sys.argv:
+        BUDGET.write_text(json.dumps(measured, indent=2) + "\n")
+        print(f"recorded {measured}")
+        return
+
+    budget = json.loads(BUDGET.read_text())
+    failed = False
+    for name, value in measured.items():
+        limit = budget[name] * TOLERANCE[name]
+        ok = value <= limit
+        failed |= not ok
+        print(f"{name:<16}{value:>10}{'budget':>10}{budget[name]:>10}  {'ok' if ok else 'FAIL'}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
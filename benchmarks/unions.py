@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+
+# Validation of models with tagged (discriminated) unions against twins declaring
+# the same fields as plain unions, tried member by member. Lists of items are
+# validated from bytes with a `TypeAdapter` per model.
+#
+# PYTHONPATH=. python benchmarks/unions.py
+
+import json
+import time
+from typing import Any, Callable, Literal, Union
+
+from payloads import company, message, user_me
+from pydantic import TypeAdapter
+
+from unipile_sdk.models import (
+    AttachementImg,
+    AttachmentAudio,
+    AttachmentFile,
+    AttachmentPost,
+    AttachmentVideo,
+    LinkedinCompanyProfile,
+    LinkedinUserMe,
+    LinkedinUserPlanDisconnected,
+    LinkedinUserPlanInfo,
+    Message,
+    MessageQuoted,
+)
+
+DURATION = 1.0  # Seconds per model
+COUNT = 100  # Items per validated list
+
+PlainAttachment = Union[
+    AttachementImg, AttachmentVideo, AttachmentAudio, AttachmentFile, AttachmentPost
+]
+
+
+class PlainMessageQuoted(MessageQuoted):
+    attachments: list[PlainAttachment]
+
+
+class PlainMessage(Message):
+    attachments: list[PlainAttachment]
+    quoted: PlainMessageQuoted | None = None
+
+
+class PlainUserMe(LinkedinUserMe):
+    recruiter: LinkedinUserPlanInfo | LinkedinUserPlanDisconnected | None = None
+    sales_navigator: LinkedinUserPlanInfo | LinkedinUserPlanDisconnected | None = None
+
+
+class PlainCompanyProfile(LinkedinCompanyProfile):
+    organization_type: (
+        Literal["PUBLIC_COMPANY"]
+        | Literal["EDUCATIONAL"]
+        | Literal["SELF_EMPLOYED"]
+        | Literal["GOVERNMENT_AGENCY"]
+        | Literal["NON_PROFIT"]
+        | Literal["SELF_OWNED"]
+        | Literal["PRIVATELY_HELD"]
+        | Literal["PARTNERSHIP"]
+        | Any
+    )
+
+
+CASES: dict[str, tuple[Any, Any, Callable[[int], dict[str, Any]]]] = {
+    "Message": (Message, PlainMessage, message),
+    "LinkedinUserMe": (LinkedinUserMe, PlainUserMe, user_me),
+    "LinkedinCompanyProfile": (LinkedinCompanyProfile, PlainCompanyProfile, company),
+}
+
+
+def calls_per_second(call: Callable[[], Any]) -> float:
+    call()  # warm up
+    calls = 0
+    started = time.perf_counter()
+    while (elapsed := time.perf_counter() - started) < DURATION:
+        call()
+        calls += 1
+    return calls / elapsed
+
+
+def main() -> None:
+    print(f"{'model':<26}{'plain /s':>12}{'tagged /s':>12}{'speedup':>10}")
+    for name, (tagged, plain, payload) in CASES.items():
+        body = json.dumps([payload(i) for i in range(COUNT)]).encode()
+        adapters = [TypeAdapter(list[model]) for model in (plain, tagged)]
+        rates = [
+            calls_per_second(lambda a=adapter, b=body: a.validate_json(b)) for adapter in adapters
+        ]
+        print(f"{name:<26}{rates[0]:>12.0f}{rates[1]:>12.0f}{rates[1] / rates[0]:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+
+# Compare response modes (`ClientOptions.validation`) per endpoint: pydantic
+# validation, a validation policy (validation tolerating schema drift) and plain
+# dicts. Responses are served from memory through `httpx.MockTransport`, so numbers
+# are decoding and model building costs only.
+#
+# PYTHONPATH=. python benchmarks/validation.py
+
+import json
+import logging
+import time
+from typing import Any, Callable
+
+import httpx
+from payloads import chat_attendees_page, messages_page, profile, relations_page, search_page
+
+from unipile_sdk import Client
+from unipile_sdk.client import ClientOptions
+from unipile_sdk.models.search import LinkedinSearchPayload
+from unipile_sdk.typing import ValidationMode
+from unipile_sdk.validation import ValidationPolicy
+
+DURATION = 1.0  # Seconds per endpoint and mode
+MODES: dict[str, Callable[[], ValidationMode | ValidationPolicy]] = {
+    "validate": lambda: "validate",
+    "policy": lambda: ValidationPolicy(rate=0.01),
+    "dict": lambda: "dict",
+}
+
+ROUTES = {
+    "/users/jane/": profile(),
+    "/linkedin/search": search_page(50),
+    "/chats/chat-1/messages": messages_page(100),
+    "/users/relations": relations_page(100),
+    "/chat_attendees": chat_attendees_page(100),
+}
+
+ENDPOINTS: dict[str, Callable[[Client], Any]] = {
+    "users.retrieve": lambda client: client.users.retrieve("jane"),
+    "ln_search.search (50)": lambda client: client.ln_search.search(
+        LinkedinSearchPayload(keywords="python"), limit=50
+    ),
+    "messages.messages (100)": lambda client: client.messages.messages("chat-1"),
+    "users.relations (100)": lambda client: client.users.relations(),
+    "messages.chat_attendees (100)": lambda client: client.messages.chat_attendees(),
+}
+
+
+def make_client(validation: ValidationMode | ValidationPolicy) -> Client:
+    bodies = {path: json.dumps(payload).encode() for path, payload in ROUTES.items()}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path.removeprefix("/api/v1")
+        return httpx.Response(200, content=bodies[path])
+
+    options = ClientOptions(
+        auth="token",
+        base_url="https://api.unipile.test",
+        default_account_id="account",
+        log_level=logging.WARNING,
+        coalesce_requests=False,
+        validation=validation,
+    )
+    return Client(options, client=httpx.Client(transport=httpx.MockTransport(handler)))
+
+
+def calls_per_second(call: Callable[[], Any]) -> float:
+    call()  # warm up
+    calls = 0
+    started = time.perf_counter()
+    while (elapsed := time.perf_counter() - started) < DURATION:
+        call()
+        calls += 1
+    return calls / elapsed
+
+
+def main() -> None:
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    clients = {mode: make_client(validation()) for mode, validation in MODES.items()}
+
+    header = "".join(f"{mode + ' /s':>14}" for mode in MODES)
+    print(f"{'endpoint':<32}{header}{'speedup':>16}")
+    for name, endpoint in ENDPOINTS.items():
+        rates = [
+            calls_per_second(lambda call=endpoint, client=clients[mode]: call(client))
+            for mode in MODES
+        ]
+        speedup = " / ".join(f"{rate / rates[0]:.1f}x" for rate in rates[1:])
+        print(f"{name:<32}" + "".join(f"{rate:>14.0f}" for rate in rates) + f"{speedup:>16}")
+
+
+if __name__ == "__main__":
+    main()
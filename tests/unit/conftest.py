@@ -0,0 +1,38 @@
+"""
+Offline fixtures, unipile API is replaced by `httpx.MockTransport` routes.
+"""
+
+import logging
+
+import httpx
+import pytest
+from fakes import ACCOUNT_ID, BASE_URL, FakeUnipile
+
+from unipile_sdk import AsyncClient, Client
+from unipile_sdk.client import ClientOptions
+
+
+@pytest.fixture
+def unipile() -> FakeUnipile:
+    return FakeUnipile()
+
+
+@pytest.fixture
+def options() -> ClientOptions:
+    return ClientOptions(
+        auth="token",
+        base_url=BASE_URL,
+        default_account_id=ACCOUNT_ID,
+        log_level=logging.WARNING,
+    )
+
+
+@pytest.fixture
+def client(unipile: FakeUnipile, options: ClientOptions) -> Client:
+    return Client(options, client=httpx.Client(transport=httpx.MockTransport(unipile)))
+
+
+@pytest.fixture
+def async_client(unipile: FakeUnipile, options: ClientOptions) -> AsyncClient:
+    transport = httpx.MockTransport(unipile.handle_async)
+    return AsyncClient(options, client=httpx.AsyncClient(transport=transport))
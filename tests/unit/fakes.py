@@ -0,0 +1,278 @@
+"""
+Canned unipile payloads and a fake API to serve them through `httpx.MockTransport`.
+"""
+
+import json
+from typing import Any, Callable
+
+import httpx
+
+BASE_URL = "https://api.unipile.test"
+ACCOUNT_ID = "default-account"
+
+Route = dict[str, Any] | Callable[[httpx.Request], httpx.Response]
+
+
+def user_me_payload() -> dict[str, Any]:
+    return {
+        "object": "AccountOwnerProfile",
+        "provider": "LINKEDIN",
+        "provider_id": "ACoAA",
+        "entity_urn": "urn:li:fsd_profile:ACoAA",
+        "object_urn": "urn:li:member:1",
+        "first_name": "Jane",
+        "last_name": "Doe",
+        "email": "jane@example.com",
+        "premium": False,
+        "open_profile": False,
+        "occupation": "Engineer",
+        "organizations": [],
+    }
+
+
+def user_profile_payload(identifier: str = "jane-doe") -> dict[str, Any]:
+    return {
+        "object": "UserProfile",
+        "provider": "LINKEDIN",
+        "provider_id": f"id-{identifier}",
+        "public_identifier": identifier,
+        "first_name": "Jane",
+        "last_name": "Doe",
+        "headline": "Engineer",
+        "websites": [],
+        "connections_count": 42,
+        "work_experience": [
+            {
+                "position": "Engineer",
+                "company": "Acme",
+                "skills": ["python"],
+                "start": "1/2020",
+                "end": None,
+            }
+        ],
+    }
+
+
+def relation_payload(index: int) -> dict[str, Any]:
+    return {
+        "object": "UserRelation",
+        "first_name": f"First {index}",
+        "last_name": f"Last {index}",
+        "headline": "Engineer",
+        "public_identifier": f"relation-{index}",
+        "public_profile_url": f"https://www.linkedin.com/in/relation-{index}",
+        "created_at": 1700000000000 + index,
+        "member_id": f"member-{index}",
+        "member_urn": f"urn:li:member:{index}",
+        "connection_urn": f"urn:li:connection:{index}",
+    }
+
+
+def relations_page(start: int, count: int, cursor: str | None) -> dict[str, Any]:
+    return {
+        "object": "UserRelationsList",
+        "items": [relation_payload(start + i) for i in range(count)],
+        "cursor": cursor,
+    }
+
+
+def people_payload(index: int, network_distance: str = "DISTANCE_2") -> dict[str, Any]:
+    return {
+        "type": "PEOPLE",
+        "id": f"people-{index}",
+        "name": f"Person {index}",
+        "network_distance": network_distance,
+        "location": "Paris",
+        "industry": "Software",
+        "current_positions": [
+            {
+                "company": "Acme",
+                "role": "Engineer",
+                "location": "Paris",
+                "tenure_at_role": {"years": 1, "months": 2},
+            }
+        ],
+        "education": [{"school": "MIT", "start": {"year": 2010}}],
+        "work_experience": [
+            {"company": "Acme", "role": "Engineer", "start": {"year": 2020}}
+        ],
+    }
+
+
+def search_page(count: int, cursor: str | None = None) -> dict[str, Any]:
+    return {
+        "object": "LinkedinSearch",
+        "items": [people_payload(i) for i in range(count)],
+        "config": {},
+        "paging": {"start": 0, "page_count": count, "total_count": count},
+        "cursor": cursor,
+    }
+
+
+def search_params_payload(ids: list[str]) -> dict[str, Any]:
+    return {
+        "object": "LinkedinSearchParametersList",
+        "items": [
+            {"object": "LinkedinSearchParameter", "id": id, "title": f"Company {id}"}
+            for id in ids
+        ],
+        "paging": {"page_count": len(ids)},
+    }
+
+
+def company_payload(id: str = "1035") -> dict[str, Any]:
+    return {
+        "object": "CompanyProfile",
+        "id": id,
+        "name": "Microsoft",
+        "entity_urn": f"urn:li:fsd_company:{id}",
+        "public_identifier": "microsoft",
+        "profile_url": "https://www.linkedin.com/company/microsoft",
+        "messaging": {"is_enabled": True},
+        "claimed": True,
+        "viewer_permissions": {},
+        "organization_type": "PUBLIC_COMPANY",
+    }
+
+
+def message_payload(index: int, chat_id: str = "chat-1") -> dict[str, Any]:
+    return {
+        "object": "Message",
+        "provider_id": f"provider-{index}",
+        "sender_id": "sender-1",
+        "text": f"Hello {index}",
+        "attachments": [
+            {
+                "id": f"att-{index}",
+                "file_size": 10,
+                "unavailable": False,
+                "type": "file",
+                "file_name": "cv.pdf",
+            }
+        ],
+        "id": f"message-{index}",
+        "account_id": ACCOUNT_ID,
+        "chat_id": chat_id,
+        "chat_provider_id": "chat-provider-1",
+        "timestamp": "2025-01-01T00:00:00.000Z",
+        "is_sender": 0,
+        "reactions": [{"value": "👍", "sender_id": "sender-2", "is_sender": False}],
+        "seen": 1,
+        "seen_by": {},
+        "hidden": 0,
+        "deleted": 0,
+        "edited": 0,
+        "is_event": 0,
+        "delivered": 1,
+        "behavior": 0,
+        "original": "{}",
+        "sender_attendee_id": "attendee-1",
+    }
+
+
+def messages_page(start: int, count: int, cursor: str | None) -> dict[str, Any]:
+    return {
+        "object": "MessageList",
+        "items": [message_payload(start + i) for i in range(count)],
+        "cursor": cursor,
+    }
+
+
+def account_payload(index: int, im_id: str) -> dict[str, Any]:
+    return {
+        "object": "Account",
+        "type": "LINKEDIN",
+        "id": f"account-{index}",
+        "name": f"Account {index}",
+        "created_at": "2025-01-01T00:00:00.000Z",
+        "connection_params": {
+            "im": {
+                "id": im_id,
+                "username": f"user-{index}",
+                "premiumId": None,
+                "premiumContractId": None,
+                "organizations": [],
+            }
+        },
+        "groups": [],
+        "sources": [{"id": f"source-{index}", "status": "OK"}],
+    }
+
+
+def attendee_payload(index: int) -> dict[str, Any]:
+    return {
+        "object": "ChatAttendee",
+        "id": f"attendee-{index}",
+        "account_id": ACCOUNT_ID,
+        "provider_id": f"provider-{index}",
+        "name": f"Attendee {index}",
+        "is_self": 0,
+    }
+
+
+def attendees_page(start: int, count: int, cursor: str | None) -> dict[str, Any]:
+    return {
+        "object": "ChatAttendeeList",
+        "items": [attendee_payload(start + i) for i in range(count)],
+        "cursor": cursor,
+    }
+
+
+def paged(
+    page: Callable[[int, int, str | None], dict[str, Any]], pages: int, size: int
+) -> Callable[[httpx.Request], httpx.Response]:
+    """Route serving `pages` pages of `size` items built by `page`, cursors are page indexes."""
+
+    def route(request: httpx.Request) -> httpx.Response:
+        index = int(request.url.params.get("cursor", 0))
+        cursor = str(index + 1) if index + 1 < pages else None
+        return httpx.Response(200, json=page(index * size, size, cursor))
+
+    return route
+
+
+def paged_relations(pages: int, size: int) -> Callable[[httpx.Request], httpx.Response]:
+    return paged(relations_page, pages, size)
+
+
+def error_payload(status: int, type: str) -> dict[str, Any]:
+    return {"title": "Error", "detail": f"{type} detail", "status": status, "type": type}
+
+
+class FakeUnipile:
+    """
+    Minimal stand-in for unipile API, routes are matched by method and path (relative
+    to the versioned API root) and every received request is recorded.
+    """
+
+    def __init__(self) -> None:
+        self.routes: dict[tuple[str, str], Route] = {}
+        self.requests: list[httpx.Request] = []
+
+    def add(self, method: str, path: str, route: Route, status: int = 200) -> None:
+        if isinstance(route, dict):
+            payload = route
+            route = lambda request: httpx.Response(status, json=payload)  # noqa: E731
+        self.routes[(method, path)] = route
+
+    def calls(self, path: str) -> list[httpx.Request]:
+        return [r for r in self.requests if r.url.path.endswith(f"/api/v1/{path}")]
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        path = request.url.path.split("/api/v1/", 1)[1]
+        route = self.routes.get((request.method, path))
+        if route is None:
+            return httpx.Response(404, json=error_payload(404, "errors/resource_not_found"))
+        return route(request)
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        return self(request)
+
+
+def query_of(request: httpx.Request) -> dict[str, str]:
+    return dict(request.url.params)
+
+
+def body_of(request: httpx.Request) -> dict[str, Any]:
+    return json.loads(request.content)
@@ -0,0 +1,84 @@
+import asyncio
+
+import httpx
+
+from unipile_sdk import AsyncClient, Client
+from unipile_sdk.helpers import async_collect_paginated_api
+from unipile_sdk.models import LinkedinUserMe, LinkedinUserProfile
+
+from fakes import (
+    ACCOUNT_ID,
+    FakeUnipile,
+    account_payload,
+    company_payload,
+    query_of,
+    relations_page,
+    search_params_payload,
+    user_me_payload,
+    user_profile_payload,
+)
+
+
+def test_me_resolves_default_account(unipile: FakeUnipile, async_client: AsyncClient):
+    unipile.add("GET", "users/me", user_me_payload())
+
+    me = asyncio.run(async_client.users.me())
+
+    assert isinstance(me, LinkedinUserMe)
+    assert query_of(unipile.requests[0]) == {"account_id": ACCOUNT_ID}
+
+
+def test_explicit_account_id_is_sent(
+    unipile: FakeUnipile, client: Client, async_client: AsyncClient
+):
+    unipile.add("GET", "users/relations", relations_page(0, 2, None))
+
+    client.users.relations(account_id="other")
+    asyncio.run(async_client.users.relations(account_id="other"))
+
+    assert [query_of(r)["account_id"] for r in unipile.requests] == ["other", "other"]
+
+
+def test_concurrent_profile_lookups(unipile: FakeUnipile, async_client: AsyncClient):
+    def profile(request: httpx.Request) -> httpx.Response:
+        identifier = request.url.path.rstrip("/").split("/")[-1]
+        return httpx.Response(200, json=user_profile_payload(identifier))
+
+    for i in range(50):
+        unipile.add("GET", f"users/user-{i}/", profile)
+
+    async def lookup() -> list[LinkedinUserProfile]:
+        return await asyncio.gather(
+            *(async_client.users.retrieve(f"user-{i}") for i in range(50))
+        )
+
+    profiles = asyncio.run(lookup())
+
+    assert [p.public_identifier for p in profiles] == [f"user-{i}" for i in range(50)]
+
+
+def test_retrieve_company_id(unipile: FakeUnipile, async_client: AsyncClient):
+    unipile.add("GET", "linkedin/company/1035", company_payload())
+    unipile.add("GET", "linkedin/search/parameters", search_params_payload(["1441"]))
+
+    assert asyncio.run(async_client.ln_search.retrieve_company_id("1035")) == "1035"
+    assert asyncio.run(async_client.ln_search.retrieve_company_id("google.com")) == "1441"
+    assert asyncio.run(async_client.ln_search.retrieve_company_id("404")) is None
+
+
+def test_paginate_and_duplicate_amount(unipile: FakeUnipile, async_client: AsyncClient):
+    unipile.add(
+        "GET",
+        "accounts",
+        {
+            "object": "AccountList",
+            "items": [account_payload(i, im_id=f"im-{i % 2}") for i in range(4)],
+            "cursor": None,
+        },
+    )
+    unipile.add("GET", "users/relations", relations_page(0, 3, None))
+
+    relations = asyncio.run(async_collect_paginated_api(async_client.users.relations))
+
+    assert len(relations) == 3
+    assert asyncio.run(async_client.accounts.duplicate_amount()) == 2
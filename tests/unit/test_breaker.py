@@ -0,0 +1,165 @@
+import asyncio
+
+import httpx
+import pytest
+from fakes import ACCOUNT_ID, FakeUnipile, account_payload, error_payload, user_me_payload
+
+from unipile_sdk import AsyncClient, Client
+from unipile_sdk.breaker import CircuitBreaker, CircuitState
+from unipile_sdk.errors import (
+    APIResponseError,
+    CircuitOpenError,
+    LinkedinLoginError,
+    RequestTimeoutError,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def disconnected(unipile: FakeUnipile) -> None:
+    unipile.add("GET", "users/me", error_payload(401, "errors/disconnected_account"), status=401)
+
+
+def account_with_status(status: str) -> dict:
+    account = account_payload(0, im_id="im-0")
+    account["sources"][0]["status"] = status
+    return account
+
+
+def test_open_circuit_fails_locally(
+    unipile: FakeUnipile, client: Client, clock: FakeClock, disconnected: None
+):
+    client.breaker = CircuitBreaker(cooldown=60, clock=clock)
+
+    with pytest.raises(LinkedinLoginError):
+        client.users.me()
+    for _ in range(3):
+        with pytest.raises(CircuitOpenError):
+            client.users.me()
+
+    assert client.breaker.state(ACCOUNT_ID) is CircuitState.OPEN
+    assert len(unipile.requests) == 1
+
+    # Other accounts aren't affected
+    unipile.add("GET", "users/me", user_me_payload())
+    client.users.me(account_id="other")
+
+
+def test_cooldown_probe_closes_circuit(
+    unipile: FakeUnipile, client: Client, clock: FakeClock, disconnected: None
+):
+    client.breaker = CircuitBreaker(cooldown=60, clock=clock)
+    with pytest.raises(LinkedinLoginError):
+        client.users.me()
+
+    # Account is still reconnecting, circuit stays open for another cooldown
+    clock.now = 61
+    unipile.add("GET", f"accounts/{ACCOUNT_ID}", account_with_status("CREDENTIALS"))
+    with pytest.raises(CircuitOpenError):
+        client.users.me()
+    assert client.breaker.state(ACCOUNT_ID) is CircuitState.OPEN
+
+    clock.now = 122
+    unipile.add("GET", f"accounts/{ACCOUNT_ID}", account_with_status("OK"))
+    unipile.add("GET", "users/me", user_me_payload())
+    client.users.me()
+
+    assert client.breaker.state(ACCOUNT_ID) is CircuitState.CLOSED
+    assert [r.url.path.rsplit("/", 1)[-1] for r in unipile.requests] == [
+        "me",
+        ACCOUNT_ID,
+        ACCOUNT_ID,
+        "me",
+    ]
+
+
+def test_verified_account_half_opens_circuit(
+    unipile: FakeUnipile, async_client: AsyncClient, clock: FakeClock, disconnected: None
+):
+    async_client.breaker = CircuitBreaker(cooldown=60, clock=clock)
+    unipile.add("GET", f"accounts/{ACCOUNT_ID}", account_with_status("OK"))
+
+    async def run() -> None:
+        with pytest.raises(LinkedinLoginError):
+            await async_client.users.me()
+
+        await async_client._verify_connected_account(ACCOUNT_ID)
+        assert async_client.breaker.state(ACCOUNT_ID) is CircuitState.HALF_OPEN
+
+        # Trial call fails again, so circuit is open
+        with pytest.raises(LinkedinLoginError):
+            await async_client.users.me()
+        with pytest.raises(CircuitOpenError):
+            await async_client.users.me()
+
+    asyncio.run(run())
+    assert len(unipile.calls("users/me")) == 2
+
+
+def test_trial_failing_with_other_error_keeps_circuit_half_open(
+    unipile: FakeUnipile, client: Client, clock: FakeClock, disconnected: None
+):
+    client.breaker = CircuitBreaker(cooldown=60, clock=clock)
+    client.options.retry = None
+    with pytest.raises(LinkedinLoginError):
+        client.users.me()
+
+    clock.now = 61
+    unipile.add("GET", f"accounts/{ACCOUNT_ID}", account_with_status("OK"))
+    unipile.add("GET", "users/me", error_payload(500, "errors/provider_error"), status=500)
+    with pytest.raises(APIResponseError):
+        client.users.me()
+    assert client.breaker.state(ACCOUNT_ID) is CircuitState.HALF_OPEN
+
+    # Next call is a new trial, its login error opens the circuit again
+    unipile.add("GET", "users/me", error_payload(401, "errors/disconnected_account"), status=401)
+    with pytest.raises(LinkedinLoginError):
+        client.users.me()
+    assert client.breaker.state(ACCOUNT_ID) is CircuitState.OPEN
+
+
+def test_probe_failing_with_other_error_keeps_circuit_half_open(
+    unipile: FakeUnipile,
+    client: Client,
+    async_client: AsyncClient,
+    clock: FakeClock,
+    disconnected: None,
+):
+    def timeout(request: httpx.Request) -> httpx.Response:
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    unipile.add("GET", f"accounts/{ACCOUNT_ID}", timeout)
+    for api in (client, async_client):
+        api.breaker = CircuitBreaker(cooldown=60, clock=clock)
+        api.options.retry = None
+    with pytest.raises(LinkedinLoginError):
+        client.users.me()
+    with pytest.raises(LinkedinLoginError):
+        asyncio.run(async_client.users.me())
+
+    clock.now = 61
+    with pytest.raises(RequestTimeoutError):
+        client.users.me()
+    with pytest.raises(RequestTimeoutError):
+        asyncio.run(async_client.users.me())
+    assert client.breaker.state(ACCOUNT_ID) is CircuitState.HALF_OPEN
+    assert async_client.breaker.state(ACCOUNT_ID) is CircuitState.HALF_OPEN
+
+    # Account wasn't verified, the next call is the trial
+    unipile.add("GET", "users/me", user_me_payload())
+    client.users.me()
+    asyncio.run(async_client.users.me())
+    assert client.breaker.state(ACCOUNT_ID) is CircuitState.CLOSED
+    assert async_client.breaker.state(ACCOUNT_ID) is CircuitState.CLOSED
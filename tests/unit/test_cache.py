@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+from fakes import FakeUnipile, company_payload, user_me_payload, user_profile_payload
+
+from unipile_sdk import AsyncClient, Client
+from unipile_sdk.cache import CacheRule, MemoryCache, ResponseCache, SQLiteCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+def test_read_through_cache(unipile: FakeUnipile, client: Client, clock: FakeClock):
+    unipile.add("GET", "users/me", user_me_payload())
+    unipile.add("GET", "users/jane/", user_profile_payload("jane"))
+    client.cache = ResponseCache(
+        {"users.retrieve": CacheRule(ttl=60)}, backend=MemoryCache(clock=clock)
+    )
+
+    first = client.users.retrieve("jane")
+    assert client.users.retrieve("jane") == first
+    client.users.retrieve("jane", account_id="other")
+    client.users.me()
+    client.users.me()
+    assert len(unipile.requests) == 4
+
+    client.users.with_options(cache="bypass").retrieve("jane")
+    client.users.with_options(cache="refresh").retrieve("jane")
+    client.users.retrieve("jane")
+    assert len(unipile.calls("users/jane/")) == 4
+
+    clock.now = 61
+    client.users.retrieve("jane")
+    assert len(unipile.calls("users/jane/")) == 5
+
+    stats = client.cache.stats["users.retrieve"]
+    assert (stats.hits, stats.misses) == (2, 3)
+    assert stats.hit_rate == pytest.approx(0.4)
+
+
+def test_lru_eviction():
+    cache = MemoryCache()
+    for key in ("a", "b", "c"):
+        cache.set("users.retrieve", key, key.encode(), ttl=60, max_size=2)
+        cache.get("users.retrieve", "a")
+
+    assert cache.get("users.retrieve", "a") == b"a"
+    assert cache.get("users.retrieve", "b") is None
+    assert cache.get("users.retrieve", "c") == b"c"
+
+
+def test_sqlite_backend(unipile: FakeUnipile, async_client: AsyncClient, tmp_path, clock):
+    unipile.add("GET", "linkedin/company/1035", company_payload())
+    path = tmp_path / "cache.db"
+    rules = {"ln_search.retrieve_company": CacheRule(ttl=60, max_size=1)}
+
+    async_client.cache = ResponseCache(rules, backend=SQLiteCache(path, clock=clock))
+    company = asyncio.run(async_client.ln_search.retrieve_company("1035"))
+
+    # Another process reads the same database
+    async_client.cache = ResponseCache(rules, backend=SQLiteCache(path, clock=clock))
+    assert asyncio.run(async_client.ln_search.retrieve_company("1035")) == company
+    assert len(unipile.requests) == 1
+
+    backend = async_client.cache.backend
+    backend.set("ln_search.retrieve_company", "other", b"{}", ttl=60, max_size=1)
+    assert backend.get("ln_search.retrieve_company", "other") == b"{}"
+    assert backend.get("ln_search.retrieve_company", "linkedin/company/1035") is None
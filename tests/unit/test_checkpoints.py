@@ -0,0 +1,87 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+from fakes import FakeUnipile, paged_relations
+
+from unipile_sdk import AsyncClient, Client
+from unipile_sdk.checkpoints import (
+    Checkpoint,
+    CheckpointStore,
+    FileCheckpointStore,
+    MemoryCheckpointStore,
+    SQLiteCheckpointStore,
+)
+from unipile_sdk.helpers import async_paginate_with_checkpoints, paginate_with_checkpoints
+
+
+@pytest.fixture(params=["memory", "file", "sqlite"])
+def store(request: pytest.FixtureRequest, tmp_path: Path) -> CheckpointStore:
+    if request.param == "file":
+        return FileCheckpointStore(tmp_path / "checkpoints.json")
+    if request.param == "sqlite":
+        return SQLiteCheckpointStore(tmp_path / "checkpoints.db")
+    return MemoryCheckpointStore()
+
+
+def test_stores(store: CheckpointStore):
+    assert store.load("relations") is None
+
+    store.save("relations", Checkpoint("c-1", pages=1, items=100))
+    store.save("messages", Checkpoint(None, pages=2, items=3, done=True))
+    store.save("relations", Checkpoint("c-2", pages=2, items=200))
+    store.delete("messages")
+
+    assert store.load("relations") == Checkpoint("c-2", pages=2, items=200)
+    assert store.load("messages") is None
+
+
+def test_resume_after_failed_commit(unipile: FakeUnipile, client: Client, tmp_path: Path):
+    unipile.add("GET", "users/relations", paged_relations(pages=5, size=2))
+    path = tmp_path / "checkpoints.json"
+    committed: list[tuple[int, list[str]]] = []
+    failures = [ConnectionError("database is down")]
+
+    def commit(relations: list, checkpoint: Checkpoint) -> None:
+        if checkpoint.pages == 3 and failures:
+            raise failures.pop()
+        committed.append((checkpoint.pages, [r.public_identifier for r in relations]))
+
+    with pytest.raises(ConnectionError):
+        paginate_with_checkpoints(client.users.relations, FileCheckpointStore(path), "export", commit)
+    assert FileCheckpointStore(path).load("export") == Checkpoint("2", pages=2, items=4)
+
+    # NOTE: a new store, like after a restart
+    last = paginate_with_checkpoints(
+        client.users.relations, FileCheckpointStore(path), "export", commit
+    )
+
+    assert last == Checkpoint(None, pages=5, items=10, done=True)
+    assert [pages for pages, _ in committed] == [1, 2, 3, 4, 5]
+    assert [r for _, relations in committed for r in relations] == [
+        f"relation-{i}" for i in range(10)
+    ]
+    assert len(unipile.calls("users/relations")) == 6
+
+    paginate_with_checkpoints(client.users.relations, FileCheckpointStore(path), "export", commit)
+    assert len(unipile.calls("users/relations")) == 6
+
+
+def test_async_checkpoints_with_max_total(
+    unipile: FakeUnipile, async_client: AsyncClient, store: CheckpointStore
+):
+    unipile.add("GET", "users/relations", paged_relations(pages=5, size=2))
+    committed: list = []
+
+    async def commit(relations: list, checkpoint: Checkpoint) -> None:
+        committed.extend(relations)
+
+    last = asyncio.run(
+        async_paginate_with_checkpoints(
+            async_client.users.relations, store, "export", commit, max_total=5
+        )
+    )
+
+    assert len(committed) == 5
+    assert last == Checkpoint("3", pages=3, items=5, done=True)
+    assert store.load("export") == last
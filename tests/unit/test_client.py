@@ -0,0 +1,113 @@
+import asyncio
+
+import httpx
+import pytest
+from fakes import FakeUnipile, body_of, search_page, user_me_payload
+
+from unipile_sdk import AsyncClient, Client
+from unipile_sdk.client import ClientOptions
+from unipile_sdk.models.search import LinkedinSearchPayload
+
+
+def test_pool_survives_with_blocks(unipile: FakeUnipile, client: Client):
+    unipile.add("GET", "users/me", user_me_payload())
+    inner = client.client
+
+    for _ in range(3):
+        with client:
+            with client:
+                client.users.me()
+
+    assert client.client is inner and not inner.is_closed
+
+    client.close()
+    assert inner.is_closed
+
+
+def test_async_pool_survives_with_blocks(unipile: FakeUnipile, async_client: AsyncClient):
+    unipile.add("GET", "users/me", user_me_payload())
+    inner = async_client.client
+
+    async def run() -> None:
+        for _ in range(3):
+            async with async_client:
+                await async_client.users.me()
+
+        assert async_client.client is inner and not inner.is_closed
+        await async_client.aclose()
+
+    asyncio.run(run())
+    assert inner.is_closed
+
+
+def test_own_pool_across_repeated_with_blocks(
+    unipile: FakeUnipile, options: ClientOptions, monkeypatch: pytest.MonkeyPatch
+):
+    unipile.add("GET", "users/me", user_me_payload())
+    transport = httpx.MockTransport(unipile)
+    monkeypatch.setattr(Client, "_create_client", lambda self: httpx.Client(transport=transport))
+    client = Client(options)
+
+    for _ in range(3):
+        with client:
+            with client:
+                client.users.me()
+            client.users.me()
+            assert not client.client.is_closed
+        # NOTE: the pool created by the client is closed by the outermost block
+        assert client.client.is_closed
+    assert len(unipile.requests) == 6
+
+
+def test_own_async_pool_across_repeated_with_blocks(
+    unipile: FakeUnipile, options: ClientOptions, monkeypatch: pytest.MonkeyPatch
+):
+    unipile.add("GET", "users/me", user_me_payload())
+    transport = httpx.MockTransport(unipile.handle_async)
+    monkeypatch.setattr(
+        AsyncClient, "_create_client", lambda self: httpx.AsyncClient(transport=transport)
+    )
+    async_client = AsyncClient(options)
+
+    async def run() -> None:
+        for _ in range(3):
+            async with async_client:
+                async with async_client:
+                    await async_client.users.me()
+                assert not async_client.client.is_closed
+            assert async_client.client.is_closed
+
+    asyncio.run(run())
+    assert len(unipile.requests) == 3
+
+
+def test_pool_limits_from_options(options: ClientOptions):
+    options.max_connections = 7
+    options.max_keepalive_connections = 3
+    options.keepalive_expiry = 30.0
+
+    pool = Client(options).client._transport._pool
+
+    assert pool._max_connections == 7
+    assert pool._max_keepalive_connections == 3
+    assert pool._keepalive_expiry == 30.0
+
+
+def test_http2_from_options(options: ClientOptions):
+    assert not Client(options).client._transport._pool._http2
+
+    options.http2 = True
+    assert Client(options).client._transport._pool._http2
+    assert AsyncClient(options).client._transport._pool._http2
+
+
+def test_json_request_and_response_bodies(unipile: FakeUnipile, client: Client):
+    unipile.add("POST", "linkedin/search", search_page(2))
+
+    search = client.ln_search.search(LinkedinSearchPayload(keywords="café"))
+    request = unipile.requests[0]
+
+    assert request.headers["Content-Type"] == "application/json"
+    assert body_of(request) == {"api": "classic", "category": "people", "keywords": "café"}
+    assert [item.id for item in search.items] == ["people-0", "people-1"]
+    assert client.request("linkedin/search", "POST", body={}) == search_page(2)
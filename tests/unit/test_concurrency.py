@@ -0,0 +1,108 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+from fakes import FakeUnipile, error_payload, user_profile_payload
+
+from unipile_sdk import AsyncClient, Client
+from unipile_sdk.concurrency import AdaptiveLimiter, ConcurrencyPolicy
+from unipile_sdk.errors import APIResponseError, RequestTimeoutError
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_limit_grows_additively_and_is_cut_once_per_overload():
+    clock = FakeClock()
+    limiter = AdaptiveLimiter(ConcurrencyPolicy(initial_limit=4, max_limit=8), clock=clock)
+
+    for _ in range(5):
+        started = limiter.acquire()
+        clock.now += 0.1
+        limiter.release(started)
+    assert limiter.limit == 5
+
+    # Requests in flight together all report the same congestion
+    started = [limiter.acquire() for _ in range(5)]
+    clock.now += 0.1
+    for start in started:
+        limiter.release(start, RequestTimeoutError())
+    assert limiter.limit == 2
+
+    # Latency spike counts as overload too
+    started = limiter.acquire()
+    clock.now += 1
+    limiter.release(started)
+    assert limiter.limit == 1
+
+
+def test_in_flight_requests_are_limited(unipile: FakeUnipile, client: Client):
+    in_flight, peak = [], []
+    lock = threading.Lock()
+
+    def profile(request: httpx.Request) -> httpx.Response:
+        with lock:
+            in_flight.append(request)
+            peak.append(len(in_flight))
+        time.sleep(0.05)
+        with lock:
+            in_flight.remove(request)
+        return httpx.Response(200, json=user_profile_payload("jane"))
+
+    unipile.add("GET", "users/jane/", profile)
+    client.concurrency = AdaptiveLimiter(ConcurrencyPolicy(initial_limit=2, max_limit=2))
+    depths = []
+    threads = [
+        threading.Thread(target=client.users.retrieve, args=("jane", f"account-{i}"))
+        for i in range(6)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.02)
+    depths.append(client.concurrency.queue_depth)
+    for thread in threads:
+        thread.join()
+
+    assert max(peak) == 2
+    assert depths[0] > 0
+    assert (client.concurrency.in_flight, client.concurrency.queue_depth) == (0, 0)
+
+
+def test_too_many_requests_cuts_limit(unipile: FakeUnipile, async_client: AsyncClient):
+    unipile.add(
+        "GET", "users/jane/", error_payload(429, "errors/too_many_requests"), status=429
+    )
+    async_client.options.retry = None
+    async_client.concurrency = AdaptiveLimiter(ConcurrencyPolicy(initial_limit=8))
+
+    async def run() -> None:
+        with pytest.raises(APIResponseError):
+            await async_client.users.retrieve("jane")
+
+    asyncio.run(run())
+    assert async_client.concurrency.limit == 4
+
+
+def test_cancelled_waiter_gives_slot_back():
+    limiter = AdaptiveLimiter(ConcurrencyPolicy(initial_limit=1))
+
+    async def run() -> None:
+        started = await limiter.aacquire()
+        waiter = asyncio.ensure_future(limiter.aacquire())
+        await asyncio.sleep(0)
+        assert limiter.queue_depth == 1
+
+        waiter.cancel()
+        limiter.release(started)
+        await asyncio.sleep(0)
+        assert limiter.in_flight == 0
+        await asyncio.wait_for(limiter.aacquire(), 1)
+
+    asyncio.run(run())
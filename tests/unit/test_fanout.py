@@ -0,0 +1,108 @@
+import asyncio
+import threading
+import time
+from collections import Counter
+
+import httpx
+import pytest
+from fakes import FakeUnipile, attendees_page, error_payload, relations_page
+
+from unipile_sdk import AsyncClient, Client
+from unipile_sdk.errors import APIResponseError
+from unipile_sdk.fanout import AccountFanOut, AccountItem
+
+ACCOUNTS = [f"account-{i}" for i in range(6)]
+
+
+def per_account_pages(request: httpx.Request) -> httpx.Response:
+    # NOTE: account-N has N + 1 pages of 2 items
+    account = int(request.url.params["account_id"].removeprefix("account-"))
+    page = int(request.url.params.get("cursor", 0))
+    cursor = str(page + 1) if page < account else None
+    return httpx.Response(200, json=relations_page(page * 2, 2, cursor))
+
+
+def test_merged_stream_of_every_account(unipile: FakeUnipile, client: Client):
+    unipile.add("GET", "users/relations", per_account_pages)
+
+    items = list(AccountFanOut(max_concurrency=3).paginate(client.users.relations, ACCOUNTS))
+
+    assert all(isinstance(item, AccountItem) for item in items)
+    assert Counter(account_id for account_id, _ in items) == {
+        f"account-{i}": 2 * (i + 1) for i in range(6)
+    }
+    relations = [r.public_identifier for account_id, r in items if account_id == "account-2"]
+    assert relations == [f"relation-{i}" for i in range(6)]
+
+
+def test_concurrency_caps():
+    in_flight: Counter[str] = Counter()
+    peaks: Counter[str] = Counter()
+    lock = threading.Lock()
+
+    def relations(account_id: str, cursor: str | None = None) -> dict:
+        with lock:
+            in_flight[account_id] += 1
+            in_flight["all"] += 1
+            peaks[account_id] = max(peaks[account_id], in_flight[account_id])
+            peaks["all"] = max(peaks["all"], in_flight["all"])
+        time.sleep(0.01)
+        with lock:
+            in_flight[account_id] -= 1
+            in_flight["all"] -= 1
+        page = int(cursor or 0) + 1
+        return relations_page(0, 1, str(page) if page < 3 else None)
+
+    fan_out = AccountFanOut(max_concurrency=3)
+    relations_crawl = fan_out.paginate(relations, ACCOUNTS)
+    # NOTE: a second crawl of the same accounts shares the limits
+    attendees_crawl = fan_out.paginate(relations, ACCOUNTS[:2])
+    items = list(relations_crawl)
+    items += list(attendees_crawl)
+
+    assert len(items) == 3 * 8
+    assert peaks["all"] == 3
+    assert max(peaks[account_id] for account_id in ACCOUNTS) == 1
+
+
+def test_failed_accounts(unipile: FakeUnipile, client: Client):
+    def route(request: httpx.Request) -> httpx.Response:
+        if request.url.params["account_id"] == "account-1":
+            return httpx.Response(400, json=error_payload(400, "errors/invalid_parameters"))
+        return httpx.Response(200, json=attendees_page(0, 2, None))
+
+    unipile.add("GET", "chat_attendees", route)
+    failures = []
+
+    fan_out = AccountFanOut(on_error=lambda account_id, e: failures.append(account_id))
+    items = list(fan_out.paginate(client.messages.chat_attendees, ACCOUNTS[:3]))
+
+    assert failures == ["account-1"]
+    assert [account_id for account_id, _ in items].count("account-2") == 2
+    assert {account_id for account_id, _ in items} == {"account-0", "account-2"}
+    with pytest.raises(APIResponseError):
+        list(AccountFanOut().paginate(client.messages.chat_attendees, ACCOUNTS[:3]))
+
+
+def test_async_fan_out(unipile: FakeUnipile, async_client: AsyncClient):
+    unipile.add(
+        "GET",
+        "chat_attendees",
+        lambda request: httpx.Response(200, json=attendees_page(0, 5, "next")),
+    )
+
+    async def crawl() -> list[AccountItem]:
+        items = []
+        fan_out = AccountFanOut(max_concurrency=2, buffer=1)
+        async for item in fan_out.async_paginate(
+            async_client.messages.chat_attendees, ACCOUNTS, max_total=12
+        ):
+            items.append(item)
+        async for _ in fan_out.async_paginate(async_client.messages.chat_attendees, ACCOUNTS):
+            break
+        return items
+
+    items = asyncio.run(crawl())
+
+    assert Counter(account_id for account_id, _ in items) == {a: 12 for a in ACCOUNTS}
+    assert len(unipile.calls("chat_attendees")) < 6 * 3 + 6
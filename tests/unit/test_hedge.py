@@ -0,0 +1,120 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+from fakes import ACCOUNT_ID, FakeUnipile, company_payload, user_profile_payload
+
+from unipile_sdk import AsyncClient, Client
+from unipile_sdk.hedge import Hedger, HedgePolicy
+from unipile_sdk.ratelimit import RateLimit, RateLimiter
+
+
+@pytest.fixture
+def stalled(unipile: FakeUnipile):
+    """
+    Every other profile request stalls until released, hedges answer right away.
+    """
+    release = threading.Event()
+
+    def profile(request: httpx.Request) -> httpx.Response:
+        if len(unipile.requests) % 2:
+            release.wait(5)
+        return httpx.Response(200, json=user_profile_payload("jane"))
+
+    unipile.add("GET", "users/jane/", profile)
+    yield release
+    release.set()
+
+
+def test_slow_request_is_hedged(unipile: FakeUnipile, client: Client, stalled: threading.Event):
+    client.hedger = Hedger(HedgePolicy(delay=0.05, endpoints={"users.retrieve"}))
+
+    assert client.users.retrieve("jane").public_identifier == "jane"
+    assert len(unipile.requests) == 2
+    assert (client.hedger.hedged, client.hedger.wins) == (1, 1)
+    client.close()
+
+
+def test_hedges_are_capped_per_account(
+    unipile: FakeUnipile, client: Client, stalled: threading.Event
+):
+    client.hedger = Hedger(HedgePolicy(delay=0.05, budget=0, burst=1))
+
+    client.users.retrieve("jane")
+    assert len(unipile.requests) == 2
+
+    # Account hedging budget is spent, stalled request waits for its own response
+    threading.Timer(0.2, stalled.set).start()
+    client.users.retrieve("jane")
+    assert len(unipile.requests) == 3
+    assert client.hedger.hedged == 1
+    client.close()
+
+
+def test_hedges_spend_action_budget(
+    unipile: FakeUnipile, client: Client, stalled: threading.Event
+):
+    client.hedger = Hedger(HedgePolicy(delay=0.05))
+    client.rate_limiter = RateLimiter({"profile_view": RateLimit(capacity=1, period=3600)})
+
+    threading.Timer(0.2, stalled.set).start()
+    client.users.retrieve("jane")
+    assert len(unipile.requests) == 1
+    client.close()
+
+
+def test_delay_starts_when_request_is_sent(unipile: FakeUnipile, client: Client):
+    def profile(request: httpx.Request) -> httpx.Response:
+        time.sleep(0.2)
+        return httpx.Response(200, json=user_profile_payload("jane"))
+
+    unipile.add("GET", "users/jane/", profile)
+    client.singleflight = None
+    client.hedger = Hedger(HedgePolicy(delay=0.3))
+
+    # More concurrent callers than CPUs, none of them waits for a hedging worker
+    with ThreadPoolExecutor(40) as pool:
+        list(pool.map(lambda _: client.users.retrieve("jane"), range(40)))
+    assert len(unipile.requests) == 40
+    assert client.hedger.hedged == 0
+    client.close()
+
+
+def test_hedge_waits_for_observed_percentile():
+    hedger = Hedger(HedgePolicy(percentile=0.9, min_samples=10))
+    for latency in range(1, 10):
+        hedger.record("users.retrieve", latency / 10)
+    assert hedger.delay("users.retrieve", ACCOUNT_ID) is None
+
+    hedger.record("users.retrieve", 1.0)
+    assert hedger.delay("users.retrieve", ACCOUNT_ID) == pytest.approx(0.9)
+
+
+def test_losing_task_is_cancelled(unipile: FakeUnipile, async_client: AsyncClient):
+    received, cancelled = [], []
+    unipile.add("GET", "linkedin/company/1035", company_payload())
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        received.append(request)
+        if len(received) == 1:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(request)
+                raise
+        return unipile(request)
+
+    async_client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    async_client.hedger = Hedger(HedgePolicy(delay=0.05))
+
+    async def run() -> None:
+        company = await async_client.ln_search.retrieve_company("1035")
+        assert company.id == "1035"
+        await asyncio.sleep(0)
+
+    asyncio.run(run())
+    assert len(cancelled) == 1
+    assert (async_client.hedger.hedged, async_client.hedger.wins) == (1, 1)
@@ -0,0 +1,51 @@
+import sys
+
+from fakes import FakeUnipile, messages_page, search_page
+
+from unipile_sdk import Client
+from unipile_sdk.api_endpoints import stream_items
+from unipile_sdk.helpers import collect_paginated_api
+from unipile_sdk.interning import StringInterner
+from unipile_sdk.models import LazySearchResponse, Message, Position, SearchResponse
+
+
+def test_messages_share_interned_strings(unipile: FakeUnipile, client: Client):
+    unipile.add("GET", "chats/chat-1/messages", messages_page(0, 3, None))
+    client.options.interning = interner = StringInterner()
+    # NOTE: pydantic's JSON parser already shares short strings, json.loads doesn't
+    client.options.validation = "dict"
+
+    messages = client.messages.messages("chat-1")["items"]
+
+    assert messages[0]["sender_id"] is messages[1]["sender_id"] is messages[2]["sender_id"]
+    assert messages[0]["chat_id"] is messages[2]["chat_id"]
+    assert messages[0]["text"] is not messages[1]["text"]
+    assert interner.interned >= 2 * 5  # NOTE: first message holds the shared strings
+    assert interner.saved_bytes > 0
+
+
+def test_nested_positions_of_models_and_dicts():
+    interner = StringInterner()
+
+    for model in (SearchResponse, LazySearchResponse):
+        items = interner.apply(model, model(**search_page(2))).items
+        assert items[0].current_positions[0].company is items[1].current_positions[0].company
+        assert items[0].location is items[1].location
+
+    page = interner.apply(SearchResponse, search_page(2))
+    first, second = page["items"]
+    assert first["current_positions"][0]["company"] is second["current_positions"][0]["company"]
+    assert first["network_distance"] is second["network_distance"]
+
+
+def test_configured_fields(unipile: FakeUnipile, client: Client):
+    unipile.add("GET", "chats/chat-1/messages", messages_page(0, 2, None))
+    client.options.interning = StringInterner({Message: {"text"}, Position: {"company"}})
+    client.options.validation = "dict"
+
+    messages = collect_paginated_api(
+        stream_items(client.messages.messages), chat_id="chat-1"
+    )
+
+    assert messages[0]["sender_id"] is not messages[1]["sender_id"]
+    assert messages[0]["text"] is sys.intern("Hello 0")
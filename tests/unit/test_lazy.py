@@ -0,0 +1,77 @@
+import json
+import pickle
+
+import pytest
+from fakes import FakeUnipile, messages_page, people_payload, search_page
+from pydantic import ValidationError
+
+from unipile_sdk import Client
+from unipile_sdk.models import (
+    ChatsMessagesResponse,
+    LazyPeopleSearchResult,
+    LazySearchResponse,
+    PeopleSearchResult,
+    Position,
+    SearchResponse,
+)
+from unipile_sdk.models.lazy import Deferred
+from unipile_sdk.models.search import LinkedinSearchPayload
+from unipile_sdk.validation import construct
+
+
+def test_nested_fields_are_validated_on_access():
+    search = LazySearchResponse.model_validate_json(json.dumps(search_page(2)))
+    person = search.items[0]
+
+    assert isinstance(person, PeopleSearchResult)
+    assert isinstance(person.__dict__["current_positions"], Deferred)
+    assert isinstance(person.current_positions[0], Position)
+    assert person.__dict__["current_positions"] is person.current_positions
+    assert (
+        LazyPeopleSearchResult.model_fields["current_positions"].annotation
+        == PeopleSearchResult.model_fields["current_positions"].annotation
+    )
+
+
+def test_lazy_models_match_eager_models():
+    payload = search_page(3)
+    lazy, eager = LazySearchResponse(**payload), SearchResponse(**payload)
+
+    assert lazy.model_dump() == eager.model_dump()
+    assert lazy.model_dump_json() == eager.model_dump_json()
+    assert repr(lazy.items[0]).removeprefix("Lazy") == repr(eager.items[0])
+    assert pickle.loads(pickle.dumps(lazy)) == lazy
+    assert lazy.items[1].current_positions == eager.items[1].current_positions
+
+
+def test_invalid_nested_data_fails_on_access():
+    payload = people_payload(0)
+    payload["current_positions"] = [{"company": 1}]
+
+    with pytest.raises(ValidationError):
+        PeopleSearchResult(**payload)
+    person = LazyPeopleSearchResult(**payload)
+    assert person.id == "people-0"
+    with pytest.raises(ValidationError):
+        _ = person.current_positions
+
+
+def test_constructed_lazy_models():
+    search = construct(LazySearchResponse, search_page(1))
+
+    assert isinstance(search.items[0].__dict__["current_positions"], Deferred)
+    assert search == LazySearchResponse(**search_page(1))
+    assert isinstance(search.items[0].current_positions[0], Position)
+
+
+def test_lazy_option(unipile: FakeUnipile, client: Client):
+    unipile.add("POST", "linkedin/search", search_page(2))
+    unipile.add("GET", "chats/chat-1/messages", messages_page(0, 2, None))
+
+    search = client.ln_search.with_options(lazy=True).search(LinkedinSearchPayload(keywords="x"))
+    assert isinstance(search, LazySearchResponse)
+    assert isinstance(client.messages.messages("chat-1"), ChatsMessagesResponse)
+
+    client.options.lazy = True
+    # NOTE: messages have no lazy variant
+    assert type(client.messages.messages("chat-1")) is ChatsMessagesResponse
@@ -0,0 +1,22 @@
+import subprocess
+import sys
+
+import unipile_sdk.models as models
+
+
+def test_import_doesnt_load_model_modules():
+    code = (
+        "import sys, unipile_sdk;"
+        "print(sorted(name for name in sys.modules if name.startswith('unipile_sdk.models.')))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+
+    assert result.stdout.split() == ["['unipile_sdk.models.error',", "'unipile_sdk.models.lazy']"]
+
+
+def test_public_names_resolve():
+    from unipile_sdk.models.search import SearchResponse
+
+    assert models.SearchResponse is SearchResponse
+    assert all(getattr(models, name) is not None for name in models.__all__)
+    assert set(models.__all__) <= set(dir(models))
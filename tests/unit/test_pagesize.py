@@ -0,0 +1,87 @@
+import httpx
+import pytest
+from fakes import FakeUnipile, error_payload, paged_relations, query_of, search_page
+
+from unipile_sdk import Client
+from unipile_sdk.client import ClientOptions
+from unipile_sdk.errors import APIResponseError, RequestTimeoutError
+from unipile_sdk.helpers import collect_paginated_api
+from unipile_sdk.models import TooManyRequestsErrorType
+from unipile_sdk.models.search import LinkedinSearchPayload
+from unipile_sdk.pagesize import PageSizePolicy, PageSizeTuner
+
+
+def test_pages_fit_latency_and_payload_targets():
+    tuner = PageSizeTuner(PageSizePolicy(target_latency=1.0, max_payload=100_000))
+    key = ("users.relations", "account-1")
+    assert tuner.limit(*key, default=100) == 100
+
+    # 20 ms per item: pages of 50 items take a second
+    for _ in range(30):
+        limit = tuner.limit(*key, default=100)
+        tuner.record(*key, limit, latency=0.02 * limit, payload=100 * limit)
+    assert tuner.limits[key] == 50
+
+    # 1 KB per item: pages of 100 KB hold 100 items, up to the 250 items bound
+    for _ in range(30):
+        limit = tuner.limit(*key, default=100)
+        tuner.record(*key, limit, latency=0.001, payload=1_000 * limit)
+    assert tuner.limits[key] == 100
+    for _ in range(30):
+        limit = tuner.limit(*key, default=100)
+        tuner.record(*key, limit, latency=0.001, payload=10 * limit)
+    assert tuner.limits[key] == 250
+    assert tuner.stats[key].pages == 90
+
+
+def test_errors_shrink_pages():
+    tuner = PageSizeTuner(PageSizePolicy(min_limit=20))
+    key = ("messages.messages", "")
+    tuner.limit(*key, default=100)
+
+    tuner.record(*key, 100, 60.0, None, RequestTimeoutError())
+    assert tuner.limits[key] == 50
+    body = error_payload(429, "errors/too_many_requests")
+    overload = APIResponseError(httpx.Response(429, json=body), TooManyRequestsErrorType, body)
+    tuner.record(*key, 50, 0.1, None, overload)
+    tuner.record(*key, 25, 0.1, None, overload)
+    assert tuner.limits[key] == 20
+
+    # NOTE: pages don't grow until the error rate decays
+    tuner.record(*key, 20, 0.001, 1_000)
+    assert tuner.limits[key] == 20
+    assert tuner.stats[key].error_rate > 0.1
+
+
+def test_paginated_endpoints_use_tuned_limits(
+    unipile: FakeUnipile, client: Client, options: ClientOptions
+):
+    unipile.add("GET", "users/relations", paged_relations(pages=5, size=2))
+    unipile.add("POST", "linkedin/search", search_page(2))
+
+    collect_paginated_api(client.users.relations, max_total=1000)
+    assert [query_of(r)["limit"] for r in unipile.calls("users/relations")] == ["100"] * 5
+
+    client.page_size = PageSizeTuner(PageSizePolicy(max_limit=300))
+    collect_paginated_api(client.users.relations, max_total=1000)
+    collect_paginated_api(client.users.relations, max_total=1000, limit=7)
+    client.ln_search.search(LinkedinSearchPayload(keywords="engineer"))
+
+    limits = [query_of(r)["limit"] for r in unipile.calls("users/relations")[5:]]
+    assert limits == ["100", "150", "225", "300", "300"] + ["7"] * 5
+    assert client.page_size.limits == {
+        ("users.relations", options.default_account_id): 300,
+        ("ln_search.search", options.default_account_id): 15,
+    }
+    assert query_of(unipile.calls("linkedin/search")[0])["limit"] == "10"
+
+
+@pytest.mark.parametrize("tuned", [False, True])
+def test_duplicate_amount_page_size(unipile: FakeUnipile, client: Client, tuned: bool):
+    unipile.add("GET", "accounts", {"object": "AccountList", "items": [], "cursor": None})
+    if tuned:
+        client.page_size = PageSizeTuner()
+
+    client.accounts.duplicate_amount()
+
+    assert query_of(unipile.calls("accounts")[0])["limit"] == ("100" if tuned else "250")
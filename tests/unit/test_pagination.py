@@ -0,0 +1,168 @@
+import asyncio
+import threading
+
+import httpx
+import pytest
+from fakes import (
+    FakeUnipile,
+    account_payload,
+    attendees_page,
+    messages_page,
+    paged,
+    paged_relations,
+    relation_payload,
+    relations_page,
+    search_page,
+)
+
+from unipile_sdk import AsyncClient, Client
+from unipile_sdk.api_endpoints import stream_items
+from unipile_sdk.helpers import (
+    async_collect_paginated_api,
+    async_iterate_paginated_api,
+    collect_paginated_api,
+    iterate_paginated_api,
+)
+from unipile_sdk.models import UserRelation
+from unipile_sdk.models.search import LinkedinSearchPayload
+
+
+def test_prefetch_matches_sequential_pages(unipile: FakeUnipile, client: Client):
+    unipile.add("GET", "users/relations", paged_relations(pages=5, size=3))
+
+    sequential = collect_paginated_api(client.users.relations, max_total=1000)
+    streamed = stream_items(client.users.relations)
+    for function in (client.users.relations, streamed):
+        assert collect_paginated_api(function, max_total=1000, prefetch=2) == sequential
+    assert len(sequential) == 15
+    assert len(unipile.calls("users/relations")) == 15
+
+
+def test_prefetch_depth_is_bounded():
+    fetched: list[str | None] = []
+    requested = threading.Condition()
+
+    def relations(cursor: str | None = None) -> dict:
+        page = int(cursor or 0)
+        with requested:
+            fetched.append(cursor)
+            requested.notify_all()
+        return relations_page(page, 1, str(page + 1))
+
+    results = iterate_paginated_api(relations, max_total=1000, prefetch=2)
+    next(results)
+    with requested:
+        assert requested.wait_for(lambda: len(fetched) == 3, timeout=5)
+        assert not requested.wait_for(lambda: len(fetched) > 3, timeout=0.1)
+
+    next(results)
+    with requested:
+        assert requested.wait_for(lambda: len(fetched) == 4, timeout=5)
+    results.close()
+
+
+def test_prefetch_stops_at_max_total(unipile: FakeUnipile, client: Client):
+    unipile.add("GET", "users/relations", paged_relations(pages=10, size=3))
+
+    relations = collect_paginated_api(client.users.relations, max_total=6, prefetch=4)
+
+    assert len(relations) == 6
+    assert len(unipile.calls("users/relations")) == 2
+
+
+def test_prefetch_errors_are_raised(unipile: FakeUnipile, client: Client):
+    pages = paged_relations(pages=3, size=2)
+
+    def first_page_only(request: httpx.Request) -> httpx.Response:
+        if "cursor" in request.url.params:
+            raise ZeroDivisionError
+        return pages(request)
+
+    unipile.add("GET", "users/relations", first_page_only)
+
+    relations = iterate_paginated_api(client.users.relations, max_total=1000, prefetch=1)
+    assert len([next(relations), next(relations)]) == 2
+    with pytest.raises(ZeroDivisionError):
+        next(relations)
+
+
+def test_async_prefetch(unipile: FakeUnipile, async_client: AsyncClient):
+    unipile.add("GET", "users/relations", paged_relations(pages=6, size=2))
+
+    async def paginate() -> tuple[list, list]:
+        everything = await async_collect_paginated_api(
+            async_client.users.relations, max_total=1000, prefetch=3
+        )
+        first = []
+        async for relation in async_iterate_paginated_api(
+            async_client.users.relations, max_total=1000, prefetch=3
+        ):
+            first.append(relation)
+            if len(first) == 3:
+                break
+        await asyncio.sleep(0)
+        return everything, first
+
+    everything, first = asyncio.run(paginate())
+
+    assert len(everything) == 12
+    assert first == everything[:3]
+    assert len(unipile.calls("users/relations")) <= 6 + 4
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_async_paginate_every_endpoint(
+    unipile: FakeUnipile, async_client: AsyncClient, prefetch: int
+):
+    unipile.add("GET", "users/relations", paged(relations_page, pages=4, size=3))
+    unipile.add("GET", "chat_attendees", paged(attendees_page, pages=4, size=3))
+    unipile.add("GET", "chats/chat-1/messages", paged(messages_page, pages=4, size=3))
+    accounts = lambda start, count, cursor: {  # noqa: E731
+        "object": "AccountList",
+        "items": [account_payload(start + i, im_id=f"im-{i}") for i in range(count)],
+        "cursor": cursor,
+    }
+    unipile.add("GET", "accounts", paged(accounts, pages=4, size=3))
+    search = lambda start, count, cursor: search_page(count, cursor)  # noqa: E731
+    unipile.add("POST", "linkedin/search", paged(search, pages=4, size=3))
+
+    crawls = {
+        "relations": (async_client.users.relations, {}),
+        "chat_attendees": (async_client.messages.chat_attendees, {}),
+        "messages": (async_client.messages.messages, {"chat_id": "chat-1"}),
+        "accounts": (async_client.accounts.accounts, {}),
+        "search": (async_client.ln_search.search, {"payload": LinkedinSearchPayload()}),
+    }
+
+    async def crawl_all() -> list[list]:
+        # NOTE: crawls are interleaved on one event loop
+        return await asyncio.gather(
+            *(
+                async_collect_paginated_api(function, max_total=7, prefetch=prefetch, **kwargs)
+                for function, kwargs in crawls.values()
+            )
+        )
+
+    results = asyncio.run(crawl_all())
+
+    assert [len(items) for items in results] == [7] * 5
+    assert results[0] == [UserRelation(**relation_payload(i)) for i in range(7)]
+    assert {len(unipile.calls(path)) for path in ("accounts", "chat_attendees")} == {3}
+
+
+def test_streamed_pages_are_closed_on_early_exit(unipile: FakeUnipile, client: Client):
+    unipile.add("GET", "users/relations", paged_relations(pages=3, size=5))
+    streams = []
+    relations = stream_items(client.users.relations)
+
+    def function(**kwargs):
+        streams.append(relations(**kwargs))
+        return streams[-1]
+
+    assert len(collect_paginated_api(function, max_total=7)) == 7
+    relations_iterator = iterate_paginated_api(function, max_total=100)
+    next(relations_iterator)
+    relations_iterator.close()
+
+    assert len(streams) == 3
+    assert all(stream.response.is_closed for stream in streams)
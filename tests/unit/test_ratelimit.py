@@ -0,0 +1,89 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from fakes import FakeUnipile, error_payload, user_profile_payload
+
+from unipile_sdk import AsyncClient, Client
+from unipile_sdk.errors import RateLimitExceededError
+from unipile_sdk.ratelimit import RateLimit, RateLimiter
+from unipile_sdk.retry import RetryPolicy
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_bucket_refills_over_period():
+    clock = FakeClock()
+    limiter = RateLimiter({"invite": RateLimit(capacity=2, period=10)}, block=False, clock=clock)
+
+    limiter.acquire("a", "invite")
+    limiter.acquire("a", "invite")
+    with pytest.raises(RateLimitExceededError) as error:
+        limiter.acquire("a", "invite")
+    assert error.value.retry_after == pytest.approx(5)
+
+    # Other accounts and actions have their own budget
+    limiter.acquire("b", "invite")
+    limiter.acquire("a", "search")
+
+    clock.now = 5
+    limiter.acquire("a", "invite")
+
+
+def test_blocking_limiter_is_thread_safe():
+    limiter = RateLimiter({"search": RateLimit(capacity=5, period=0.25)})
+    calls = []
+
+    def worker() -> None:
+        limiter.acquire("a", "search")
+        calls.append(time.monotonic())
+
+    started = time.monotonic()
+    threads = [threading.Thread(target=worker) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 5 in the first burst, 5 more need the whole bucket refilled
+    assert len(calls) == 10
+    assert max(calls) - started >= 0.2
+
+
+def test_request_path_is_limited(unipile: FakeUnipile, client: Client, async_client: AsyncClient):
+    unipile.add("GET", "users/jane/", user_profile_payload("jane"))
+    for c in (client, async_client):
+        c.rate_limiter = RateLimiter({"profile_view": RateLimit(1, 60)}, block=False)
+
+    client.users.retrieve("jane")
+    with pytest.raises(RateLimitExceededError):
+        client.users.retrieve("jane")
+    client.users.retrieve("jane", account_id="other")
+
+    asyncio.run(async_client.users.retrieve("jane"))
+    with pytest.raises(RateLimitExceededError):
+        asyncio.run(async_client.users.retrieve("jane"))
+
+    assert len(unipile.requests) == 3
+
+
+def test_each_attempt_is_limited(unipile: FakeUnipile, client: Client, async_client: AsyncClient):
+    unipile.add("GET", "users/jane/", error_payload(503, "errors/network_down"), status=503)
+    for c in (client, async_client):
+        c.rate_limiter = RateLimiter({"profile_view": RateLimit(2, 60)}, block=False)
+        c.options.retry = RetryPolicy(backoff=0)
+
+    # NOTE: the first retry spends the last token, the second one fails locally
+    with pytest.raises(RateLimitExceededError):
+        client.users.retrieve("jane")
+    with pytest.raises(RateLimitExceededError):
+        asyncio.run(async_client.users.retrieve("jane"))
+
+    assert len(unipile.requests) == 4
@@ -0,0 +1,76 @@
+import asyncio
+import json
+from unittest import mock
+
+import httpx
+import pytest
+from fakes import FakeUnipile, error_payload, relations_page, user_me_payload
+
+from unipile_sdk import AsyncClient, Client
+from unipile_sdk.api_endpoints import raw_response
+from unipile_sdk.cache import CacheRule, MemoryCache, ResponseCache
+from unipile_sdk.errors import APIResponseError
+from unipile_sdk.raw import RawResponse
+
+
+def test_request_raw(unipile: FakeUnipile, client: Client):
+    body = json.dumps(user_me_payload()).encode()
+    unipile.add(
+        "GET",
+        "users/me",
+        lambda r: httpx.Response(200, content=body, headers={"x-request-id": "req-1"}),
+    )
+
+    with mock.patch("unipile_sdk.client.loads") as loads:
+        response = client.request_raw("users/me", "GET")
+        endpoint_response = raw_response(client.users.me)()
+
+    loads.assert_not_called()
+    for raw in (response, endpoint_response):
+        assert isinstance(raw, RawResponse)
+        assert raw.status == 200
+        assert raw.headers["x-request-id"] == "req-1"
+        assert raw.content == body
+
+
+def test_raw_errors_are_classified(unipile: FakeUnipile, client: Client, async_client: AsyncClient):
+    unipile.add("GET", "users/me", error_payload(400, "errors/invalid_parameters"), status=400)
+
+    with pytest.raises(APIResponseError):
+        client.request_raw("users/me", "GET")
+    with pytest.raises(APIResponseError):
+        asyncio.run(raw_response(async_client.users.me, stream=True)())
+
+
+def test_stream_raw(unipile: FakeUnipile, client: Client, async_client: AsyncClient):
+    body = json.dumps(relations_page(0, 20, None)).encode()
+    unipile.add(
+        "GET",
+        "users/relations",
+        lambda r: httpx.Response(200, content=(body[i : i + 64] for i in range(0, len(body), 64))),
+    )
+
+    with raw_response(client.users.relations, stream=True)() as response:
+        assert response.status == 200
+        assert b"".join(response.iter_bytes()) == body
+
+    unipile.add("GET", "users/relations", lambda r: httpx.Response(200, content=body))
+
+    async def read() -> bytes:
+        async with await async_client.request_raw("users/relations", "GET", stream=True) as raw:
+            return b"".join([chunk async for chunk in raw.aiter_bytes()])
+
+    assert asyncio.run(read()) == body
+
+
+def test_raw_cached_response(unipile: FakeUnipile, client: Client):
+    unipile.add("GET", "users/me", user_me_payload())
+    client.cache = ResponseCache({"users.me": CacheRule(ttl=60)}, backend=MemoryCache())
+
+    first = raw_response(client.users.me)()
+    cached = raw_response(client.users.me)()
+
+    assert len(unipile.requests) == 1
+    assert cached.content == first.content
+    assert cached.status == 200
+    assert client.users.me().first_name == "Jane"
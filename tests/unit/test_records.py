@@ -0,0 +1,56 @@
+import pickle
+
+import httpx
+import pytest
+from fakes import FakeUnipile, people_payload, relation_payload, relations_page, search_page
+
+from unipile_sdk import Client
+from unipile_sdk.api_endpoints import compact_records, stream_items
+from unipile_sdk.helpers import collect_paginated_api
+from unipile_sdk.models import PeopleSearchResult, UserRelation
+from unipile_sdk.models.search import LinkedinSearchPayload
+from unipile_sdk.records import PeopleSearchResultRecord, UserRelationRecord, record_type
+
+
+def test_record_round_trip():
+    result = PeopleSearchResult(**people_payload(0))
+    record = PeopleSearchResultRecord.from_dict(people_payload(0))
+
+    assert not hasattr(record, "__dict__")
+    assert record.current_positions[0].tenure_at_role.years == 1
+    assert record.to_model() == result
+    assert record.to_model(validate=False) == result
+    assert PeopleSearchResultRecord.from_model(result) == record
+    assert pickle.loads(pickle.dumps(record)) == record
+    assert record_type(UserRelation) is UserRelationRecord
+
+
+def test_paginate_compact_items(unipile: FakeUnipile, client: Client):
+    def route(request):
+        if request.url.params.get("cursor") == "page-2":
+            return relations_page(2, 2, None)
+        return relations_page(0, 2, "page-2")
+
+    unipile.add("GET", "users/relations", lambda r: httpx.Response(200, json=route(r)))
+
+    relations = collect_paginated_api(compact_records(client.users.relations))
+
+    assert relations == [UserRelationRecord.from_dict(relation_payload(i)) for i in range(4)]
+    streamed = stream_items(compact_records(client.users.relations))()
+    assert list(streamed) == relations[:2]
+
+
+def test_compact_search_is_filtered(unipile: FakeUnipile, client: Client):
+    page = search_page(2)
+    page["items"].append(people_payload(2, network_distance="OUT_OF_NETWORK"))
+    unipile.add("POST", "linkedin/search", page)
+
+    search = compact_records(client.ln_search.search)(LinkedinSearchPayload(keywords="x"))
+
+    assert [record.id for record in search["items"]] == ["people-0", "people-1"]
+    assert all(isinstance(r, PeopleSearchResultRecord) for r in search["items"])
+
+
+def test_compact_needs_list_endpoint(client: Client):
+    with pytest.raises(ValueError):
+        compact_records(client.users.me)()  # pyright: ignore[reportCallIssue, reportArgumentType]
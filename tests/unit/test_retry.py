@@ -0,0 +1,80 @@
+import asyncio
+
+import httpx
+import pytest
+from fakes import FakeUnipile, error_payload, user_me_payload
+
+from unipile_sdk import AsyncClient, Client
+from unipile_sdk.errors import APIResponseError, HTTPResponseError
+from unipile_sdk.models import ServiceUnavailableErrorType
+from unipile_sdk.retry import RetryPolicy
+
+
+def flaky(responses: list[httpx.Response]):
+    def route(request: httpx.Request) -> httpx.Response:
+        return responses.pop(0) if len(responses) > 1 else responses[0]
+
+    return route
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(client: Client, async_client: AsyncClient) -> None:
+    for c in (client, async_client):
+        c.options.retry = RetryPolicy(backoff=0)
+
+
+def test_transient_errors_are_retried(unipile: FakeUnipile, client: Client):
+    unipile.add(
+        "GET",
+        "users/me",
+        flaky(
+            [
+                httpx.Response(503, json=error_payload(503, "errors/network_down")),
+                httpx.Response(502, text="Bad Gateway"),
+                httpx.Response(200, json=user_me_payload()),
+            ]
+        ),
+    )
+
+    assert client.users.me().first_name == "Jane"
+    assert len(unipile.requests) == 3
+
+
+def test_attempts_reported_on_final_error(unipile: FakeUnipile, async_client: AsyncClient):
+    unipile.add("GET", "users/me", error_payload(503, "errors/no_client_session"), status=503)
+
+    with pytest.raises(APIResponseError) as error:
+        asyncio.run(async_client.users.me())
+
+    assert error.value.error == ServiceUnavailableErrorType.ERRORS_NO_CLIENT_SESSION
+    assert error.value.attempts == 3
+    assert len(unipile.requests) == 3
+
+
+def test_non_idempotent_and_permanent_errors_are_not_retried(
+    unipile: FakeUnipile, client: Client
+):
+    unipile.add("POST", "users/invite", error_payload(429, "errors/too_many_requests"), status=429)
+    unipile.add("GET", "users/me", error_payload(400, "errors/invalid_parameters"), status=400)
+
+    with pytest.raises(APIResponseError) as invite_error:
+        client.users.invite("provider-id")
+    with pytest.raises(APIResponseError) as me_error:
+        client.users.me()
+
+    assert invite_error.value.attempts == me_error.value.attempts == 1
+    assert len(unipile.requests) == 2
+
+
+def test_retry_after_is_honored():
+    policy = RetryPolicy(max_retry_after=10)
+    response = httpx.Response(
+        429,
+        headers={"Retry-After": "7"},
+        request=httpx.Request("GET", "https://api.unipile.test"),
+    )
+    error = HTTPResponseError(response)
+
+    assert policy.delay(1, error) == 7
+    response.headers["Retry-After"] = "3600"
+    assert policy.delay(1, error) is None
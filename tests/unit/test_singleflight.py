@@ -0,0 +1,53 @@
+import asyncio
+import threading
+import time
+
+import httpx
+from fakes import FakeUnipile, company_payload, user_profile_payload
+
+from unipile_sdk import AsyncClient, Client
+
+
+def test_concurrent_threads_share_one_call(unipile: FakeUnipile, client: Client):
+    release = threading.Event()
+
+    def slow_profile(request: httpx.Request) -> httpx.Response:
+        release.wait(5)
+        return httpx.Response(200, json=user_profile_payload("jane"))
+
+    unipile.add("GET", "users/jane/", slow_profile)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(client.users.retrieve("jane")))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+
+    deadline = time.monotonic() + 5
+    while client.singleflight.hits < 4 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(unipile.requests) == 1
+    assert len(results) == 5 and all(r == results[0] for r in results)
+    assert (client.singleflight.hits, client.singleflight.misses) == (4, 1)
+
+
+def test_concurrent_tasks_share_one_call(unipile: FakeUnipile, async_client: AsyncClient):
+    unipile.add("GET", "linkedin/company/1035", company_payload())
+
+    async def run() -> None:
+        await asyncio.gather(
+            *(async_client.ln_search.retrieve_company("1035") for _ in range(5)),
+            async_client.ln_search.retrieve_company("1035", account_id="other"),
+        )
+        # Sequential calls don't overlap
+        await async_client.ln_search.retrieve_company("1035")
+
+    asyncio.run(run())
+
+    assert len(unipile.requests) == 3
+    assert (async_client.singleflight.hits, async_client.singleflight.misses) == (4, 3)
@@ -0,0 +1,132 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+from fakes import FakeUnipile, message_payload, messages_page, relation_payload, relations_page
+
+from unipile_sdk import AsyncClient, Client
+from unipile_sdk.api_endpoints import stream_items
+from unipile_sdk.helpers import async_collect_paginated_api, collect_paginated_api
+from unipile_sdk.models import Message, UserRelation
+from unipile_sdk.streaming import ItemsParser
+
+
+def chunked(payload: dict, size: int) -> httpx.Response:
+    body = json.dumps(payload, ensure_ascii=False, indent=1).encode()
+    return httpx.Response(200, content=(body[i : i + size] for i in range(0, len(body), size)))
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 64, 100_000])
+def test_parser_across_chunk_boundaries(size: int):
+    payload = {
+        "object": "UserRelationsList",
+        "items": [{"name": "Zoë Łukasz 北京", "n": 12345.5e3, "ok": True, "x": None}, [1, {}], 7],
+        "cursor": "c-1",
+        "total": 1000,
+    }
+    body = json.dumps(payload, ensure_ascii=False).encode()
+    parser = ItemsParser()
+
+    items = []
+    for i in range(0, len(body), size):
+        items += parser.feed(body[i : i + size])
+    items += parser.close()
+
+    assert items == payload["items"]
+    assert parser.fields == {"object": "UserRelationsList", "cursor": "c-1", "total": 1000}
+
+
+def test_parser_numbers_split_at_every_position():
+    payload = {"items": [1.5, -2500.0, 3e-5, -1E+10, 0, True, None], "total": 1.25}
+    body = json.dumps(payload, separators=(",", ":")).encode()
+
+    for size in range(1, len(body) + 1):
+        parser = ItemsParser()
+        items = []
+        for i in range(0, len(body), size):
+            items += parser.feed(body[i : i + size])
+        items += parser.close()
+        assert items == payload["items"], size
+        assert parser.fields == {"total": 1.25}, size
+
+    for cut in range(1, len(body)):
+        parser = ItemsParser()
+        items = parser.feed(body[:cut]) + parser.feed(body[cut:]) + parser.close()
+        assert items == payload["items"], cut
+
+
+def test_parser_rejects_truncated_body():
+    parser = ItemsParser()
+    assert parser.feed(b'{"items": [{"a": 1}, {"a"') == [{"a": 1}]
+    with pytest.raises(json.JSONDecodeError):
+        parser.close()
+
+
+def test_stream_relations(unipile: FakeUnipile, client: Client):
+    unipile.add("GET", "users/relations", lambda r: chunked(relations_page(0, 5, "next"), 16))
+
+    with stream_items(client.users.relations)() as relations:
+        with pytest.raises(RuntimeError):
+            _ = relations.cursor
+        items = list(relations)
+
+    assert items == [UserRelation(**relation_payload(i)) for i in range(5)]
+    assert relations.cursor == "next"
+    assert relations.count == 5
+
+
+def test_stream_validation_modes(unipile: FakeUnipile, client: Client):
+    unipile.add("GET", "chats/chat-1/messages", lambda r: chunked(messages_page(0, 2, None), 50))
+
+    messages = stream_items(client.messages.messages)
+    assert list(messages("chat-1")) == [Message(**message_payload(i)) for i in range(2)]
+    messages = stream_items(client.messages.with_options(validation="dict").messages)
+    assert list(messages("chat-1")) == [message_payload(i) for i in range(2)]
+
+
+def test_closing_stream_closes_response(unipile: FakeUnipile, client: Client):
+    unipile.add("GET", "users/relations", lambda r: chunked(relations_page(0, 50, None), 64))
+
+    with stream_items(client.users.relations)() as relations:
+        for _ in relations:
+            break
+
+    assert relations.response.is_closed
+    assert relations.count == 1
+
+
+def test_paginate_streamed_pages(unipile: FakeUnipile, client: Client):
+    def route(request: httpx.Request) -> httpx.Response:
+        if request.url.params.get("cursor") == "page-2":
+            return chunked(relations_page(3, 3, None), 32)
+        return chunked(relations_page(0, 3, "page-2"), 32)
+
+    unipile.add("GET", "users/relations", route)
+
+    relations = collect_paginated_api(stream_items(client.users.relations))
+
+    assert [r.member_id for r in relations] == [relation_payload(i)["member_id"] for i in range(6)]
+    assert len(unipile.requests) == 2
+
+
+def test_async_stream(unipile: FakeUnipile, async_client: AsyncClient):
+    unipile.add("GET", "users/relations", relations_page(0, 3, None))
+
+    async def stream() -> tuple[list[UserRelation], list[UserRelation]]:
+        async with stream_items(async_client.users.relations)() as relations:
+            items = [relation async for relation in relations]
+        assert relations.cursor is None
+        endpoint = stream_items(async_client.users.relations)
+        return items, await async_collect_paginated_api(endpoint)
+
+    items, collected = asyncio.run(stream())
+
+    assert items == collected == [UserRelation(**relation_payload(i)) for i in range(3)]
+
+
+def test_unstreamable_endpoint(client: Client):
+    with pytest.raises(ValueError):
+        stream_items(client.users.me)()  # pyright: ignore[reportCallIssue, reportArgumentType]
+    with pytest.raises(TypeError):
+        stream_items(lambda: client.users.relations())
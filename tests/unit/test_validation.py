@@ -0,0 +1,132 @@
+import pytest
+from fakes import (
+    FakeUnipile,
+    account_payload,
+    message_payload,
+    messages_page,
+    people_payload,
+    search_page,
+    user_me_payload,
+    user_profile_payload,
+)
+from pydantic import BaseModel, ValidationError
+
+from unipile_sdk import Client
+from unipile_sdk.helpers import collect_paginated_api
+from unipile_sdk.models import (
+    Accounts,
+    AttachmentFile,
+    ChatsMessagesResponse,
+    LinkedinUserMe,
+    LinkedinUserPlanDisconnected,
+    LinkedinUserPlanInfo,
+    LinkedinUserProfile,
+    Message,
+    NetworkDistance,
+    SearchResponse,
+)
+from unipile_sdk.models.search import LinkedinSearchPayload
+from unipile_sdk.validation import ValidationPolicy, ValidationStats, construct
+
+
+def accounts_page() -> dict:
+    return {
+        "object": "AccountList",
+        "items": [account_payload(i, im_id=f"im-{i % 2}") for i in range(4)],
+        "cursor": None,
+    }
+
+
+def user_me_with_plans() -> dict:
+    payload = user_me_payload()
+    payload["recruiter"] = {"owner_seat_id": "seat", "contract_id": "contract"}
+    payload["sales_navigator"] = {"error": "DISCONNECTED"}
+    return payload
+
+
+@pytest.mark.parametrize(
+    "model, payload",
+    [
+        (SearchResponse, search_page(3)),
+        (ChatsMessagesResponse, messages_page(0, 3, None)),
+        (LinkedinUserProfile, user_profile_payload()),
+        (Accounts, accounts_page()),
+        (LinkedinUserMe, user_me_with_plans()),
+    ],
+)
+def test_constructed_models_equal_validated(model: type[BaseModel], payload: dict):
+    assert construct(model, payload) == model(**payload)
+
+
+def test_construct_resolves_nested_types():
+    messages = construct(ChatsMessagesResponse, messages_page(0, 1, None))
+    search = construct(SearchResponse, search_page(1))
+
+    assert isinstance(messages.items[0].attachments[0], AttachmentFile)
+    assert search.items[0].network_distance is NetworkDistance.DISTANCE_2
+    assert search.items[0].current_positions[0].tenure_at_role.years == 1
+
+
+def test_tagged_unions():
+    me = LinkedinUserMe(**user_me_with_plans())
+    assert isinstance(me.recruiter, LinkedinUserPlanInfo)
+    assert isinstance(me.sales_navigator, LinkedinUserPlanDisconnected)
+    assert construct(LinkedinUserMe, user_me_with_plans()) == me
+
+    payload = message_payload(0)
+    payload["attachments"][0]["type"] = "sticker"
+    with pytest.raises(ValidationError) as error:
+        Message(**payload)
+    # NOTE: one error for the unknown tag, not one per attachment class
+    assert error.value.error_count() == 1
+    assert error.value.errors()[0]["type"] == "union_tag_invalid"
+
+
+def test_dict_mode(unipile: FakeUnipile, client: Client):
+    page = search_page(2)
+    page["items"].append(people_payload(2, network_distance="OUT_OF_NETWORK"))
+    unipile.add("POST", "linkedin/search", page)
+    unipile.add("GET", "accounts", accounts_page())
+    unipile.add("GET", "chats/chat-1/messages", messages_page(0, 2, None))
+    client.options.validation = "dict"
+
+    # Search post-processing still applies to plain dicts
+    search = client.ln_search.search(LinkedinSearchPayload(keywords="python"))
+    assert isinstance(search, dict)
+    assert [item["id"] for item in search["items"]] == ["people-0", "people-1"]
+
+    messages = collect_paginated_api(client.messages.messages, chat_id="chat-1")
+    assert messages == [message_payload(0), message_payload(1)]
+
+    # Methods reading response fields get models
+    assert client.accounts.duplicate_amount() == 2
+
+
+def test_validation_policy_reports_sampled_failures(unipile: FakeUnipile, client: Client):
+    payload = user_profile_payload("jane")
+    del payload["provider_id"]
+    unipile.add("GET", "users/jane/", payload)
+    john = user_profile_payload("john")
+    john["follower_count"] = "12"
+    unipile.add("GET", "users/john/", john)
+    unipile.add(
+        "GET", "chat_attendees", {"object": "ChatAttendeeList", "items": [], "cursor": None}
+    )
+    failures = []
+    client.options.validation = ValidationPolicy(
+        rate=0.5,
+        rates={"messages.chat_attendees": 0},
+        on_failure=lambda endpoint, error, body: failures.append((endpoint, body)),
+    )
+
+    profiles = [client.users.retrieve("jane") for _ in range(5)]
+    for _ in range(3):
+        client.messages.chat_attendees()
+
+    assert all(profile.public_identifier == "jane" for profile in profiles)
+    assert failures == [("users.retrieve", payload)] * 3
+    # NOTE: responses passing validation are coerced like in "validate" mode
+    assert client.users.retrieve("john").follower_count == 12.0
+    stats = client.options.validation.stats
+    assert stats["users.retrieve"] == ValidationStats(validated=6, failures=5, reported=3)
+    assert stats["messages.chat_attendees"] == ValidationStats(validated=3)
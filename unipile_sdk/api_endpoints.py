@@ -2,62 +2,392 @@
 Unipile API endpoints.
 """
 
+from __future__ import annotations
+
 # WARN: use ranged limits type
 
+from copy import copy
 from datetime import datetime
-from typing import TYPE_CHECKING, Any
+from inspect import isawaitable
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Concatenate,
+    Coroutine,
+    Generic,
+    Iterable,
+    ParamSpec,
+    Self,
+    TypedDict,
+    TypeVar,
+    Unpack,
+    cast,
+    overload,
+)
 from urllib.parse import urlparse
 
 from typing import Annotated
 from httpx import URL
-from pydantic import StringConstraints
-
-from unipile_sdk.models import account
+from pydantic import BaseModel, StringConstraints
 
+from . import config
 from .errors import APIResponseError
-from .helpers import iterate_paginated_api
-from .models import (
-    Accounts,
-    ChatAttendeesResponse,
-    ChatsMessagesResponse,
-    ChatsResponse,
-    ChatsSendMessageResponse,
-    ChatsStartedResponse,
-    CommonSearchParameter,
-    LinkedinAccountsConnect,
-    LinkedinAccountsConnectResponse,
-    LinkedinCompanyProfile,
-    LinkedinSalesNavSearchPayload,
-    LinkedinSearchParametersResponse,
-    LinkedinSearchPayload,
-    LinkedinSection,
-    LinkedinURLSearchPayload,
-    LinkedinUserMe,
-    LinkedinUserProfile,
-    LinkedinUsersInvitePayload,
-    LinkedinUsersInviteResponse,
-    NetworkDistance,
-    NotFoundType,
-    SearchResponse,
-    UsersRelationsResponse,
-)
+from .helpers import async_iterate_paginated_api, iterate_paginated_api
+from . import models
 from .helpers import reminds_url
 
-from .typing import AccountLinkType, AccountProvider, SyncAsync
+from .models.lazy import lazy_variant
+from .raw import RawResponse
+from .interning import StringInterner
+from .records import CompactPage, Record, record_type
+from .typing import (
+    AccountLinkType,
+    AccountProvider,
+    CacheMode,
+    ListResponse,
+    SyncAsync,
+    ValidationMode,
+)
+from .serialization import loads
+from .streaming import AsyncItemStream, ItemStream
+from .validation import ValidationPolicy, adapter
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .models import (
+        Accounts,
+        ChatAttendeesResponse,
+        ChatsMessagesResponse,
+        ChatsResponse,
+        ChatsSendMessageResponse,
+        ChatsStartedResponse,
+        CommonSearchParameter,
+        LinkedinAccountsConnect,
+        LinkedinAccountsConnectResponse,
+        LinkedinCompanyProfile,
+        LinkedinSalesNavSearchPayload,
+        LinkedinSearchParametersResponse,
+        LinkedinSearchPayload,
+        LinkedinSection,
+        LinkedinURLSearchPayload,
+        LinkedinUserMe,
+        LinkedinUserProfile,
+        LinkedinUsersInviteResponse,
+        SearchResponse,
+        UsersRelationsResponse,
+    )
+    from .client import AsyncClient, BaseClient, Client
+
+M = TypeVar("M", bound=BaseModel)
+C = TypeVar("C", bound="BaseClient")
+P = ParamSpec("P")
+R = TypeVar("R")
+T = TypeVar("T")
 
 if TYPE_CHECKING:  # pragma: no cover
-    from .client import BaseClient
 
+    class api_method(Generic[P, R]):
+        """
+        Endpoint method returning `R` on endpoints of a `Client` and a coroutine resolving to
+        `R` on endpoints of an `AsyncClient`.
+        """
+
+        def __init__(self, function: Callable[Concatenate[Any, P], R]) -> None: ...
 
-class Endpoint:
-    def __init__(self, parent: "BaseClient") -> None:
+        @overload
+        def __get__(self, endpoint: None, owner: type) -> Self: ...
+        @overload
+        def __get__(self, endpoint: Endpoint[Client], owner: type) -> Callable[P, R]: ...
+        @overload
+        def __get__(
+            self, endpoint: Endpoint[AsyncClient], owner: type
+        ) -> Callable[P, Coroutine[Any, Any, R]]: ...
+        @overload
+        def __get__(self, endpoint: Endpoint[Any], owner: type) -> Callable[P, SyncAsync[R]]: ...
+        def __get__(self, endpoint: Any, owner: type) -> Any: ...
+
+else:
+
+    def api_method(function):
+        # NOTE: only type checkers need the descriptor, methods stay plain functions
+        return function
+
+
+class CallOptions(TypedDict, total=False):
+    """
+    Options of `Endpoint.with_options`.
+    """
+
+    validation: ValidationMode | ValidationPolicy
+    lazy: bool
+    cache: CacheMode
+
+
+class Endpoint(Generic[C]):
+    def __init__(self, parent: C) -> None:
         self.parent = parent
+        self._call_options: dict[str, Any] = {}
+
+    def with_options(self, **options: Unpack[CallOptions]) -> Self:
+        """
+        Copy of the endpoint passing `options` to each of its requests, e.g.
+        `client.users.with_options(cache="refresh").retrieve(identifier)`. The `validation`
+        option overrides `ClientOptions.validation` and `lazy` overrides `ClientOptions.lazy`.
+        List endpoints stream their items with `stream_items` and return compact records
+        with `compact_records`, `raw_response` returns undecoded responses.
+        """
+        return self._with_call_options(**options)
+
+    def _with_call_options(self, **options: Any) -> Self:
+        """
+        `with_options` taking any call option, including those changing the return type of
+        endpoint methods (see `stream_items`).
+        """
+        endpoint = copy(self)
+        endpoint._call_options = {**self._call_options, **options}
+        return endpoint
+
+    def _request(
+        self,
+        model: type[BaseModel] | None,
+        after: Callable[[Any], Any] | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Send a request through the parent client and wrap the response body into `model`,
+        validated straight from the response bytes.
+
+        With an `AsyncClient` the parent returns a coroutine, in that case an awaitable
+        resolving to the same model is returned, so every endpoint method can be awaited.
+        Call options change the result (a dict, an item stream, a raw response...), so
+        endpoint methods declare their return type.
+        """
+        options = dict(self._call_options)
+        validation = options.pop("validation", self.parent.options.validation)
+        endpoint = kwargs["endpoint"]
+        if options.pop("raw", False):
+            # NOTE: bodies are passed through as received, `after` filters don't apply
+            options.pop("compact", None)
+            options.pop("lazy", None)
+            return self.parent.request(**kwargs, **options, raw=True)
+
+        records: type[Record] | None = None
+        if options.pop("compact", False):
+            # NOTE: items are built into records straight from the decoded JSON
+            records = record_type(self._item_type(model, endpoint))
+            validation = "dict"
+        elif options.pop("lazy", self.parent.options.lazy) and model is not None:
+            model = lazy_variant(model)
+        options.pop("lazy", None)
+        interner = self.parent.options.interning
+
+        if options.pop("stream", False):
+            build = self._item_builder(model, after, validation, endpoint)
+            if records is not None:
+                build = records.from_dict
+            if interner is not None:
+                build = self._interning(build, self._item_type(model, endpoint), interner)
+            response = self.parent.request(**kwargs, **options, stream=True)
+            if isawaitable(response):
+                return AsyncItemStream(response, build)
+            return ItemStream(response, build)
+
+        if interner is not None and model is not None:
+            after = self._interning(after, model, interner)
+        if records is not None:
+            after = self._compacting(after, records)
+
+        response = self.parent.request(**kwargs, **options, decode=False)
+        if isawaitable(response):
+            return self._async_wrap(response, model, after, validation, endpoint)
+
+        return self._wrap(response, model, after, validation, endpoint)
+
+    async def _async_wrap(
+        self,
+        response: Awaitable[Any],
+        model: type[M] | None,
+        after: Callable[[M], M] | None,
+        validation: ValidationMode | ValidationPolicy,
+        endpoint: str,
+    ) -> M:
+        return self._wrap(await response, model, after, validation, endpoint)
+
+    @staticmethod
+    def _wrap(
+        content: bytes,
+        model: type[M] | None,
+        after: Callable[[M], M] | None,
+        validation: ValidationMode | ValidationPolicy,
+        endpoint: str,
+    ) -> M:
+        if model is None or validation == "dict":
+            result = loads(content)
+        elif isinstance(validation, ValidationPolicy):
+            result = validation.build(endpoint, model, content)
+        else:
+            result = model.model_validate_json(content)
+        return after(result) if after else result
+
+    @staticmethod
+    def _item_builder(
+        model: type[Any] | None,
+        after: Callable[[Any], Any] | None,
+        validation: ValidationMode | ValidationPolicy,
+        endpoint: str,
+    ) -> Callable[[Any], Any]:
+        """
+        Builder of items of a streamed list response, like `_wrap` for whole responses.
+        """
+        if after is not None:
+            raise ValueError(f"{endpoint} responses can't be streamed")
+
+        item = Endpoint._item_type(model, endpoint)
+        if validation == "dict":
+            return lambda data: data
+        if isinstance(validation, ValidationPolicy):
+            return lambda data: validation.build(endpoint, item, data)
+        return adapter(item).validate_python
+
+    @staticmethod
+    def _item_type(model: type[Any] | None, endpoint: str) -> Any:
+        if model is None or "items" not in model.model_fields:
+            raise ValueError(f"{endpoint} responses aren't lists of items")
+        if not model.__pydantic_complete__:
+            # NOTE: forward references (items declared before their model) are resolved
+            # on first validation, streams read the annotation before
+            model.model_rebuild()
+        return model.model_fields["items"].annotation.__args__[0]
+
+    @staticmethod
+    def _interning(
+        then: Callable[[Any], Any] | None, model: type[Any], interner: StringInterner
+    ) -> Callable[[Any], Any]:
+        """
+        Intern strings of a response (or a streamed item) of `model`, then call `then`.
+        """
+
+        def intern(result: Any) -> Any:
+            interner.apply(model, result)
+            return then(result) if then else result
+
+        return intern
+
+    @staticmethod
+    def _compacting(
+        after: Callable[[Any], Any] | None, records: type[Record]
+    ) -> Callable[[Any], Any]:
+        """
+        Post-processing of a decoded page, its items are replaced by records.
+        """
+
+        def compact(page: dict[str, Any]) -> dict[str, Any]:
+            page = after(page) if after else page
+            page["items"] = [records.from_dict(item) for item in page["items"]]
+            return page
 
+        return compact
 
-class UsersEndpoint(Endpoint):
+    def _page_limit(
+        self,
+        endpoint: str,
+        limit: int | None,
+        default: int,
+        account_id: str | None = None,
+        scoped: bool = True,
+        maximum: int | None = None,
+    ) -> int:
+        """
+        `limit` of a page request, the default or the size tuned by
+        `ClientOptions.page_size` when it isn't given. `scoped` endpoints are tuned per
+        account, `maximum` caps the tuned size.
+        """
+        if limit is not None:
+            return limit
+        tuner = self.parent.page_size
+        if tuner is None:
+            return default
+        account_key = self.parent.resolve_account_id(account_id) if scoped else ""
+        return tuner.limit(endpoint, account_key, default, maximum)
+
+    def _with_models(self) -> Self:
+        """
+        Endpoint returning models even in "dict" mode, for methods reading response fields.
+        """
+        if any(self._call_options.get(name) for name in ("compact", "stream", "raw")):
+            return self._with_call_options(compact=False, stream=False, raw=False)._with_models()
+        if self._call_options.get("validation", self.parent.options.validation) != "dict":
+            return self
+        return self.with_options(validation="validate")
+
+
+def _with_call_options(method: Callable[..., Any], **options: Any) -> Callable[..., Any]:
+    """
+    `method` of a copy of its endpoint passing `options` to each request.
+    """
+    endpoint = getattr(method, "__self__", None)
+    if not isinstance(endpoint, Endpoint):
+        raise TypeError(f"{method!r} isn't a method of an endpoint")
+    return getattr(endpoint._with_call_options(**options), method.__name__)
+
+
+@overload
+def stream_items(
+    method: Callable[P, Coroutine[Any, Any, ListResponse[T]]],
+) -> Callable[P, AsyncItemStream[T]]: ...
+@overload
+def stream_items(method: Callable[P, ListResponse[T]]) -> Callable[P, ItemStream[T]]: ...
+@overload
+def stream_items(
+    method: Callable[P, Coroutine[Any, Any, CompactPage]],
+) -> Callable[P, AsyncItemStream[Record]]: ...
+@overload
+def stream_items(method: Callable[P, CompactPage]) -> Callable[P, ItemStream[Record]]: ...
+def stream_items(method: Callable[P, Any]) -> Callable[P, Any]:
+    """
+    List endpoint `method` returning an `ItemStream` of its items, parsed while the response
+    downloads, instead of the page, e.g. `stream_items(client.users.relations)(limit=1000)`.
+    Methods of an `AsyncClient` return an `AsyncItemStream`.
+    """
+    return _with_call_options(method, stream=True)
+
+
+@overload
+def compact_records(
+    method: Callable[P, Coroutine[Any, Any, ListResponse[Any]]],
+) -> Callable[P, Coroutine[Any, Any, CompactPage]]: ...
+@overload
+def compact_records(method: Callable[P, ListResponse[Any]]) -> Callable[P, CompactPage]: ...
+def compact_records(method: Callable[P, Any]) -> Callable[P, Any]:
+    """
+    List endpoint `method` returning pages (dicts) of compact `unipile_sdk.records.Record`
+    items instead of models, e.g. `compact_records(client.users.relations)(limit=1000)`.
+    `stream_items(compact_records(method))` streams the records.
+    """
+    return _with_call_options(method, compact=True)
+
+
+@overload
+def raw_response(
+    method: Callable[P, Coroutine[Any, Any, Any]], stream: bool = False
+) -> Callable[P, Coroutine[Any, Any, RawResponse]]: ...
+@overload
+def raw_response(method: Callable[P, Any], stream: bool = False) -> Callable[P, RawResponse]: ...
+def raw_response(method: Callable[P, Any], stream: bool = False) -> Callable[P, Any]:
+    """
+    Endpoint `method` returning the undecoded `RawResponse` instead of a model, e.g.
+    `raw_response(client.users.relations)(limit=1000).content`. A `stream` response is read
+    with `iter_bytes()` (or `aiter_bytes()`) and must be closed.
+    """
+    return _with_call_options(method, raw=True, stream=stream)
+
+
+class UsersEndpoint(Endpoint[C]):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
 
+    @api_method
     def connect(
         self,
         payload: LinkedinAccountsConnect,
@@ -68,14 +398,15 @@ class UsersEndpoint(Endpoint):
         Endpoint documentation: https://developer.unipile.com/reference/accountscontroller_createaccount
         """
 
-        return LinkedinAccountsConnectResponse(
-            **self.parent.request(
-                path="accounts",
-                method="POST",
-                body=payload.model_dump(exclude_none=True),
-            )
+        return self._request(
+            models.LinkedinAccountsConnectResponse,
+            endpoint="users.connect",
+            path="accounts",
+            method="POST",
+            body=payload.model_dump(exclude_none=True),
         )
 
+    @api_method
     def me(
         self,
         account_id = None,
@@ -85,14 +416,15 @@ class UsersEndpoint(Endpoint):
 
         Endpoint documentation: https://developer.unipile.com/reference/userscontroller_getaccountownerprofile
         """
-        return LinkedinUserMe(
-            **self.parent.request(
-                path="users/me",
-                method="GET",
-                account_id=account_id
-            )
+        return self._request(
+            models.LinkedinUserMe,
+            endpoint="users.me",
+            path="users/me",
+            method="GET",
+            account_id=account_id
         )
 
+    @api_method
     def retrieve(
         self,
         identifier: Annotated[str, StringConstraints(min_length=1)],
@@ -107,15 +439,17 @@ class UsersEndpoint(Endpoint):
         Endpoint documentation: https://developer.unipile.com/reference/userscontroller_getprofilebyidentifier
         """
 
-        return LinkedinUserProfile(
-            **self.parent.request(
-                path=f"users/{identifier}/",  # NOTE: that slash is required, otherwise it will return 301
-                method="GET",
-                query={"linkedin_sections": linkedin_section.value} if linkedin_section else {},
-                account_id=account_id
-            )
+        return self._request(
+            models.LinkedinUserProfile,
+            endpoint="users.retrieve",
+            action="profile_view",
+            path=f"users/{identifier}/",  # NOTE: that slash is required, otherwise it will return 301
+            method="GET",
+            query={"linkedin_sections": linkedin_section.value} if linkedin_section else {},
+            account_id=account_id
         )
 
+    @api_method
     def invite(
         self,
         provider_id: Annotated[str, StringConstraints(min_length=1)],
@@ -129,25 +463,27 @@ class UsersEndpoint(Endpoint):
         Endpoint documentation: https://developer.unipile.com/reference/userscontroller_adduserbyidentifier
         """
 
-        payload = LinkedinUsersInvitePayload(
+        payload = models.LinkedinUsersInvitePayload(
             account_id=self.parent.resolve_account_id(account_id),
             provider_id=provider_id,
         )
 
-        return LinkedinUsersInviteResponse(
-            **self.parent.request(
-                path="users/invite",
-                method="POST",
-                body=payload.model_dump(exclude_none=True),
-            )
+        return self._request(
+            models.LinkedinUsersInviteResponse,
+            endpoint="users.invite",
+            action="invite",
+            path="users/invite",
+            method="POST",
+            body=payload.model_dump(exclude_none=True),
         )
 
+    @api_method
     def relations(
         self,
         account_id = None,
         filter: str | None = None,
         cursor: str | None = None,
-        limit: int = 100,
+        limit: int | None = None,
     ) -> UsersRelationsResponse:
         """
         Returns a list of all the relations of an account. Ensure careful implementation of this
@@ -156,87 +492,104 @@ class UsersEndpoint(Endpoint):
 
         Endpoint documentation: https://developer.unipile.com/reference/userscontroller_getrelations
         """
-        return UsersRelationsResponse(
-            **self.parent.request(
-                path="users/relations",
-                method="GET",
-                query={
-                    "filter": filter,
-                    "cursor": cursor,
-                    "limit": limit,
-                },
-                account_id=account_id,
-            )
+        limit = self._page_limit(
+            "users.relations", limit, config.DEFAULT_PAGE_LIMIT, account_id
+        )
+        return self._request(
+            models.UsersRelationsResponse,
+            endpoint="users.relations",
+            path="users/relations",
+            method="GET",
+            query={
+                "filter": filter,
+                "cursor": cursor,
+                "limit": limit,
+            },
+            account_id=account_id,
         )
 
 
-class MessagesEndpoint(Endpoint):
+class MessagesEndpoint(Endpoint[C]):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
 
+    @api_method
     def chat_attendees(
         self,
         cursor: str | None = None,
-        limit: int = 100,
+        limit: int | None = None,
         account_id = None
-    ):
+    ) -> ChatAttendeesResponse:
         """
         Returns a list of messaging attendees. Some optional parameters are available to filter the
         results.
 
         Endpoint documentation: https://developer.unipile.com/reference/chatattendeescontroller_listallattendees
         """
-        return ChatAttendeesResponse(
-            **self.parent.request(
-                path="chat_attendees",
-                method="GET",
-                query={
-                    "cursor": cursor,
-                    "limit": limit,
-                },
-                account_id = account_id,
-            )
+        limit = self._page_limit(
+            "messages.chat_attendees", limit, config.DEFAULT_PAGE_LIMIT, account_id
+        )
+        return self._request(
+            models.ChatAttendeesResponse,
+            endpoint="messages.chat_attendees",
+            path="chat_attendees",
+            method="GET",
+            query={
+                "cursor": cursor,
+                "limit": limit,
+            },
+            account_id = account_id,
         )
 
     # WARN: add befor/after support
+    @api_method
     def list_chats_by_attendee(
         self,
         attendee_id: str,
         account_id = None,
         cursor: str | None = None,
-        limit: int = 100,
-    ):
+        limit: int | None = None,
+    ) -> ChatsResponse:
         """
         Returns a list of chats where a given attendee is involved.
 
         Endpoint documentation: https://developer.unipile.com/reference/chatattendeescontroller_listchatsbyattendee
         """
-        return ChatsResponse(
-            **self.parent.request(
-                path=f"chat_attendees/{attendee_id}/chats",
-                method="GET",
-                query={
-                    "cursor": cursor,
-                    "limit": limit,
-                },
-                account_id = account_id,
-            )
+        limit = self._page_limit(
+            "messages.list_chats_by_attendee", limit, config.DEFAULT_PAGE_LIMIT, account_id
+        )
+        return self._request(
+            models.ChatsResponse,
+            endpoint="messages.list_chats_by_attendee",
+            path=f"chat_attendees/{attendee_id}/chats",
+            method="GET",
+            query={
+                "cursor": cursor,
+                "limit": limit,
+            },
+            account_id = account_id,
         )
 
     # WARN: add before/after support
+    @api_method
     def messages(
         self,
         chat_id: Annotated[str, StringConstraints(min_length=1)],
         sender_id: Annotated[str, StringConstraints(min_length=1)] | None = None,
         cursor: str | None = None,
-        limit: int = 100,
-    ):
+        limit: int | None = None,
+    ) -> ChatsMessagesResponse:
         """
         Returns a list of chats where a given attendee is involved.
 
         Endpoint documentation: https://developer.unipile.com/reference/chatattendeescontroller_listchatsbyattendee
         """
-        response = self.parent.request(
+        limit = self._page_limit(
+            "messages.messages", limit, config.DEFAULT_PAGE_LIMIT, scoped=False
+        )
+        return self._request(
+            models.ChatsMessagesResponse,
+            endpoint="messages.messages",
             path=f"chats/{chat_id}/messages",
             method="GET",
             query={
@@ -245,8 +598,8 @@ class MessagesEndpoint(Endpoint):
                 "limit": limit,
             },
         )
-        return ChatsMessagesResponse(**response)
 
+    @api_method
     def send_message(
         self,
         chat_id: Annotated[str, StringConstraints(min_length=1)],
@@ -262,17 +615,19 @@ class MessagesEndpoint(Endpoint):
         Endpoint documentation: https://developer.unipile.com/reference/chatscontroller_sendmessageinchat
         """
 
-        return ChatsSendMessageResponse(
-            **self.parent.request(
-                path=f"chats/{chat_id}/messages",
-                method="POST",
-                body={
-                    "text": text,
-                },
-                account_id = account_id,
-            )
+        return self._request(
+            models.ChatsSendMessageResponse,
+            endpoint="messages.send_message",
+            action="message_send",
+            path=f"chats/{chat_id}/messages",
+            method="POST",
+            body={
+                "text": text,
+            },
+            account_id = account_id,
         )
 
+    @api_method
     def send_message_to_attendees(
         self,
         attendees_ids: list[Annotated[str, StringConstraints(min_length=1)]],
@@ -288,60 +643,88 @@ class MessagesEndpoint(Endpoint):
         """
 
         # TODO: add pydantic model
-        return ChatsStartedResponse(
-            **self.parent.request(
-                path="chats",
-                method="POST",
-                body={
-                    "attendees_ids": attendees_ids,
-                    "text": text,
-                    "account_id": self.parent.resolve_account_id(account_id),
-                },
-            )
+        return self._request(
+            models.ChatsStartedResponse,
+            endpoint="messages.send_message_to_attendees",
+            action="message_send",
+            path="chats",
+            method="POST",
+            body={
+                "attendees_ids": attendees_ids,
+                "text": text,
+                "account_id": self.parent.resolve_account_id(account_id),
+            },
         )
 
 
-class AccountsEndpoint(Endpoint):
+class AccountsEndpoint(Endpoint[C]):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
 
-    def accounts(self, cursor: str | None = None, limit: int = 100) -> Accounts:
+    @api_method
+    def accounts(
+        self, cursor: str | None = None, limit: int | None = None
+    ) -> Accounts:
         """
         Returns a list of the accounts linked to Unipile.
 
         Endpoint documentation: https://developer.unipile.com/reference/accountscontroller_listaccounts
         """
-        return Accounts(
-            **self.parent.request(
-                path="accounts",
-                method="GET",
-                query={"cursor": cursor, "limit": limit},
-            )
+        limit = self._page_limit(
+            "accounts.accounts", limit, config.DEFAULT_PAGE_LIMIT, scoped=False
+        )
+        return self._request(
+            models.Accounts,
+            endpoint="accounts.accounts",
+            path="accounts",
+            method="GET",
+            query={"cursor": cursor, "limit": limit},
         )
 
     # TODO: add test
+    @api_method
     def delete(
         self,
         account_id = None
-    ):
-        return self.parent.request(
+    ) -> Any:
+        return self._request(
+            None,
+            endpoint="accounts.delete",
             path=f"accounts/{self.parent.resolve_account_id(account_id)}",
             method="DELETE",
         )
 
+    @api_method
     def duplicate_amount(self, account_type: str = "LINKEDIN") -> int:
         """
         Count duplicate connected accounts
         """
 
+        paginate_kwargs: dict[str, Any] = {
+            "max_total": 5000,  # NOTE: We checking only last 5000 accounts for performance reason
+        }
+        if self.parent.page_size is None:
+            paginate_kwargs["limit"] = config.DUPLICATE_AMOUNT_PAGE_LIMIT
+
+        endpoint = self._with_models()
+        if self.parent.is_async:
+            # NOTE: awaitable on endpoints of an `AsyncClient`, see `api_method`
+            return cast(Any, endpoint._async_duplicate_amount(account_type, **paginate_kwargs))
+
+        return self._count_duplicates(
+            iterate_paginated_api(endpoint.accounts, **paginate_kwargs), account_type
+        )
+
+    async def _async_duplicate_amount(self, account_type: str, **kwargs: Any) -> int:
+        accounts = [acc async for acc in async_iterate_paginated_api(self.accounts, **kwargs)]
+        return self._count_duplicates(accounts, account_type)
+
+    @staticmethod
+    def _count_duplicates(accounts: Iterable[Any], account_type: str) -> int:
         im_ids = []
         total_duplicates = 0
 
-        for acc in iterate_paginated_api(
-            self.accounts,
-            limit=250,
-            max_total=5000,  # NOTE: We checking only last 5000 accounts for performance reason
-        ):
+        for acc in accounts:
             if acc.type == account_type and acc.connection_params and acc.connection_params.im:
                 if acc.connection_params.im.id in im_ids:
                     total_duplicates += 1
@@ -351,10 +734,11 @@ class AccountsEndpoint(Endpoint):
         return total_duplicates
 
 
-class HostedEndpoint(Endpoint):
+class HostedEndpoint(Endpoint[C]):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
 
+    @api_method
     def link(
         self,
         expiries_on: datetime,
@@ -365,7 +749,7 @@ class HostedEndpoint(Endpoint):
         name: str | None = None,
         type: AccountLinkType = "create",
         providers: list[AccountProvider] = ["LINKEDIN"],
-    ) -> SyncAsync[Any]:
+    ) -> Any:
         """
         Create a url which redirect to Unipile's hosted authentication to connect or reconnect an account.
 
@@ -393,16 +777,19 @@ class HostedEndpoint(Endpoint):
         payload = {k: v for k, v in payload.items() if v is not None}
 
         # TODO: return pydantic model
-        return self.parent.request(path="hosted/accounts/link", method="POST", body=payload)
+        return self._request(
+            None, endpoint="hosted.link", path="hosted/accounts/link", method="POST", body=payload
+        )
 
     def retrieve(self):
         pass
 
 
-class SearchEndpoint(Endpoint):
+class SearchEndpoint(Endpoint[C]):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
 
+    @api_method
     def search(
         self,
         payload: LinkedinSearchPayload | LinkedinSalesNavSearchPayload | LinkedinURLSearchPayload,
@@ -419,33 +806,40 @@ class SearchEndpoint(Endpoint):
         Endpoint documentation: https://developer.unipile.com/reference/linkedincontroller_search
         """
 
-        # TODO: verify & move into config module
-        LINKEDIN_SEARCH_DEFAULT_LEADS_PER_PAGE = 10
-        LINKEDIN_SEARCH_SALES_LEADS_PER_PAGE = 25
-
         if limit and limit > max_limit:
             raise ValueError(
                 f"Invalid limit: {limit}. Maximum search limit (session) is {max_limit}"
             )
 
         is_sales_search = False
-        if isinstance(payload, LinkedinSalesNavSearchPayload):
+        if isinstance(payload, models.LinkedinSalesNavSearchPayload):
             is_sales_search = True
-        elif isinstance(payload, LinkedinURLSearchPayload):
+        elif isinstance(payload, models.LinkedinURLSearchPayload):
             if payload.url.startswith("https://www.linkedin.com/sales/search"):
                 is_sales_search = True
 
         # Linkedin Classic shouldn't exceed 50.
-        if limit and limit > 50 and not is_sales_search:
+        max_classic_limit = config.LINKEDIN_SEARCH_MAX_LEADS_PER_PAGE
+        if limit and limit > max_classic_limit and not is_sales_search:
             raise ValueError(
-                f"Invalid limit: {limit}. Maximum normal search limit (session) is 50"
+                f"Invalid limit: {limit}. Maximum normal search limit (session) is "
+                f"{max_classic_limit}"
             )
 
         request_limit = (
-            LINKEDIN_SEARCH_SALES_LEADS_PER_PAGE
+            config.LINKEDIN_SEARCH_SALES_LEADS_PER_PAGE
             if is_sales_search
-            else LINKEDIN_SEARCH_DEFAULT_LEADS_PER_PAGE
+            else config.LINKEDIN_SEARCH_DEFAULT_LEADS_PER_PAGE
         )
+        if not limit:
+            # NOTE: only pages of searches without a limit are tuned, a limit sets the page
+            request_limit = self._page_limit(
+                "ln_search.search",
+                None,
+                request_limit,
+                account_id,
+                maximum=max_limit if is_sales_search else min(max_limit, max_classic_limit),
+            )
 
         if limit:
             if limit > request_limit:
@@ -459,42 +853,57 @@ class SearchEndpoint(Endpoint):
 
         body_data = payload.model_dump(exclude_none=True)
         self.parent.logger.info(f"Starting LinkedIn search with body_data: {body_data}")
-        response = self.parent.request(
+        return self._request(
+            models.SearchResponse,
+            endpoint="ln_search.search",
+            after=lambda search_response: self._filter_search_response(search_response, limit),
+            action="search",
             path="linkedin/search",
             method="POST",
+            idempotent=True,  # NOTE: POST, but it's a read only search
             query={"cursor": cursor, "limit": request_limit},
             body=body_data,
             account_id=account_id
         )
 
-        search_response = SearchResponse(**response)
+    def _filter_search_response(
+        self, search_response: SearchResponse | dict[str, Any], limit: int | None
+    ) -> SearchResponse | dict[str, Any]:
+        # NOTE: response is a plain dict in "dict" validation mode
+        is_dict = isinstance(search_response, dict)
+        items = search_response["items"] if is_dict else search_response.items
 
         # Filter out of network users
         filtered_items = list(
             filter(
-                lambda u: u.network_distance != NetworkDistance.OUT_OF_NETWORK,
-                search_response.items,
+                lambda u: (u["network_distance"] if is_dict else u.network_distance)
+                != models.NetworkDistance.OUT_OF_NETWORK,
+                items,
             )
         )
-        filtered_items_length = len(search_response.items) - len(filtered_items)
+        filtered_items_length = len(items) - len(filtered_items)
         if filtered_items_length > 0:
             self.parent.logger.info(
                 f"Filtered out leads due to being out of network: {filtered_items_length} "
             )
-            search_response.items = filtered_items
+            items = filtered_items
 
         # Apply global limit
-        if limit and len(search_response.items) > limit:
+        if limit and len(items) > limit:
             self.parent.logger.info(
-                f"Limiting leads due to limit param: {len(search_response.items)} to {limit}"
+                f"Limiting leads due to limit param: {len(items)} to {limit}"
             )
-            search_response.items = search_response.items[:limit]
+            items = items[:limit]
 
-        self.parent.logger.info(
-            f"LinkedIn search completed with leads: {len(search_response.items)}"
-        )
+        if is_dict:
+            search_response["items"] = items
+        else:
+            search_response.items = items
+
+        self.parent.logger.info(f"LinkedIn search completed with leads: {len(items)}")
         return search_response
 
+    @api_method
     def search_param(
         self,
         type: CommonSearchParameter,
@@ -508,15 +917,17 @@ class SearchEndpoint(Endpoint):
 
         Endpoint documentation: https://developer.unipile.com/reference/linkedincontroller_getsearchparameterslist
         """
-        return LinkedinSearchParametersResponse(
-            **self.parent.request(
-                path="linkedin/search/parameters",
-                method="GET",
-                query={"type": type.value, "keywords": keywords},
-                account_id=account_id
-            )
+        return self._request(
+            models.LinkedinSearchParametersResponse,
+            endpoint="ln_search.search_param",
+            action="search",
+            path="linkedin/search/parameters",
+            method="GET",
+            query={"type": type.value, "keywords": keywords},
+            account_id=account_id
         )
 
+    @api_method
     def retrieve_company(
         self,
         identifier: Annotated[str, StringConstraints(min_length=1)],
@@ -527,19 +938,79 @@ class SearchEndpoint(Endpoint):
 
         Endpoint documentation: https://developer.unipile.com/reference/linkedincontroller_getcompanyprofile
         """
-        return LinkedinCompanyProfile(
-            **self.parent.request(
-                path=f"linkedin/company/{identifier}",
-                method="GET",
-                account_id=account_id
-            )
+        return self._request(
+            models.LinkedinCompanyProfile,
+            endpoint="ln_search.retrieve_company",
+            action="profile_view",
+            path=f"linkedin/company/{identifier}",
+            method="GET",
+            account_id=account_id
         )
 
+    @api_method
     def retrieve_company_id(
         self,
         url_or_name,
         account_id = None
     ) -> str | None:
+        company_slug, keywords = self._parse_company_identifier(url_or_name)
+
+        endpoint = self._with_models()
+        if self.parent.is_async:
+            # NOTE: awaitable on endpoints of an `AsyncClient`, see `api_method`
+            return cast(
+                Any, endpoint._async_retrieve_company_id(company_slug, keywords, account_id)
+            )
+
+        if company_slug:
+            self.parent.logger.info("Getting company id from slug %s", company_slug)
+            try:
+                company = cast(
+                    "LinkedinCompanyProfile",
+                    endpoint.retrieve_company(company_slug, account_id=account_id),
+                )
+                company_id = company.id
+                return str(company_id)
+            except Exception as e:
+                return self._handle_company_error(e, company_slug)
+
+        search_param = endpoint.search_param(
+            type=models.CommonSearchParameter.COMPANY, keywords=keywords, account_id=account_id
+        )
+        return self._first_search_param_id(
+            cast("LinkedinSearchParametersResponse", search_param), keywords
+        )
+
+    async def _async_retrieve_company_id(
+        self,
+        company_slug: str | None,
+        keywords: str,
+        account_id = None,
+    ) -> str | None:
+        if company_slug:
+            self.parent.logger.info("Getting company id from slug %s", company_slug)
+            try:
+                company = await cast(
+                    "Awaitable[LinkedinCompanyProfile]",
+                    self.retrieve_company(company_slug, account_id=account_id),
+                )
+                return str(company.id)
+            except Exception as e:
+                return self._handle_company_error(e, company_slug)
+
+        search_param = await cast(
+            "Awaitable[LinkedinSearchParametersResponse]",
+            self.search_param(
+                type=models.CommonSearchParameter.COMPANY, keywords=keywords, account_id=account_id
+            ),
+        )
+        return self._first_search_param_id(search_param, keywords)
+
+    @staticmethod
+    def _parse_company_identifier(url_or_name: str) -> tuple[str | None, str]:
+        """
+        Split company identifier into a company slug (when known) and search keywords.
+        """
         url_or_name = url_or_name.strip()
         url_or_name = url_or_name.rstrip("/")
         company_slug = None
@@ -553,33 +1024,28 @@ class SearchEndpoint(Endpoint):
         ):
             company_slug = url_or_name.split("/")[-1]
 
-        if company_slug:
-            self.parent.logger.info("Getting company id from slug %s", company_slug)
-            try:
-                company_id = self.retrieve_company(company_slug, account_id=account_id).id
-                return str(company_id)
-            except APIResponseError as e:
-                if e.error and e.error == NotFoundType.ERRORS_RESOURCE_NOT_FOUND:
-                    self.parent.logger.info("Company %s not found, skip processing", url_or_name)
-                    return
-                else:
-                    self.parent.logger.warning(f"Failed to get campaign with {e} error")
-                    raise
-            except Exception as e:
-                self.parent.logger.critical(f"Raised unknown exception {e} for {company_slug}")
-                return
-        else:
-            # If name is URL get domain name
-            if reminds_url(url_or_name):
-                url_or_name = urlparse(url_or_name).netloc
+        # If name is URL get domain name
+        if not company_slug and reminds_url(url_or_name):
+            url_or_name = urlparse(url_or_name).netloc
 
-            search_param = self.search_param(
-                type=CommonSearchParameter.COMPANY, keywords=url_or_name, account_id=account_id
-            )
-            if not search_param.items:
-                self.parent.logger.info("Company %s not found, skip processing", url_or_name)
+        return company_slug, url_or_name
+
+    def _handle_company_error(self, e: Exception, company_slug: str) -> None:
+        if isinstance(e, APIResponseError):
+            if e.error and e.error == models.NotFoundType.ERRORS_RESOURCE_NOT_FOUND:
+                self.parent.logger.info("Company %s not found, skip processing", company_slug)
                 return
+            else:
+                self.parent.logger.warning(f"Failed to get campaign with {e} error")
+                raise e
 
-            company_id = str(search_param.items[0].id)
+        self.parent.logger.critical(f"Raised unknown exception {e} for {company_slug}")
+
+    def _first_search_param_id(
+        self, search_param: LinkedinSearchParametersResponse, keywords: str
+    ) -> str | None:
+        if not search_param.items:
+            self.parent.logger.info("Company %s not found, skip processing", keywords)
+            return
 
-        return company_id
+        return str(search_param.items[0].id)
@@ -0,0 +1,126 @@
+"""
+Per-account circuit breaker for disconnected accounts and expired credentials.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, Generator
+
+from .errors import CircuitOpenError, LinkedinLoginError
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class Circuit:
+    state: CircuitState
+    opened_at: float
+    trial_in_flight: bool = False
+
+
+class CircuitBreaker:
+    """
+    Fail calls of an account locally once unipile reports it's disconnected.
+
+    An open circuit turns half-open after `cooldown` seconds (the client verifies the
+    account before letting a trial call through) or as soon as the account is verified
+    as healthy. A successful trial closes the circuit, a login error opens it again.
+    """
+
+    def __init__(self, cooldown: float = 300.0, clock: Callable[[], float] = time.monotonic) -> None:
+        self.cooldown = cooldown
+        self.clock = clock
+        self._circuits: dict[str, Circuit] = {}
+        self._lock = threading.Lock()
+
+    def state(self, account_id: str) -> CircuitState:
+        circuit = self._circuits.get(account_id)
+        return circuit.state if circuit else CircuitState.CLOSED
+
+    def before_request(self, account_id: str) -> bool:
+        """
+        Raise `CircuitOpenError` if calls of the account must fail locally. Returns `True`
+        when cooldown just elapsed and account should be verified before the trial call.
+        """
+        if account_id not in self._circuits:
+            return False
+
+        with self._lock:
+            circuit = self._circuits.get(account_id)
+            if circuit is None or circuit.state is CircuitState.CLOSED:
+                return False
+
+            retry_after = circuit.opened_at + self.cooldown - self.clock()
+            if circuit.state is CircuitState.OPEN:
+                if retry_after > 0:
+                    raise CircuitOpenError(account_id, retry_after)
+
+                circuit.state = CircuitState.HALF_OPEN
+                circuit.trial_in_flight = True
+                return True
+
+            # Half-open, only a single trial call at a time
+            if circuit.trial_in_flight:
+                raise CircuitOpenError(account_id, max(retry_after, 0.0))
+
+            circuit.trial_in_flight = True
+            return False
+
+    def record_failure(self, account_id: str) -> None:
+        with self._lock:
+            self._circuits[account_id] = Circuit(CircuitState.OPEN, opened_at=self.clock())
+
+    def record_success(self, account_id: str) -> None:
+        if account_id not in self._circuits:
+            return
+
+        with self._lock:
+            self._circuits.pop(account_id, None)
+
+    def release_trial(self, account_id: str) -> None:
+        """
+        Trial call failed for another reason than login, circuit stays half-open and the
+        next call is a new trial.
+        """
+        if account_id not in self._circuits:
+            return
+
+        with self._lock:
+            circuit = self._circuits.get(account_id)
+            if circuit and circuit.state is CircuitState.HALF_OPEN:
+                circuit.trial_in_flight = False
+
+    def record_verified(self, account_id: str) -> None:
+        """
+        Account was verified as connected, let the next call through as a trial.
+        """
+        with self._lock:
+            circuit = self._circuits.get(account_id)
+            if circuit and circuit.state is CircuitState.OPEN:
+                circuit.state = CircuitState.HALF_OPEN
+                circuit.trial_in_flight = False
+
+    @contextmanager
+    def track(self, account_id: str) -> Generator[None, None, None]:
+        """
+        Record outcome of a call, only login errors count as failures and only successful
+        calls close the circuit. Other errors (rate limits, server errors...) say nothing
+        about the account.
+        """
+        try:
+            yield
+        except LinkedinLoginError:
+            self.record_failure(account_id)
+            raise
+        except BaseException:
+            self.release_trial(account_id)
+            raise
+        else:
+            self.record_success(account_id)
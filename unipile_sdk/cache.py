@@ -0,0 +1,200 @@
+"""
+Read-through cache of GET responses, with in-memory and SQLite backends.
+"""
+
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Protocol
+
+
+class CacheBackend(Protocol):
+    """
+    Storage of response bodies, entries are grouped by namespace (endpoint name).
+    """
+
+    def get(self, namespace: str, key: str) -> bytes | None: ...
+
+    def set(self, namespace: str, key: str, value: bytes, ttl: float, max_size: int) -> None: ...
+
+    def delete(self, namespace: str, key: str) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class MemoryCache:
+    """
+    In-process LRU cache, entries expire after their TTL.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self.clock = clock
+        self._entries: dict[str, OrderedDict[str, tuple[float, bytes]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, namespace: str, key: str) -> bytes | None:
+        with self._lock:
+            entries = self._entries.get(namespace)
+            entry = entries.get(key) if entries else None
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= self.clock():
+                del entries[key]
+                return None
+
+            entries.move_to_end(key)
+            return value
+
+    def set(self, namespace: str, key: str, value: bytes, ttl: float, max_size: int) -> None:
+        with self._lock:
+            entries = self._entries.setdefault(namespace, OrderedDict())
+            entries[key] = (self.clock() + ttl, value)
+            entries.move_to_end(key)
+            while len(entries) > max_size:
+                entries.popitem(last=False)
+
+    def delete(self, namespace: str, key: str) -> None:
+        with self._lock:
+            self._entries.get(namespace, {}).pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCache:
+    """
+    On-disk cache, shared by processes using the same database file. Least recently
+    used entries are evicted when a namespace exceeds its size.
+    """
+
+    def __init__(self, path: str | Path, clock: Callable[[], float] = time.time) -> None:
+        self.clock = clock
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS unipile_cache (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value BLOB NOT NULL,
+                    expires_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    PRIMARY KEY (namespace, key)
+                )
+                """
+            )
+
+    def get(self, namespace: str, key: str) -> bytes | None:
+        now = self.clock()
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT value, expires_at FROM unipile_cache WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+            if row is None:
+                return None
+
+            value, expires_at = row
+            if expires_at <= now:
+                self._connection.execute(
+                    "DELETE FROM unipile_cache WHERE namespace = ? AND key = ?", (namespace, key)
+                )
+                return None
+
+            self._connection.execute(
+                "UPDATE unipile_cache SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                (now, namespace, key),
+            )
+            return value
+
+    def set(self, namespace: str, key: str, value: bytes, ttl: float, max_size: int) -> None:
+        now = self.clock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO unipile_cache VALUES (?, ?, ?, ?, ?)",
+                (namespace, key, value, now + ttl, now),
+            )
+            self._connection.execute(
+                """
+                DELETE FROM unipile_cache WHERE namespace = ? AND key NOT IN (
+                    SELECT key FROM unipile_cache WHERE namespace = ?
+                    ORDER BY accessed_at DESC, rowid DESC LIMIT ?
+                )
+                """,
+                (namespace, namespace, max_size),
+            )
+
+    def delete(self, namespace: str, key: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM unipile_cache WHERE namespace = ? AND key = ?", (namespace, key)
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM unipile_cache")
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+@dataclass
+class CacheRule:
+    """
+    Caching of an endpoint.
+    Attributes:
+        ttl: Number of seconds a response is served from cache.
+        max_size: Maximum number of cached responses of the endpoint.
+    """
+
+    ttl: float
+    max_size: int = 1024
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResponseCache:
+    """
+    Cache of endpoints responses, only endpoints with a rule are cached, e.g.:
+
+    ResponseCache({"users.retrieve": CacheRule(ttl=24 * 3600, max_size=10_000)})
+    """
+
+    def __init__(self, rules: dict[str, CacheRule], backend: CacheBackend | None = None) -> None:
+        self.rules = rules
+        self.backend = backend if backend is not None else MemoryCache()
+        self.stats = {endpoint: CacheStats() for endpoint in rules}
+        self._lock = threading.Lock()
+
+    def get(self, endpoint: str, key: str) -> bytes | None:
+        value = self.backend.get(endpoint, key)
+        with self._lock:
+            stats = self.stats[endpoint]
+            if value is None:
+                stats.misses += 1
+            else:
+                stats.hits += 1
+        return value
+
+    def set(self, endpoint: str, key: str, value: bytes) -> None:
+        rule = self.rules[endpoint]
+        self.backend.set(endpoint, key, value, rule.ttl, rule.max_size)
+
+    def invalidate(self, endpoint: str, key: str) -> None:
+        self.backend.delete(endpoint, key)
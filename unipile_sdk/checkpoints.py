@@ -0,0 +1,158 @@
+"""
+Durable pagination checkpoints, for resuming long exports, with in-memory, file and SQLite
+stores.
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Protocol
+
+
+@dataclass
+class Checkpoint:
+    """
+    Progress of a paginated export, saved once a page is committed.
+    Attributes:
+        cursor: Cursor of the next page to fetch.
+        pages: Number of committed pages, the checkpoint of the first page has 1.
+        items: Number of committed items.
+        done: Whether the last page is committed, a finished export isn't resumed.
+    """
+
+    cursor: str | None = None
+    pages: int = 0
+    items: int = 0
+    done: bool = False
+
+
+class CheckpointStore(Protocol):
+    """
+    Storage of checkpoints by export key, e.g. "relations:<account id>".
+    """
+
+    def load(self, key: str) -> Checkpoint | None: ...
+
+    def save(self, key: str, checkpoint: Checkpoint) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+
+class MemoryCheckpointStore:
+    """
+    In-process store, checkpoints don't survive a restart.
+    """
+
+    def __init__(self) -> None:
+        self._checkpoints: dict[str, Checkpoint] = {}
+        self._lock = threading.Lock()
+
+    def load(self, key: str) -> Checkpoint | None:
+        with self._lock:
+            return self._checkpoints.get(key)
+
+    def save(self, key: str, checkpoint: Checkpoint) -> None:
+        with self._lock:
+            self._checkpoints[key] = checkpoint
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._checkpoints.pop(key, None)
+
+
+class FileCheckpointStore:
+    """
+    JSON file of checkpoints, replaced atomically (and synced to disk) on each save, so a
+    crash leaves either the previous or the new checkpoint.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def load(self, key: str) -> Checkpoint | None:
+        with self._lock:
+            checkpoint = self._read().get(key)
+        return Checkpoint(**checkpoint) if checkpoint is not None else None
+
+    def save(self, key: str, checkpoint: Checkpoint) -> None:
+        with self._lock:
+            checkpoints = self._read()
+            checkpoints[key] = asdict(checkpoint)
+            self._write(checkpoints)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            checkpoints = self._read()
+            if checkpoints.pop(key, None) is not None:
+                self._write(checkpoints)
+
+    def _read(self) -> dict[str, dict]:
+        try:
+            return json.loads(self.path.read_bytes())
+        except FileNotFoundError:
+            return {}
+
+    def _write(self, checkpoints: dict[str, dict]) -> None:
+        fd, temporary = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.")
+        try:
+            with os.fdopen(fd, "w") as file:
+                json.dump(checkpoints, file)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temporary, self.path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+
+class SQLiteCheckpointStore:
+    """
+    Checkpoints in a SQLite database, which can be shared with other stores, like
+    `SQLiteCache`, or with the exported data.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS unipile_checkpoints (
+                    key TEXT PRIMARY KEY,
+                    cursor TEXT,
+                    pages INTEGER NOT NULL,
+                    items INTEGER NOT NULL,
+                    done INTEGER NOT NULL
+                )
+                """
+            )
+
+    def load(self, key: str) -> Checkpoint | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT cursor, pages, items, done FROM unipile_checkpoints WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        cursor, pages, items, done = row
+        return Checkpoint(cursor, pages, items, bool(done))
+
+    def save(self, key: str, checkpoint: Checkpoint) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO unipile_checkpoints VALUES (?, ?, ?, ?, ?)",
+                (key, checkpoint.cursor, checkpoint.pages, checkpoint.items, checkpoint.done),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM unipile_checkpoints WHERE key = ?", (key,))
+
+    def close(self) -> None:
+        self._connection.close()
@@ -2,19 +2,25 @@
 Synchronous and asynchronous clients for unipile's API.
 """
 
+import asyncio
 import json
 import logging
+import time
 from abc import abstractmethod
-from dataclasses import dataclass
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass, field
 from os import environ
 from types import TracebackType
-from typing import Annotated, Any, Self
+from typing import Annotated, Any, Self, cast
+from urllib.parse import urlencode
 import httpx
 from httpx import Request, Response
 from pydantic import StringConstraints
 
 from .models import APIErrorTypes
-from .errors import LinkedinLoginError
+from .breaker import CircuitBreaker
+from .errors import CircuitOpenError, LinkedinLoginError
 from .api_endpoints import (
     MessagesEndpoint,
     AccountsEndpoint,
@@ -28,6 +34,18 @@ from .errors import (
     RequestTimeoutError,
 )
 from .logging import make_console_logger
+from .ratelimit import RateLimit, RateLimiter
+from .retry import RetryPolicy
+from .singleflight import SingleFlight
+from .cache import ResponseCache
+from .serialization import dumps, loads
+from .hedge import Hedger, HedgePolicy
+from .concurrency import AdaptiveLimiter, ConcurrencyPolicy
+from .interning import StringInterner
+from .pagesize import PageSizeTuner
+from .raw import RawResponse
+from .typing import CacheMode, RequestAction, ValidationMode
+from .validation import ValidationPolicy
 
 
 @dataclass
@@ -45,6 +63,45 @@ class ClientOptions:
             written to `stdout`.
         logger: A custom logger.
         unipile_version: unipile version to use.
+        http2: Negotiate HTTP/2 with the API, so concurrent requests are multiplexed over
+            a few connections instead of one connection per in-flight request. Requires
+            the `h2` package (`pip install i-unipile-sdk[http2]`).
+        max_connections: Maximum number of concurrent connections in the pool. All requests
+            go to the `base_url` host, so this is the per-host connections limit too.
+        max_keepalive_connections: Maximum number of idle connections kept open for reuse.
+        keepalive_expiry: Number of seconds an idle connection is kept open.
+        rate_limits: Budgets of provider actions (profile views, invites, ...), enforced
+            per account before a request is sent. Actions without a budget aren't limited.
+        rate_limit_block: Wait until an action fits in its budget, otherwise raise
+            `RateLimitExceededError` immediately.
+        retry: Policy to retry transient errors (429, 503, ...) of idempotent requests.
+            Enabled by default (3 attempts), `None` disables retries.
+        breaker_cooldown: Number of seconds calls of an account fail locally with
+            `CircuitOpenError` after it was reported as disconnected, `None` disables
+            the circuit breaker.
+        coalesce_requests: Identical GET requests (same path, query and account) in flight
+            at the same time share one network call and its response body.
+        cache: Read-through cache of GET responses, configured per endpoint (e.g.
+            `users.retrieve`), see `unipile_sdk.cache.ResponseCache`.
+        hedge: Send a second identical GET request when the first one is slow and use the
+            fastest response, see `unipile_sdk.hedge.HedgePolicy`. `None` disables hedging.
+        concurrency: Adaptive limit of requests in flight, grown while unipile responds
+            quickly and cut on 429/503 errors or latency spikes, see
+            `unipile_sdk.concurrency.ConcurrencyPolicy`. `None` doesn't limit concurrency.
+        validation: How endpoints turn responses into models, "validate" them with pydantic
+            or return plain "dict" bodies. Can be overridden per call with
+            `Endpoint.with_options`. A `unipile_sdk.validation.ValidationPolicy` constructs
+            responses failing validation instead of raising and reports a sample of them.
+        lazy: Return lazy variants of models with large nested collections (search
+            results as `LazyPeopleSearchResult`), these collections are validated on
+            first access. Can be overridden per call with `Endpoint.with_options`.
+        interning: Share one string object between repeated values of configured fields
+            (account ids, companies, locations...) of responses, see
+            `unipile_sdk.interning.StringInterner`. `None` disables interning.
+        page_size: Tune the `limit` of paginated requests sent without one, per endpoint
+            and account, from observed latency, payload size and errors, see
+            `unipile_sdk.pagesize.PageSizeTuner`. `None` uses the defaults of
+            `unipile_sdk.config`.
     """
 
     auth: str
@@ -54,12 +111,30 @@ class ClientOptions:
     log_level: int = logging.INFO
     logger: logging.Logger | None = None
     unipile_version: str = "v1"
+    http2: bool = False
+    max_connections: int | None = 100
+    max_keepalive_connections: int | None = 20
+    keepalive_expiry: float | None = 5.0
+    rate_limits: dict[RequestAction, RateLimit] = field(default_factory=dict)
+    rate_limit_block: bool = True
+    retry: RetryPolicy | None = field(default_factory=RetryPolicy)
+    breaker_cooldown: float | None = 300.0
+    coalesce_requests: bool = True
+    cache: ResponseCache | None = None
+    hedge: HedgePolicy | None = None
+    concurrency: ConcurrencyPolicy | None = None
+    validation: ValidationMode | ValidationPolicy = "validate"
+    lazy: bool = False
+    interning: StringInterner | None = None
+    page_size: PageSizeTuner | None = None
 
 
 class BaseClient:
+    is_async: bool = False
+
     def __init__(
         self,
-        client: httpx.Client | httpx.AsyncClient,
+        client: httpx.Client | httpx.AsyncClient | None,
         options: dict[str, Any] | ClientOptions | None = None,
         **kwargs: Any,
     ) -> None:
@@ -70,8 +145,23 @@ class BaseClient:
         self.logger = options.logger or make_console_logger()
         self.logger.setLevel(options.log_level)
         self.options = options
-        self._clients: list[httpx.Client | httpx.AsyncClient] = []
-        self.client = client
+        self.rate_limiter = RateLimiter(options.rate_limits, block=options.rate_limit_block)
+        self.breaker = (
+            CircuitBreaker(options.breaker_cooldown)
+            if options.breaker_cooldown is not None
+            else None
+        )
+        self.singleflight = SingleFlight() if options.coalesce_requests else None
+        self.cache = options.cache
+        self.hedger = Hedger(options.hedge) if options.hedge else None
+        self.concurrency = (
+            AdaptiveLimiter(options.concurrency) if options.concurrency else None
+        )
+        self.page_size = options.page_size
+        self.client = client if client is not None else self._create_client()
+        # NOTE: a pool passed by the caller is closed by the caller
+        self._owns_client = client is None
+        self._entered = 0
         self.accounts = AccountsEndpoint(self)
         self.users = UsersEndpoint(self)
         self.hosted = HostedEndpoint(self)
@@ -80,7 +170,7 @@ class BaseClient:
 
     @property
     def client(self) -> httpx.Client | httpx.AsyncClient:
-        return self._clients[-1]
+        return self._client
 
     @client.setter
     def client(self, client: httpx.Client | httpx.AsyncClient) -> None:
@@ -94,7 +184,20 @@ class BaseClient:
         )
         if self.options.auth:
             client.headers["X-API-KEY"] = self.options.auth
-        self._clients.append(client)
+        self._client = client
+
+    @abstractmethod
+    def _create_client(self) -> httpx.Client | httpx.AsyncClient:
+        """
+        Create the inner HTTP client configured from client options.
+        """
+
+    def _limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.options.max_connections,
+            max_keepalive_connections=self.options.max_keepalive_connections,
+            keepalive_expiry=self.options.keepalive_expiry,
+        )
 
     def _build_request(
         self,
@@ -105,31 +208,215 @@ class BaseClient:
     ) -> Request:
         headers = httpx.Headers()
         self.logger.info(f"{method} {self.client.base_url}{path}")
-        self.logger.debug(f"=> {query} -- {body}")
-        return self.client.build_request(method, path, params=query, json=body, headers=headers)
+        self.logger.debug("=> %s -- %s", query, body)
+
+        content = None
+        if body is not None:
+            content = dumps(body)
+            headers["Content-Type"] = "application/json"
+        return self.client.build_request(
+            method, path, params=query, content=content, headers=headers
+        )
+
+    def _prepare_query(
+        self, query: dict[Any, Any] | None = None, **kwargs: str | None
+    ) -> dict[Any, Any] | None:
+        # If account_id passed (even None), means we need to generate query
+        # with account_id request
+        if "account_id" in kwargs:
+            query = dict(query or {})
+
+            # If no account_id passed try to use default one
+            query["account_id"] = self.resolve_account_id(kwargs["account_id"])
+
+        # Remove empty values
+        if query:
+            query = {k: v for k, v in query.items() if v is not None}
+
+        return query
 
-    def _parse_response(self, response: Response) -> dict:
+    @staticmethod
+    def _request_account_id(
+        query: dict[Any, Any] | None, body: dict[Any, Any] | None
+    ) -> str:
+        """
+        Account a request acts on, some endpoints expect it in body instead of query.
+        """
+        return (query or {}).get("account_id") or (body or {}).get("account_id") or ""
+
+    @staticmethod
+    def _request_key(
+        method: str, path: str, query: dict[Any, Any] | None
+    ) -> tuple[str, str, tuple[tuple[Any, Any], ...]]:
+        """
+        Identity of a request, account id is a part of query.
+        """
+        return method, path, tuple(sorted((query or {}).items()))
+
+    def _cache_key(
+        self,
+        endpoint: str | None,
+        method: str,
+        path: str,
+        query: dict[Any, Any] | None,
+        cache: CacheMode,
+    ) -> str | None:
+        """
+        Key of a cacheable request (GET of endpoint with a cache rule), otherwise `None`.
+        """
+        if self.cache is None or cache == "bypass" or method != "GET":
+            return None
+        if endpoint not in self.cache.rules:
+            return None
+        return f"{path}?{urlencode(sorted((query or {}).items()))}"
+
+    def _hedges(self, method: str, endpoint: str | None) -> bool:
+        return self.hedger is not None and method == "GET" and self.hedger.covers(endpoint)
+
+    def _can_hedge(self, account_id: str, action: RequestAction | None) -> bool:
+        """
+        Hedge spends account hedging budget and, like the request itself, its action budget.
+        """
+        if not self.hedger.try_hedge(account_id):
+            return False
+        return not action or self.rate_limiter.try_acquire(account_id, action)
+
+    def _first_response(
+        self,
+        done: set[Future[Response]] | set[asyncio.Task[Response]],
+        primary: Future[Response] | asyncio.Task[Response],
+        endpoint: str,
+        started: float,
+        errors: list[BaseException],
+    ) -> Response | None:
+        """
+        Response of the first successful attempt, errors of failed attempts are collected.
+        """
+        response = None
+        for attempt in done:
+            error = attempt.exception()
+            if error is not None:
+                errors.append(error)
+            elif response is None:
+                response = attempt.result()
+                latency = time.monotonic() - started
+                self.hedger.record(endpoint, latency, hedge_won=attempt is not primary)
+        return response
+
+    def _track_circuit(self, account_id: str) -> AbstractContextManager[None]:
+        if not account_id or self.breaker is None:
+            return nullcontext()
+        return self.breaker.track(account_id)
+
+    def _circuit_needs_probe(self, account_id: str) -> bool:
+        """
+        Fail locally if account circuit is open, `True` if account should be verified first.
+        """
+        if not account_id or self.breaker is None:
+            return False
+        return self.breaker.before_request(account_id)
+
+    def _check_account_sources(self, account_id: str, response: Response) -> None:
+        """
+        Every account source should be running, then breaker can let calls through.
+        """
+        statuses = {source.get("status") for source in response.json().get("sources", [])}
+        if statuses - {"OK"}:
+            raise LinkedinLoginError(
+                f"Failed to verify {account_id} account, sources statuses: {statuses}"
+            )
+
+        if self.breaker:
+            self.breaker.record_verified(account_id)
+
+    def resolve_account_id(self, account_id: str | None = None) -> str:
+        """
+        Get the account_id, using the default if not provided.
+        """
+        if not account_id:
+            if self.options.default_account_id:
+                return self.options.default_account_id
+
+            raise ValueError("account_id is required")
+
+        return account_id
+
+    def _raise_for_error(self, response: Response) -> None:
         try:
             response.raise_for_status()
         except httpx.HTTPStatusError as error:
             try:
                 body = error.response.json()
-                type = APIErrorTypes[response.status_code]
+            except json.JSONDecodeError as e:
+                raise HTTPResponseError(error.response) from e
 
-                # NOTE: verify auth with specific error types
-                if body["type"] in ("errors/expired_credentials", "errors/disconnected_account"):
-                    raise LinkedinLoginError(
-                        f"Failed to verify account with response body: {body}"
-                    )
-                else:
-                    raise APIResponseError(response=response, type=type, body=body)
-            except json.JSONDecodeError:
-                raise HTTPResponseError(error.response)
+            error_type = body.get("type") if isinstance(body, dict) else None
 
-        body = response.json()
-        self.logger.debug(f"=> {body}")
+            # NOTE: verify auth with specific error types
+            if error_type in ("errors/expired_credentials", "errors/disconnected_account"):
+                raise LinkedinLoginError(
+                    f"Failed to verify account with response body: {body}"
+                ) from error
+
+            # Unknown statuses (e.g. gateway errors) or error types can't be classified
+            type = APIErrorTypes.get(response.status_code)
+            if type is None or error_type not in type._value2member_map_:
+                raise HTTPResponseError(error.response) from error
+
+            raise APIResponseError(response=response, type=type, body=body) from error
+
+    def _read_body(self, content: bytes, decode: bool) -> dict | bytes:
+        # NOTE: lazy log formatting, bodies can be large
+        if not decode:
+            self.logger.debug("=> %s", content)
+            return content
+
+        body = loads(content)
+        self.logger.debug("=> %s", body)
         return body
 
+    def _record_page_size(
+        self,
+        endpoint: str | None,
+        account_id: str,
+        query: dict[Any, Any] | None,
+        started: float,
+        response: Response | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        """
+        Report a page request to the page size tuner, requests without `limit` aren't pages.
+        """
+        limit = (query or {}).get("limit")
+        if self.page_size is None or endpoint is None or not limit:
+            return
+        payload = len(response.content) if response is not None else None
+        latency = time.monotonic() - started
+        self.page_size.record(endpoint, account_id, int(limit), latency, payload, error)
+
+    def _should_retry(self, method: str, idempotent: bool | None) -> bool:
+        return self.options.retry is not None and self.options.retry.should_retry(
+            method, idempotent
+        )
+
+    def _retry_delay(
+        self, error: HTTPResponseError | RequestTimeoutError, attempt: int, retry: bool
+    ) -> float | None:
+        """
+        Seconds to wait before retrying a failed attempt, `None` when error is final.
+        """
+        error.attempts = attempt
+        policy = self.options.retry
+        if not retry or policy is None or attempt >= policy.max_attempts:
+            return None
+        if not policy.is_retryable(error):
+            return None
+
+        delay = policy.delay(attempt, error)
+        if delay is not None:
+            self.logger.warning(f"Attempt {attempt} failed with {error!r}, retry in {delay:.2f}s")
+        return delay
+
     @classmethod
     @abstractmethod
     def request(
@@ -144,12 +431,21 @@ class BaseClient:
         pass
 
 
+# Hedging workers of a `Client` without a connections limit
+_HEDGE_WORKERS = 100
+
+
 class Client(BaseClient):
     """
     Synchronous client for unipile's API.
     """
 
     client: httpx.Client
+    accounts: "AccountsEndpoint[Client]"
+    users: "UsersEndpoint[Client]"
+    hosted: "HostedEndpoint[Client]"
+    ln_search: "SearchEndpoint[Client]"
+    messages: "MessagesEndpoint[Client]"
 
     def __init__(
         self,
@@ -157,13 +453,23 @@ class Client(BaseClient):
         client: httpx.Client | None = None,
         **kwargs: Any,
     ) -> None:
-        if client is None:
-            client = httpx.Client(transport=httpx.HTTPTransport(retries=2))
         super().__init__(client, options, **kwargs)
+        self._hedge_pool: ThreadPoolExecutor | None = None
+
+    def _create_client(self) -> httpx.Client:
+        return httpx.Client(
+            transport=httpx.HTTPTransport(
+                retries=2, http2=self.options.http2, limits=self._limits()
+            )
+        )
 
     def __enter__(self) -> Self:
-        self.client = httpx.Client()
-        self.client.__enter__()
+        # NOTE: nested blocks reuse open connections, the outermost block closes the pool
+        # created by the client and a later block opens a new one. A pool passed by the
+        # caller stays open.
+        if self._owns_client and self.client.is_closed:
+            self.client = self._create_client()
+        self._entered += 1
         return self
 
     def __exit__(
@@ -172,8 +478,9 @@ class Client(BaseClient):
         exc_value: BaseException,
         traceback: TracebackType | None,
     ) -> None:
-        self.client.__exit__(exc_type, exc_value, traceback)
-        del self._clients[-1]
+        self._entered -= 1
+        if not self._entered and self._owns_client:
+            self.close()
 
     def _verify_connected_account(self, account_id: str) -> None:
         """
@@ -188,16 +495,23 @@ class Client(BaseClient):
             response = self.client.send(request)
             response.raise_for_status()
         except httpx.HTTPStatusError as e:
-            raise LinkedinLoginError(f"Failed to verify {account_id} account: {e.response.text}")
-        except httpx.TimeoutException:
-            raise RequestTimeoutError()
+            raise LinkedinLoginError(
+                f"Failed to verify {account_id} account: {e.response.text}"
+            ) from e
+        except httpx.TimeoutException as e:
+            raise RequestTimeoutError() from e
+
+        self._check_account_sources(account_id, response)
 
     def close(self) -> None:
         """
-        Close the connection pool of the current inner client.
+        Close the connection pool of the inner client.
         """
 
         self.client.close()
+        if self._hedge_pool is not None:
+            self._hedge_pool.shutdown(wait=False, cancel_futures=True)
+            self._hedge_pool = None
 
     def request(
         self,
@@ -205,51 +519,200 @@ class Client(BaseClient):
         method: str,
         query: dict[Any, Any] | None = None,
         body: dict[Any, Any] | None = None,
+        action: RequestAction | None = None,
+        idempotent: bool | None = None,
+        endpoint: str | None = None,
+        cache: CacheMode = "use",
+        decode: bool = True,
+        stream: bool = False,
+        raw: bool = False,
         **kwargs: str
-    ) -> dict:
+    ) -> dict | bytes | Response | RawResponse:
         """
         Send an HTTP request.
-        """
 
-        # If account_id passed (even None), means we need to generate query
-        # with account_id request
-        if "account_id" in kwargs:
-            if not query:
-                query = {}
+        `action` spends the account rate limit budget, `idempotent` overrides whether the
+        request is safe to retry (by default only idempotent HTTP methods are retried).
+        `endpoint` names the calling endpoint method for per-endpoint settings, like cache
+        rules, `cache` set to "bypass" or "refresh" skips reading the cached response.
+        Without `decode` the response body is returned as bytes, e.g. to validate it
+        directly into a model. With `stream` the response is returned as soon as its
+        headers are received and checked, before its body is read, it must be closed by
+        the caller. Streamed responses aren't cached, coalesced or hedged. With `raw` a
+        `RawResponse` is returned, see `request_raw()`.
+        """
 
-            # If no account_id passed try to use default one
-            if not kwargs["account_id"]:
-                query["account_id"] = self.resolve_account_id()
+        query = self._prepare_query(query, **kwargs)
+        account_id = self._request_account_id(query, body)
 
-        # Remove empty values
-        if query:
-            query = {k: v for k, v in query.items() if v is not None}
-
-        # Do actual request
-        request = self._build_request(method, path, query, body)
+        cache_key = None if stream else self._cache_key(endpoint, method, path, query, cache)
+        if cache_key and endpoint is not None and cache == "use":
+            content = self.cache.get(endpoint, cache_key)
+            if content is not None:
+                if raw:
+                    return RawResponse.cached(content)
+                return self._read_body(content, decode)
 
-        try:
-            response = self.client.send(request)
-        except httpx.TimeoutException:
-            raise RequestTimeoutError()
-
-        # TODO: implement, Verify that the account is still connected
-        # if response.is_error and query and query.get("account_id"):
-        #     self._verify_connected_account(query["account_id"])
+        # Verify that the account is connected again, before the circuit trial call
+        if self._circuit_needs_probe(account_id):
+            try:
+                self._verify_connected_account(account_id)
+            except LinkedinLoginError as e:
+                self.breaker.record_failure(account_id)
+                raise CircuitOpenError(account_id, self.breaker.cooldown) from e
+            except BaseException:
+                # NOTE: the account wasn't verified (timeout...), the next call is a new trial
+                self.breaker.release_trial(account_id)
+                raise
+
+        def send() -> Response:
+            if action:
+                self.rate_limiter.acquire(account_id, action)
+
+            # Do actual request
+            request = self._build_request(method, path, query, body)
+            retry = self._should_retry(method, idempotent)
+            started = time.monotonic()
+            try:
+                if endpoint is not None and self._hedges(method, endpoint) and not stream:
+                    response = self._send_hedged(request, retry, endpoint, account_id, action)
+                else:
+                    response = self._send(
+                        request, retry, stream, account_id=account_id, action=action
+                    )
+            except Exception as e:
+                self._record_page_size(endpoint, account_id, query, started, error=e)
+                raise
+            if not stream:
+                self._record_page_size(endpoint, account_id, query, started, response)
+            if cache_key and endpoint is not None:
+                self.cache.set(endpoint, cache_key, response.content)
+            return response
+
+        # NOTE: callers share response bytes, each one gets its own decoded body
+        with self._track_circuit(account_id):
+            if self.singleflight and method == "GET" and not stream:
+                response = self.singleflight.do(self._request_key(method, path, query), send)
+            else:
+                response = send()
+        if raw:
+            return RawResponse(response, None if stream else response.content)
+        if stream:
+            return response
+        return self._read_body(response.content, decode)
+
+    def request_raw(
+        self,
+        path: str,
+        method: str,
+        query: dict[Any, Any] | None = None,
+        body: dict[Any, Any] | None = None,
+        stream: bool = False,
+        **kwargs: Any
+    ) -> RawResponse:
+        """
+        Send an HTTP request and return its status, headers and undecoded body, e.g. to
+        proxy unipile responses. Errors are raised like in `request()`, the body of a
+        successful response is never decoded. With `stream` the body isn't read either,
+        the response must be closed by the caller.
+        """
 
-        return self._parse_response(response)
+        response = self.request(path, method, query, body, stream=stream, raw=True, **kwargs)
+        return cast(RawResponse, response)
 
-    def resolve_account_id(self, account_id: str | None = None) -> str:
+    def _send(
+        self,
+        request: Request,
+        retry: bool = False,
+        stream: bool = False,
+        account_id: str = "",
+        action: RequestAction | None = None,
+    ) -> Response:
         """
-        Get the account_id, using the default if not provided.
+        Send a request, retrying transient errors according to the retry policy. The caller
+        spends the `action` budget of the first attempt, every retry spends it again.
         """
-        if not account_id:
-            if self.options.default_account_id:
-                return self.options.default_account_id
-
-            raise ValueError("account_id is required")
+        attempt = 1
+        while True:
+            try:
+                return self._send_once(request, stream)
+            except (HTTPResponseError, RequestTimeoutError) as error:
+                delay = self._retry_delay(error, attempt, retry)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                attempt += 1
+            if action:
+                self.rate_limiter.acquire(account_id, action)
+
+    def _send_hedged(
+        self,
+        request: Request,
+        retry: bool,
+        endpoint: str,
+        account_id: str,
+        action: RequestAction | None,
+    ) -> Response:
+        """
+        Send a request and, when it's slower than the hedging delay, the same request again
+        from another thread. A thread can't be interrupted, so the losing request runs to
+        completion in background and its response is dropped.
+        """
+        delay = self.hedger.delay(endpoint, account_id)
+        if delay is None:
+            started = time.monotonic()
+            response = self._send(request, retry, account_id=account_id, action=action)
+            self.hedger.record(endpoint, time.monotonic() - started)
+            return response
+
+        if self._hedge_pool is None:
+            # NOTE: a worker per pooled connection, requests beyond it would wait for one
+            self._hedge_pool = ThreadPoolExecutor(
+                self.options.max_connections or _HEDGE_WORKERS, thread_name_prefix="unipile-hedge"
+            )
+
+        sent: Future[float] = Future()
+
+        def send_primary() -> Response:
+            sent.set_result(time.monotonic())
+            return self._send(request, retry, account_id=account_id, action=action)
+
+        # NOTE: the delay runs from the moment the primary request is sent, time spent
+        # waiting for a free worker doesn't trigger hedges nor count as latency
+        primary = self._hedge_pool.submit(send_primary)
+        first: list[Future[Any]] = [sent, primary]
+        wait(first, return_when=FIRST_COMPLETED)
+        started = sent.result() if sent.done() else time.monotonic()
+        done, pending = wait({primary}, timeout=delay)
+        if pending and self._can_hedge(account_id, action):
+            self.logger.info(f"No response after {delay:.2f}s, hedging {request.url}")
+            hedge = self._hedge_pool.submit(
+                self._send, request, retry, account_id=account_id, action=action
+            )
+            pending.add(hedge)
+
+        errors: list[BaseException] = []
+        while True:
+            response = self._first_response(done, primary, endpoint, started, errors)
+            if response is not None:
+                for attempt in pending:
+                    attempt.cancel()
+                return response
+            if not pending:
+                raise errors[0]
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+    def _send_once(self, request: Request, stream: bool = False) -> Response:
+        with self.concurrency.slot() if self.concurrency else nullcontext():
+            try:
+                response = self.client.send(request, stream=stream)
+                if stream and response.is_error:
+                    response.read()
+            except httpx.TimeoutException as e:
+                raise RequestTimeoutError() from e
 
-        return account_id
+            self._raise_for_error(response)
+        return response
 
 
 class AsyncClient(BaseClient):
@@ -258,6 +721,12 @@ class AsyncClient(BaseClient):
     """
 
     client: httpx.AsyncClient
+    accounts: "AccountsEndpoint[AsyncClient]"
+    users: "UsersEndpoint[AsyncClient]"
+    hosted: "HostedEndpoint[AsyncClient]"
+    ln_search: "SearchEndpoint[AsyncClient]"
+    messages: "MessagesEndpoint[AsyncClient]"
+    is_async = True
 
     def __init__(
         self,
@@ -265,13 +734,22 @@ class AsyncClient(BaseClient):
         client: httpx.AsyncClient | None = None,
         **kwargs: Any,
     ) -> None:
-        if client is None:
-            client = httpx.AsyncClient()
         super().__init__(client, options, **kwargs)
 
+    def _create_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(
+                retries=2, http2=self.options.http2, limits=self._limits()
+            )
+        )
+
     async def __aenter__(self) -> Self:
-        self.client = httpx.AsyncClient()
-        await self.client.__aenter__()
+        # NOTE: nested blocks reuse open connections, the outermost block closes the pool
+        # created by the client and a later block opens a new one. A pool passed by the
+        # caller stays open.
+        if self._owns_client and self.client.is_closed:
+            self.client = self._create_client()
+        self._entered += 1
         return self
 
     async def __aexit__(
@@ -280,12 +758,34 @@ class AsyncClient(BaseClient):
         exc_value: BaseException,
         traceback: TracebackType | None,
     ) -> None:
-        await self.client.__aexit__(exc_type, exc_value, traceback)
-        del self._clients[-1]
+        self._entered -= 1
+        if not self._entered and self._owns_client:
+            await self.aclose()
+
+    async def _verify_connected_account(self, account_id: str) -> None:
+        """
+        Verify Linkedin account by checking if we have it in unipile database.
+        """
+        request = self._build_request(
+            "GET",
+            f"accounts/{account_id}",
+        )
+
+        try:
+            response = await self.client.send(request)
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            raise LinkedinLoginError(
+                f"Failed to verify {account_id} account: {e.response.text}"
+            ) from e
+        except httpx.TimeoutException as e:
+            raise RequestTimeoutError() from e
+
+        self._check_account_sources(account_id, response)
 
     async def aclose(self) -> None:
         """
-        Close the connection pool of the current inner client.
+        Close the connection pool of the inner client.
         """
 
         await self.client.aclose()
@@ -296,15 +796,185 @@ class AsyncClient(BaseClient):
         method: str,
         query: dict[Any, Any] | None = None,
         body: dict[Any, Any] | None = None,
-        auth: str | None = None,
-    ) -> Any:
+        action: RequestAction | None = None,
+        idempotent: bool | None = None,
+        endpoint: str | None = None,
+        cache: CacheMode = "use",
+        decode: bool = True,
+        stream: bool = False,
+        raw: bool = False,
+        **kwargs: str
+    ) -> dict | bytes | Response | RawResponse:
         """
         Send an HTTP request asynchronously.
+
+        `action` spends the account rate limit budget, `idempotent` overrides whether the
+        request is safe to retry (by default only idempotent HTTP methods are retried).
+        `endpoint` names the calling endpoint method for per-endpoint settings, like cache
+        rules, `cache` set to "bypass" or "refresh" skips reading the cached response.
+        Without `decode` the response body is returned as bytes, e.g. to validate it
+        directly into a model. With `stream` the response is returned as soon as its
+        headers are received and checked, before its body is read, it must be closed by
+        the caller. Streamed responses aren't cached, coalesced or hedged. With `raw` a
+        `RawResponse` is returned, see `request_raw()`.
+        """
+
+        query = self._prepare_query(query, **kwargs)
+        account_id = self._request_account_id(query, body)
+
+        cache_key = None if stream else self._cache_key(endpoint, method, path, query, cache)
+        if cache_key and endpoint is not None and cache == "use":
+            content = self.cache.get(endpoint, cache_key)
+            if content is not None:
+                if raw:
+                    return RawResponse.cached(content)
+                return self._read_body(content, decode)
+
+        # Verify that the account is connected again, before the circuit trial call
+        if self._circuit_needs_probe(account_id):
+            try:
+                await self._verify_connected_account(account_id)
+            except LinkedinLoginError as e:
+                self.breaker.record_failure(account_id)
+                raise CircuitOpenError(account_id, self.breaker.cooldown) from e
+            except BaseException:
+                # NOTE: the account wasn't verified (timeout...), the next call is a new trial
+                self.breaker.release_trial(account_id)
+                raise
+
+        async def send() -> Response:
+            if action:
+                await self.rate_limiter.aacquire(account_id, action)
+
+            request = self._build_request(method, path, query, body)
+            retry = self._should_retry(method, idempotent)
+            started = time.monotonic()
+            try:
+                if endpoint is not None and self._hedges(method, endpoint) and not stream:
+                    response = await self._send_hedged(
+                        request, retry, endpoint, account_id, action
+                    )
+                else:
+                    response = await self._send(
+                        request, retry, stream, account_id=account_id, action=action
+                    )
+            except Exception as e:
+                self._record_page_size(endpoint, account_id, query, started, error=e)
+                raise
+            if not stream:
+                self._record_page_size(endpoint, account_id, query, started, response)
+            if cache_key and endpoint is not None:
+                self.cache.set(endpoint, cache_key, response.content)
+            return response
+
+        # NOTE: callers share response bytes, each one gets its own decoded body
+        with self._track_circuit(account_id):
+            if self.singleflight and method == "GET" and not stream:
+                key = self._request_key(method, path, query)
+                response = await self.singleflight.ado(key, send)
+            else:
+                response = await send()
+        if raw:
+            return RawResponse(response, None if stream else response.content)
+        if stream:
+            return response
+        return self._read_body(response.content, decode)
+
+    async def request_raw(
+        self,
+        path: str,
+        method: str,
+        query: dict[Any, Any] | None = None,
+        body: dict[Any, Any] | None = None,
+        stream: bool = False,
+        **kwargs: Any
+    ) -> RawResponse:
         """
+        Send an HTTP request asynchronously and return its status, headers and undecoded
+        body, see `Client.request_raw()`.
+        """
+
+        response = await self.request(path, method, query, body, stream=stream, raw=True, **kwargs)
+        return cast(RawResponse, response)
 
-        request = self._build_request(method, path, query, body, auth)
+    async def _send(
+        self,
+        request: Request,
+        retry: bool = False,
+        stream: bool = False,
+        account_id: str = "",
+        action: RequestAction | None = None,
+    ) -> Response:
+        """
+        Send a request, retrying transient errors according to the retry policy. The caller
+        spends the `action` budget of the first attempt, every retry spends it again.
+        """
+        attempt = 1
+        while True:
+            try:
+                return await self._send_once(request, stream)
+            except (HTTPResponseError, RequestTimeoutError) as error:
+                delay = self._retry_delay(error, attempt, retry)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+            if action:
+                await self.rate_limiter.aacquire(account_id, action)
+
+    async def _send_hedged(
+        self,
+        request: Request,
+        retry: bool,
+        endpoint: str,
+        account_id: str,
+        action: RequestAction | None,
+    ) -> Response:
+        """
+        Send a request and, when it's slower than the hedging delay, the same request again.
+        The first response wins, the other request is cancelled.
+        """
+        started = time.monotonic()
+        delay = self.hedger.delay(endpoint, account_id)
+        if delay is None:
+            response = await self._send(request, retry, account_id=account_id, action=action)
+            self.hedger.record(endpoint, time.monotonic() - started)
+            return response
+
+        primary = asyncio.ensure_future(
+            self._send(request, retry, account_id=account_id, action=action)
+        )
+        attempts = {primary}
         try:
-            response = await self.client.send(request)
-        except httpx.TimeoutException:
-            raise RequestTimeoutError()
-        return self._parse_response(response)
+            done, pending = await asyncio.wait(attempts, timeout=delay)
+            if pending and self._can_hedge(account_id, action):
+                self.logger.info(f"No response after {delay:.2f}s, hedging {request.url}")
+                hedge = asyncio.ensure_future(
+                    self._send(request, retry, account_id=account_id, action=action)
+                )
+                attempts.add(hedge)
+                pending.add(hedge)
+
+            errors: list[BaseException] = []
+            while True:
+                response = self._first_response(done, primary, endpoint, started, errors)
+                if response is not None:
+                    return response
+                if not pending:
+                    raise errors[0]
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for attempt in attempts:
+                attempt.cancel()
+
+    async def _send_once(self, request: Request, stream: bool = False) -> Response:
+        async with self.concurrency.aslot() if self.concurrency else nullcontext():
+            try:
+                response = await self.client.send(request, stream=stream)
+                if stream and response.is_error:
+                    await response.aread()
+            except httpx.TimeoutException as e:
+                raise RequestTimeoutError() from e
+
+            self._raise_for_error(response)
+        return response
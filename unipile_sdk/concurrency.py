@@ -0,0 +1,201 @@
+"""
+Adaptive (AIMD) limit of in-flight requests.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Iterator
+
+from .errors import APIResponseError, HTTPResponseError, RequestTimeoutError
+from .models import ServiceUnavailableErrorType, TooManyRequestsErrorType
+
+OVERLOAD_STATUSES = frozenset({429, 503})
+
+# Blocked thread or task waiting for a free slot
+Waiter = threading.Event | tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]
+
+
+@dataclass
+class ConcurrencyPolicy:
+    """
+    Additive increase, multiplicative decrease of the number of in-flight requests.
+    Attributes:
+        initial_limit: Number of requests allowed in flight at start.
+        min_limit: Lower bound of the limit.
+        max_limit: Upper bound of the limit.
+        increase: Limit grows by this much per limit-worth of healthy responses (about
+            once per round trip when the limit is used up).
+        decrease: Limit is multiplied by this factor on overload.
+        latency_spike: A response slower than this multiple of the smoothed latency
+            counts as overload.
+        smoothing: Weight of a new sample in the smoothed latency.
+    """
+
+    initial_limit: int = 10
+    min_limit: int = 1
+    max_limit: int = 100
+    increase: float = 1.0
+    decrease: float = 0.5
+    latency_spike: float = 3.0
+    smoothing: float = 0.1
+
+
+def is_overload(error: BaseException) -> bool:
+    """
+    Unipile or the provider asks to slow down (429, 503), or the request timed out.
+    """
+    if isinstance(error, RequestTimeoutError):
+        return True
+    if isinstance(error, APIResponseError):
+        return isinstance(error.error, (TooManyRequestsErrorType, ServiceUnavailableErrorType))
+    return isinstance(error, HTTPResponseError) and error.status in OVERLOAD_STATUSES
+
+
+class AdaptiveLimiter:
+    """
+    Requests wait in FIFO order for a free slot, shared by all threads (or tasks) of
+    a client. The limit grows while responses are healthy and is cut on overload.
+    """
+
+    def __init__(
+        self, policy: ConcurrencyPolicy, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.policy = policy
+        self.clock = clock
+        self.in_flight = 0
+        self.latency: float | None = None
+        self._limit = float(policy.initial_limit)
+        self._decreased_at = clock()
+        self._waiters: deque[Waiter] = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    def _try_enter(self) -> bool:
+        if self._waiters or self.in_flight >= self.limit:
+            return False
+        self.in_flight += 1
+        return True
+
+    def _wake(self) -> None:
+        """
+        Hand free slots over to the waiters, lock must be held.
+        """
+        while self._waiters and self.in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if isinstance(waiter, threading.Event):
+                self.in_flight += 1
+                waiter.set()
+                continue
+
+            loop, future = waiter
+            if future.done():  # NOTE: waiting task was cancelled
+                continue
+            self.in_flight += 1
+            loop.call_soon_threadsafe(_grant, future, self)
+
+    def acquire(self) -> float:
+        """
+        Wait for a free slot, return the time the request started.
+        """
+        with self._lock:
+            if self._try_enter():
+                return self.clock()
+            event = threading.Event()
+            self._waiters.append(event)
+
+        event.wait()
+        return self.clock()
+
+    async def aacquire(self) -> float:
+        """
+        Wait for a free slot without blocking the event loop, return the time the
+        request started.
+        """
+        with self._lock:
+            if self._try_enter():
+                return self.clock()
+            future = asyncio.get_running_loop().create_future()
+            self._waiters.append((asyncio.get_running_loop(), future))
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            # NOTE: slot was granted, but the task was cancelled before it resumed
+            if future.done() and not future.cancelled():
+                self.release(None)
+            raise
+        return self.clock()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        started = self.acquire()
+        try:
+            yield
+        except BaseException as e:
+            self.release(started, e)
+            raise
+        self.release(started)
+
+    @asynccontextmanager
+    async def aslot(self) -> AsyncIterator[None]:
+        started = await self.aacquire()
+        try:
+            yield
+        except BaseException as e:
+            self.release(started, e)
+            raise
+        self.release(started)
+
+    def release(self, started: float | None, error: BaseException | None = None) -> None:
+        """
+        Free a slot and adapt the limit to the outcome of a request started at `started`.
+        `None` frees the slot without a sample, e.g. when a waiter gave up.
+        """
+        with self._lock:
+            self.in_flight -= 1
+            if started is not None:
+                self._adapt(started, error)
+            self._wake()
+
+    def _adapt(self, started: float, error: BaseException | None) -> None:
+        policy = self.policy
+        latency = self.clock() - started
+        overload = error is not None and is_overload(error)
+        if error is None:
+            if self.latency is not None and latency > policy.latency_spike * self.latency:
+                overload = True
+            self.latency = (
+                latency
+                if self.latency is None
+                else (1 - policy.smoothing) * self.latency + policy.smoothing * latency
+            )
+
+        if overload:
+            # NOTE: requests sent before the last cut report the same congestion, the
+            # limit is cut once per congestion event
+            if started >= self._decreased_at:
+                self._limit = max(policy.min_limit, self._limit * policy.decrease)
+                self._decreased_at = self.clock()
+            return
+
+        if error is None:
+            self._limit = min(policy.max_limit, self._limit + policy.increase / self._limit)
+
+
+def _grant(future: asyncio.Future[None], limiter: AdaptiveLimiter) -> None:
+    if future.cancelled():
+        # NOTE: task was cancelled after the slot was handed over, give it back
+        limiter.release(None)
+    else:
+        future.set_result(None)
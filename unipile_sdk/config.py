@@ -0,0 +1,17 @@
+"""
+Default page sizes of paginated endpoints, starting points of `PageSizeTuner` when one is
+configured.
+"""
+
+# Items per page of list endpoints (relations, chat attendees, messages, accounts)
+DEFAULT_PAGE_LIMIT = 100
+
+# Items per page of accounts counted by `AccountsEndpoint.duplicate_amount`
+DUPLICATE_AMOUNT_PAGE_LIMIT = 250
+
+# Leads per page of LinkedIn searches, pages of Sales Navigator searches are larger
+LINKEDIN_SEARCH_DEFAULT_LEADS_PER_PAGE = 10
+LINKEDIN_SEARCH_SALES_LEADS_PER_PAGE = 25
+
+# Maximum leads per page of a LinkedIn Classic search
+LINKEDIN_SEARCH_MAX_LEADS_PER_PAGE = 50
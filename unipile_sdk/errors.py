@@ -17,6 +17,7 @@ class RequestTimeoutError(Exception):
     """
 
     code = "notionhq_client_request_timeout"
+    attempts: int = 1  # Number of attempts made, including retries
 
     def __init__(self, message: str = "Request to Unipile API has timed out") -> None:
         super().__init__(message)
@@ -32,6 +33,7 @@ class HTTPResponseError(Exception):
     status: int
     headers: httpx.Headers
     body: str
+    attempts: int = 1  # Number of attempts made, including retries
 
     def __init__(self, response: httpx.Response, message: str | None = None) -> None:
         if message is None:
@@ -53,12 +55,27 @@ class APIResponseError(HTTPResponseError):
         type: Any,
         body: dict,
     ) -> None:
-        super().__init__(response, body["detail"])
+        super().__init__(response, body.get("detail"))
         self.title = body.get("title")
         self.instance = body.get("instance")
         self.error = type(body["type"])
 
 
+class RateLimitExceededError(Exception):
+    """
+    Local rate limit budget of an account action is exhausted.
+    """
+
+    def __init__(self, account_id: str, action: str, retry_after: float) -> None:
+        super().__init__(
+            f"Rate limit of {action} for {account_id} account exceeded, "
+            f"retry after {retry_after:.2f}s"
+        )
+        self.account_id = account_id
+        self.action = action
+        self.retry_after = retry_after
+
+
 class NoIdentifierToRetriveUser(Exception):
     """
     No identifier provided to retrieve user.
@@ -72,4 +89,17 @@ class LinkedinLoginError(Exception):
     An error related to Linkedin login.
     """
 
-    pass
\ No newline at end of file
+    pass
+
+
+class CircuitOpenError(LinkedinLoginError):
+    """
+    Calls of a disconnected account fail locally, until its circuit breaker closes.
+    """
+
+    def __init__(self, account_id: str, retry_after: float) -> None:
+        super().__init__(
+            f"Account {account_id} is disconnected, calls are blocked for {retry_after:.0f}s"
+        )
+        self.account_id = account_id
+        self.retry_after = retry_after
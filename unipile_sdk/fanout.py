@@ -0,0 +1,199 @@
+"""
+Concurrent pagination of an endpoint for many accounts, merged into one stream of items.
+"""
+
+import asyncio
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from queue import Full, Queue
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+)
+
+from .helpers import _async_read_page, _capped, _read_page
+
+# Seconds between checks that the consumer is still reading, while the buffer is full
+_PUT_TIMEOUT = 0.1
+
+
+class AccountItem(NamedTuple):
+    account_id: str
+    item: Any
+
+
+class AccountFanOut:
+    """
+    Paginate an endpoint for many accounts concurrently, e.g. the relations of every
+    account:
+
+    fan_out = AccountFanOut(max_concurrency=20)
+    for account_id, relation in fan_out.paginate(client.users.relations, account_ids):
+        ...
+
+    `max_concurrency` bounds the requests in flight of all accounts, `per_account` those
+    of one account. Limits are shared by the crawls of the instance, e.g. relations and
+    chat attendees paginated at the same time. Pages of one account are fetched in order,
+    items of different accounts are interleaved as their pages arrive. At most `buffer`
+    pages wait for the consumer before crawls pause.
+
+    An account failing (e.g. disconnected) raises its error to the consumer, unless
+    `on_error` is set, then the error is reported and the other accounts continue.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 10,
+        per_account: int = 1,
+        buffer: int = 100,
+        on_error: Callable[[str, Exception], None] | None = None,
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self.per_account = per_account
+        self.buffer = buffer
+        self.on_error = on_error
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._account_slots: dict[str, threading.BoundedSemaphore] = {}
+        self._async_limits: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop,
+            tuple[asyncio.Semaphore, dict[str, asyncio.Semaphore]],
+        ] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _slot(self, account_id: str) -> Iterator[None]:
+        with self._lock:
+            account_slots = self._account_slots.setdefault(
+                account_id, threading.BoundedSemaphore(self.per_account)
+            )
+        with account_slots, self._slots:
+            yield
+
+    @asynccontextmanager
+    async def _async_slot(self, account_id: str) -> AsyncIterator[None]:
+        # NOTE: asyncio semaphores are bound to the event loop they're used on
+        loop = asyncio.get_running_loop()
+        if loop not in self._async_limits:
+            self._async_limits[loop] = (asyncio.Semaphore(self.max_concurrency), {})
+        slots, account_slots = self._async_limits[loop]
+        if account_id not in account_slots:
+            account_slots[account_id] = asyncio.Semaphore(self.per_account)
+        async with account_slots[account_id], slots:
+            yield
+
+    def paginate(
+        self, function: Callable[..., Any], account_ids: Iterable[str], **kwargs: Any
+    ) -> Generator[AccountItem, None, None]:
+        """
+        Items of every account, keyword arguments are passed to `function`. With
+        `max_total` at most that many items are returned per account.
+        """
+        max_total = kwargs.pop("max_total", None)
+        pages: Queue[tuple[str, List[Any] | None, Exception | None]] = Queue(self.buffer)
+        stopped = threading.Event()
+
+        def put(entry: tuple[str, List[Any] | None, Exception | None]) -> None:
+            while not stopped.is_set():
+                try:
+                    pages.put(entry, timeout=_PUT_TIMEOUT)
+                    return
+                except Full:
+                    continue
+
+        def crawl(account_id: str) -> None:
+            error = None
+            try:
+                cursor, items_found = None, 0
+                while not stopped.is_set():
+                    with self._slot(account_id):
+                        page = function(**kwargs, account_id=account_id, cursor=cursor)
+                        items, cursor = _read_page(page)
+                    items, items_found, last = _capped(items, items_found, cursor, max_total)
+                    put((account_id, items, None))
+                    if last:
+                        break
+            except Exception as e:
+                error = e
+            put((account_id, None, error))
+
+        account_ids = list(dict.fromkeys(account_ids))
+        pool = ThreadPoolExecutor(self.max_concurrency, thread_name_prefix="unipile-fan-out")
+        for account_id in account_ids:
+            pool.submit(crawl, account_id)
+        try:
+            remaining = len(account_ids)
+            while remaining:
+                account_id, items, error = pages.get()
+                if items is None:
+                    remaining -= 1
+                    self._failed(account_id, error)
+                    continue
+                for item in items:
+                    yield AccountItem(account_id, item)
+        finally:
+            stopped.set()
+            # NOTE: requests in flight finish, their crawls stop before the next page
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    async def async_paginate(
+        self,
+        function: Callable[..., Any],
+        account_ids: Iterable[str],
+        **kwargs: Any,
+    ) -> AsyncGenerator[AccountItem, None]:
+        """
+        Items of every account, paginated by tasks, see `paginate()`.
+        """
+        max_total = kwargs.pop("max_total", None)
+        pages: asyncio.Queue[tuple[str, List[Any] | None, Exception | None]] = asyncio.Queue(
+            self.buffer
+        )
+
+        async def crawl(account_id: str) -> None:
+            error = None
+            try:
+                cursor, items_found = None, 0
+                while True:
+                    async with self._async_slot(account_id):
+                        page = function(**kwargs, account_id=account_id, cursor=cursor)
+                        items, cursor = await _async_read_page(page)
+                    items, items_found, last = _capped(items, items_found, cursor, max_total)
+                    await pages.put((account_id, items, None))
+                    if last:
+                        break
+            except Exception as e:
+                error = e
+            await pages.put((account_id, None, error))
+
+        account_ids = list(dict.fromkeys(account_ids))
+        tasks = [asyncio.create_task(crawl(account_id)) for account_id in account_ids]
+        try:
+            remaining = len(tasks)
+            while remaining:
+                account_id, items, error = await pages.get()
+                if items is None:
+                    remaining -= 1
+                    self._failed(account_id, error)
+                    continue
+                for item in items:
+                    yield AccountItem(account_id, item)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _failed(self, account_id: str, error: Exception | None) -> None:
+        if error is None:
+            return
+        if self.on_error is None:
+            raise error
+        self.on_error(account_id, error)
@@ -0,0 +1,97 @@
+"""
+Hedging of slow idempotent GET requests.
+"""
+
+import math
+import threading
+from collections import deque
+from dataclasses import dataclass
+
+
+@dataclass
+class HedgePolicy:
+    """
+    When a GET request gets no response after a delay, send a second identical request
+    and use the response which arrives first, the other one is cancelled.
+    Attributes:
+        delay: Number of seconds to wait before hedging, `None` uses the observed latency
+            `percentile` of the endpoint.
+        percentile: Percentile of endpoint latencies used as the delay, e.g. 0.95 hedges
+            about 5% of requests.
+        min_samples: Number of observed latencies required before hedging on percentile.
+        window: Number of most recent latencies kept per endpoint.
+        budget: Hedges allowed per request of an account, so hedging adds at most this
+            fraction of extra requests to its quota consumption.
+        burst: Maximum number of hedges an account can save up while its requests are fast.
+        endpoints: Names of hedged endpoints (e.g. `users.retrieve`), `None` hedges every
+            GET endpoint.
+    """
+
+    delay: float | None = None
+    percentile: float = 0.95
+    min_samples: int = 20
+    window: int = 200
+    budget: float = 0.1
+    burst: float = 2.0
+    endpoints: set[str] | None = None
+
+
+class Hedger:
+    """
+    Observed latencies per endpoint and hedging budget per account, shared by all threads
+    (or tasks) of a client.
+    """
+
+    def __init__(self, policy: HedgePolicy) -> None:
+        self.policy = policy
+        self.hedged = 0
+        self.wins = 0
+        self._latencies: dict[str, deque[float]] = {}
+        self._budgets: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def covers(self, endpoint: str | None) -> bool:
+        endpoints = self.policy.endpoints
+        return endpoint is not None and (endpoints is None or endpoint in endpoints)
+
+    def delay(self, endpoint: str, account_id: str) -> float | None:
+        """
+        Seconds to wait before hedging a request of endpoint, `None` until enough latencies
+        are observed. Every request earns its account a part of a hedge.
+        """
+        with self._lock:
+            budget = self._budgets.get(account_id, self.policy.burst)
+            self._budgets[account_id] = min(self.policy.burst, budget + self.policy.budget)
+
+            if self.policy.delay is not None:
+                return self.policy.delay
+
+            latencies = self._latencies.get(endpoint)
+            if latencies is None or len(latencies) < self.policy.min_samples:
+                return None
+
+            ordered = sorted(latencies)
+            rank = math.ceil(self.policy.percentile * len(ordered))
+            return ordered[min(len(ordered), max(rank, 1)) - 1]
+
+    def try_hedge(self, account_id: str) -> bool:
+        """
+        Spend a hedge of account budget, `False` when it's exhausted.
+        """
+        with self._lock:
+            budget = self._budgets.get(account_id, self.policy.burst)
+            if budget < 1:
+                return False
+
+            self._budgets[account_id] = budget - 1
+            self.hedged += 1
+            return True
+
+    def record(self, endpoint: str, latency: float, hedge_won: bool = False) -> None:
+        with self._lock:
+            latencies = self._latencies.get(endpoint)
+            if latencies is None:
+                latencies = self._latencies[endpoint] = deque(maxlen=self.policy.window)
+            latencies.append(latency)
+            if hedge_won:
+                self.wins += 1
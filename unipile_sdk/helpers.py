@@ -2,10 +2,17 @@
 Utility functions
 """
 
-from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, Generator, List
+import asyncio
+import threading
+from inspect import isawaitable
+from queue import SimpleQueue
+from typing import Any, AsyncGenerator, Callable, Dict, Generator, List
 from urllib.parse import urlparse
 from uuid import UUID
 
+from .checkpoints import Checkpoint, CheckpointStore
+from .streaming import AsyncItemStream, ItemStream
+
 
 def pick(base: Dict[Any, Any], *keys: str) -> Dict[Any, Any]:
     """Return a dict composed of key value pairs for keys passed as args."""
@@ -20,28 +27,116 @@ def pick(base: Dict[Any, Any], *keys: str) -> Dict[Any, Any]:
     return result
 
 
+def page_of(response: Any) -> tuple[List[Any], str | None]:
+    """Return items and next cursor of a page, a model or a plain dict."""
+    if isinstance(response, dict):
+        return response["items"], response.get("cursor")
+    return response.items, response.cursor
+
+
+def _capped(
+    items: List[Any], items_found: int, cursor: str | None, max_total: int | None
+) -> tuple[List[Any], int, bool]:
+    """Items of a page up to `max_total`, the new count and whether it's the last page."""
+    if max_total is not None:
+        items = items[: max_total - items_found]
+    items_found += len(items)
+    return items, items_found, not cursor or (max_total is not None and items_found >= max_total)
+
+
 def iterate_paginated_api(
     function: Callable[..., Any], **kwargs: Any
 ) -> Generator[Any, None, None]:
-    """Return an iterator over the results of any paginated Unipile API."""
+    """
+    Return an iterator over the results of any paginated Unipile API.
+
+    At most `max_total` items are returned (100 by default), keyword arguments are passed
+    to `function`, e.g. `iterate_paginated_api(client.messages.messages, chat_id=chat_id)`.
+    With `prefetch` set, up to `prefetch` next pages are fetched by a background thread
+    while the items of the current page are consumed. Fetching stops once `max_total`
+    items are found or when the iterator is closed.
+    """
     next_cursor = kwargs.pop("cursor", None)
     max_total = kwargs.pop("max_total", 100)
+    prefetch = kwargs.pop("prefetch", 0)
     items_found = 0
 
+    if prefetch > 0:
+        yield from _prefetched_items(function, kwargs, next_cursor, max_total, prefetch)
+        return
+
     while True:
         # TODO: add random delays?
         response = function(**kwargs, cursor=next_cursor)
+        if isinstance(response, ItemStream):
+            # NOTE: closed when the consumer stops early, the rest of the body isn't read
+            with response:
+                for result in response:
+                    yield result
+                    items_found += 1
+                    if items_found >= max_total:
+                        return
+            next_cursor = response.cursor
+            if not next_cursor:
+                break
+            continue
 
-        # WARN: use pydantic mode here, when we convert search resuts to
-        # pydantic model cusor/items
-        next_cursor = response.cursor
+        items, next_cursor = page_of(response)
+        items, items_found, last = _capped(items, items_found, next_cursor, max_total)
+        yield from items
+        if last:
+            break
 
-        items_found += len(response.items)
-        for result in response.items:
-            yield result
 
-        if items_found >= max_total or not next_cursor:
-            break
+def _read_page(response: Any) -> tuple[List[Any], str | None]:
+    if isinstance(response, ItemStream):
+        with response:
+            return list(response), response.cursor
+    return page_of(response)
+
+
+def _prefetched_items(
+    function: Callable[..., Any],
+    kwargs: Dict[str, Any],
+    next_cursor: str | None,
+    max_total: int,
+    depth: int,
+) -> Generator[Any, None, None]:
+    """Items of pages fetched by a thread, at most `depth` pages ahead of the consumer."""
+    pages: SimpleQueue[tuple[List[Any], Exception | None, bool]] = SimpleQueue()
+    # NOTE: a credit is returned once a page is consumed, the first page needs one too
+    credits = threading.Semaphore(depth + 1)
+    stopped = threading.Event()
+
+    def fetch() -> None:
+        cursor, items_found = next_cursor, 0
+        try:
+            while True:
+                credits.acquire()
+                if stopped.is_set():
+                    return
+                items, cursor = _read_page(function(**kwargs, cursor=cursor))
+                items, items_found, last = _capped(items, items_found, cursor, max_total)
+                pages.put((items, None, last))
+                if last:
+                    return
+        except Exception as e:
+            pages.put(([], e, True))
+
+    # NOTE: a request in flight can't be interrupted, the thread exits once it's done
+    threading.Thread(target=fetch, name="unipile-prefetch", daemon=True).start()
+    try:
+        while True:
+            items, error, last = pages.get()
+            if error is not None:
+                raise error
+            yield from items
+            if last:
+                break
+            credits.release()
+    finally:
+        stopped.set()
+        credits.release()
 
 
 def collect_paginated_api(function: Callable[..., Any], **kwargs: Any) -> List[Any]:
@@ -50,28 +145,167 @@ def collect_paginated_api(function: Callable[..., Any], **kwargs: Any) -> List[A
 
 
 async def async_iterate_paginated_api(
-    function: Callable[..., Awaitable[Any]], **kwargs: Any
+    function: Callable[..., Any], **kwargs: Any
 ) -> AsyncGenerator[Any, None]:
-    """Return an async iterator over the results of any paginated Unipile API."""
+    """
+    Return an async iterator over the results of any paginated Unipile API, with
+    `max_total` and `prefetch` like `iterate_paginated_api`. Pages are only requested
+    as items are consumed (or `prefetch` pages ahead), so slow consumers hold back their
+    crawl and many crawls can share one event loop.
+    """
     next_cursor = kwargs.pop("cursor", None)
+    max_total = kwargs.pop("max_total", 100)
+    prefetch = kwargs.pop("prefetch", 0)
+    items_found = 0
+
+    if prefetch > 0:
+        prefetched = _async_prefetched_items(function, kwargs, next_cursor, max_total, prefetch)
+        try:
+            async for result in prefetched:
+                yield result
+        finally:
+            await prefetched.aclose()
+        return
 
     while True:
-        response = await function(**kwargs, cursor=next_cursor)
-        for result in response.get("results"):
+        response = function(**kwargs, cursor=next_cursor)
+        if isinstance(response, AsyncItemStream):
+            async with response:
+                async for result in response:
+                    yield result
+                    items_found += 1
+                    if items_found >= max_total:
+                        return
+            next_cursor = response.cursor
+            if not next_cursor:
+                break
+            continue
+
+        items, next_cursor = page_of(await response)
+        items, items_found, last = _capped(items, items_found, next_cursor, max_total)
+        for result in items:
             yield result
+        if last:
+            break
+
 
-        next_cursor = response.get("cursor")
-        if next_cursor is None:
-            return
+async def _async_read_page(response: Any) -> tuple[List[Any], str | None]:
+    if isinstance(response, AsyncItemStream):
+        async with response:
+            return [item async for item in response], response.cursor
+    return page_of(await response)
+
+
+async def _async_prefetched_items(
+    function: Callable[..., Any],
+    kwargs: Dict[str, Any],
+    next_cursor: str | None,
+    max_total: int,
+    depth: int,
+) -> AsyncGenerator[Any, None]:
+    """Items of pages fetched by a task, at most `depth` pages ahead of the consumer."""
+    pages: asyncio.Queue[tuple[List[Any], Exception | None, bool]] = asyncio.Queue()
+    credits = asyncio.Semaphore(depth + 1)
+
+    async def fetch() -> None:
+        cursor, items_found = next_cursor, 0
+        try:
+            while True:
+                await credits.acquire()
+                items, cursor = await _async_read_page(function(**kwargs, cursor=cursor))
+                items, items_found, last = _capped(items, items_found, cursor, max_total)
+                pages.put_nowait((items, None, last))
+                if last:
+                    return
+        except Exception as e:
+            pages.put_nowait(([], e, True))
+
+    task = asyncio.create_task(fetch())
+    try:
+        while True:
+            items, error, last = await pages.get()
+            if error is not None:
+                raise error
+            for result in items:
+                yield result
+            if last:
+                break
+            credits.release()
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
 
 
 async def async_collect_paginated_api(
-    function: Callable[..., Awaitable[Any]], **kwargs: Any
+    function: Callable[..., Any], **kwargs: Any
 ) -> List[Any]:
     """Collect asynchronously all the results of paginating an API into a list."""
     return [result async for result in async_iterate_paginated_api(function, **kwargs)]
 
 
+def paginate_with_checkpoints(
+    function: Callable[..., Any],
+    store: CheckpointStore,
+    key: str,
+    commit: Callable[[List[Any], Checkpoint], None],
+    **kwargs: Any,
+) -> Checkpoint:
+    """
+    Paginate an API, resuming from the last checkpoint of `key` saved in `store`.
+
+    The items of each page are passed to `commit` and the page's checkpoint is saved
+    once it returns, so a committed page isn't fetched again after a crash, while a page
+    that failed to commit is. A crash between `commit` and the save replays that page,
+    with the same `Checkpoint.pages` number, so `commit` can skip it. Without `max_total`
+    the whole list is exported. Returns the last checkpoint, delete it to start over.
+    """
+    max_total = kwargs.pop("max_total", None)
+    checkpoint = store.load(key) or Checkpoint(cursor=kwargs.pop("cursor", None))
+    kwargs.pop("cursor", None)
+
+    while not checkpoint.done:
+        items, next_cursor = _read_page(function(**kwargs, cursor=checkpoint.cursor))
+        items, checkpoint = _committed_page(checkpoint, items, next_cursor, max_total)
+        commit(items, checkpoint)
+        store.save(key, checkpoint)
+    return checkpoint
+
+
+async def async_paginate_with_checkpoints(
+    function: Callable[..., Any],
+    store: CheckpointStore,
+    key: str,
+    commit: Callable[[List[Any], Checkpoint], Any],
+    **kwargs: Any,
+) -> Checkpoint:
+    """
+    Paginate asynchronously an API with checkpoints like `paginate_with_checkpoints`,
+    `commit` may be a coroutine function.
+    """
+    max_total = kwargs.pop("max_total", None)
+    checkpoint = store.load(key) or Checkpoint(cursor=kwargs.pop("cursor", None))
+    kwargs.pop("cursor", None)
+
+    while not checkpoint.done:
+        items, next_cursor = await _async_read_page(function(**kwargs, cursor=checkpoint.cursor))
+        items, checkpoint = _committed_page(checkpoint, items, next_cursor, max_total)
+        committed = commit(items, checkpoint)
+        if isawaitable(committed):
+            await committed
+        store.save(key, checkpoint)
+    return checkpoint
+
+
+def _committed_page(
+    checkpoint: Checkpoint, items: List[Any], next_cursor: str | None, max_total: int | None
+) -> tuple[List[Any], Checkpoint]:
+    """Items of a fetched page, up to `max_total`, and the checkpoint saved after it."""
+    items, total, done = _capped(items, checkpoint.items, next_cursor, max_total)
+    return items, Checkpoint(
+        cursor=next_cursor, pages=checkpoint.pages + 1, items=total, done=done
+    )
+
+
 def is_full_block(response: Dict[Any, Any]) -> bool:
     """Return `True` if response is a full block."""
     return response.get("object") == "block" and "type" in response
@@ -0,0 +1,163 @@
+"""
+Interning of strings repeated across responses (account ids, companies, locations...).
+"""
+
+import sys
+import threading
+import types
+from functools import cache
+from typing import Annotated, Any, Callable, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+from . import models
+from .models.lazy import Deferred
+
+# Interns strings of a decoded JSON object or of a model's `__dict__` in place
+Pass = Callable[[dict[str, Any]], None]
+
+
+@cache
+def default_fields() -> dict[type[BaseModel], frozenset[str]]:
+    """
+    Fields interned by default, built on first use so models are imported lazily.
+    """
+    return {
+        models.Message: frozenset(
+            {"account_id", "chat_id", "chat_provider_id", "sender_id", "sender_attendee_id"}
+        ),
+        models.Chat: frozenset({"account_id", "account_type"}),
+        models.ChatAttendee: frozenset({"account_id"}),
+        models.PeopleSearchResult: frozenset({"network_distance", "location", "industry"}),
+        models.Position: frozenset({"company", "company_id", "role", "location"}),
+    }
+
+
+class StringInterner:
+    """
+    Replace repeated strings of configured fields with one shared (`sys.intern`) object,
+    e.g. the account id of every message of a crawl. Nested models are visited, so the
+    fields of `Position` are interned in search results too:
+
+    StringInterner({Message: {"account_id", "sender_id"}, Position: {"company"}})
+
+    Fields are keyed by model, lazy variants use the fields of the eager model.
+    Attributes:
+        interned: Number of strings replaced by a shared string object.
+        saved_bytes: Size (`sys.getsizeof`) of the replaced string objects, freed once
+            nothing else references them. Strings already shared by pydantic's JSON
+            parser aren't replaced, so validated responses report little.
+    """
+
+    def __init__(self, fields: dict[type[BaseModel], set[str] | frozenset[str]] | None = None):
+        self.fields = {
+            model: frozenset(names) for model, names in (fields or default_fields()).items()
+        }
+        self.interned = 0
+        self.saved_bytes = 0
+        self._passes: dict[type[BaseModel], Pass | None] = {}
+        self._lock = threading.Lock()
+
+    def apply(self, model: type[BaseModel], value: Any) -> Any:
+        """
+        Intern strings of a response of `model`, a model instance or decoded JSON.
+        """
+        apply = self.pass_of(model)
+        target = _values(value)
+        if apply is not None and target is not None:
+            apply(target)
+        return value
+
+    def pass_of(self, model: type[BaseModel]) -> Pass | None:
+        """
+        Interning pass of `model` values, `None` when the model has no interned fields.
+        """
+        if model in self._passes:
+            return self._passes[model]
+
+        # NOTE: placeholder for recursive models, visited once the pass is compiled
+        self._passes[model] = None
+        fields = next(
+            (self.fields[cls] for cls in model.__mro__ if cls in self.fields), frozenset()
+        )
+        nested = [
+            (name, apply)
+            for name, field in model.model_fields.items()
+            if (apply := self._nested(field.annotation)) is not None
+        ]
+        apply = self._compile(fields, nested) if fields or nested else None
+        self._passes[model] = apply
+        return apply
+
+    def _compile(self, fields: frozenset[str], nested: list[tuple[str, Pass]]) -> Pass:
+        def apply(values: dict[str, Any]) -> None:
+            interned = saved = 0
+            for name in fields:
+                value = values.get(name)
+                if type(value) is str:
+                    shared = sys.intern(value)
+                    if shared is not value:
+                        values[name] = shared
+                        interned += 1
+                        saved += sys.getsizeof(value)
+            if interned:
+                with self._lock:
+                    self.interned += interned
+                    self.saved_bytes += saved
+
+            for name, visit in nested:
+                value = values.get(name)
+                if value is not None:
+                    visit(value)
+
+        return apply
+
+    def _nested(self, annotation: Any) -> Callable[[Any], None] | None:
+        """
+        Visitor of values of `annotation` holding models with interned fields.
+        """
+        origin = get_origin(annotation)
+        if origin is Annotated:
+            return self._nested(get_args(annotation)[0])
+
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            apply = self.pass_of(annotation)
+            if apply is None:
+                return None
+
+            def visit(value: Any) -> None:
+                target = _values(value)
+                if target is not None:
+                    apply(target)
+
+            return visit
+
+        if origin in (list, set, frozenset, tuple):
+            item = self._nested(get_args(annotation)[0])
+            if item is None:
+                return None
+
+            def visit_items(value: Any) -> None:
+                for item_value in _raw(value):
+                    item(item_value)
+
+            return visit_items
+
+        if origin in (Union, types.UnionType):
+            # NOTE: only optional values (`X | None`) are visited, like in records
+            arms = [arg for arg in get_args(annotation) if arg is not type(None)]
+            return self._nested(arms[0]) if len(arms) == 1 else None
+
+        return None
+
+
+def _raw(value: Any) -> Any:
+    # NOTE: deferred values of lazy models are interned before they are validated
+    return value.raw if isinstance(value, Deferred) else value
+
+
+def _values(value: Any) -> dict[str, Any] | None:
+    value = _raw(value)
+    if isinstance(value, BaseModel):
+        return vars(value)
+    return value if isinstance(value, dict) else None
@@ -1,231 +1,280 @@
-from .account import (
-    Accounts,
-    AccountSignature,
-    AccountSource,
-    DisabledFeature,
-    LinkedinAccount,
-    LinkedinAccountConnectionParams,
-    LinkedinAccountIM,
-    LinkedinAccountOrganization,
-    LinkedinAccountsConnect,
-    LinkedinAccountsConnectResponse,
-)
-from .chat import (
-    Attachment,
-    AttachmentAudio,
-    AttachmentFile,
-    AttachementImg,
-    AttachmentPost,
-    AttachmentVideo,
-    AttachementSize,
-    Chat,
-    ChatAttendee,
-    ChatAttendeesResponse,
-    ChatsMessagesResponse,
-    ChatsResponse,
-    ChatsSendMessageResponse,
-    ChatsStartedResponse,
-    LinkedinSpecificUserData,
-    Message,
-    MessageQuoted,
-    MessageReaction,
-)
-from .common import (
-    AccountType,
-    ApiType,
-    Author,
-    CategoryType,
-    CursorParam,
-    DateRange,
-    Education,
-    LastOutreachActivity,
-    NetworkDistance,
-    Position,
-    TenureInfo,
-    WorkExperience,
-)
-from .error import (
-    APIErrorTypes,
-    BadRequestResponse,
-    BadRequestType,
-    ErrorResponse,
-    ForbiddenType,
-    InternalServerErrorType,
-    NotFoundType,
-    NotImplementedErrorType,
-    RequestTimeoutErrorType,
-    ServiceUnavailableErrorType,
-    TooManyRequestsErrorType,
-    UnauthorizedType,
-    UnprocessableEntityType,
-)
-from .search import (
-    AdvancedKeywords,
-    ClassicPeopleSearch,
-    CommonSearchParameter,
-    CompanyParam,
-    CompanySearchResult,
-    LinkedinCompanyLocation,
-    LinkedinCompanyMessaging,
-    LinkedinCompanyProfile,
-    LinkedinSalesNavSearchPayload,
-    LinkedinSearchParameter,
-    LinkedinSearchParametersResponse,
-    LinkedinSearchPayload,
-    LinkedinURLSearchPayload,
-    LocationParam,
-    NetworkDistanceEnum,
-    OpenToEnum,
-    Paging,
-    PeopleSearchResult,
-    RecruiterSearchParameter,
-    SalesNavPayloadCompany,
-    SalesNavPayloadIndustry,
-    SalesNavPayloadLocation,
-    SalesNavPayloadRole,
-    SalesNavPayloadSchool,
-    SalesNavSearchParameter,
-    SearchClassicPeople,
-    SearchCompanyResponse,
-    SearchQuery,
-    SearchResponse,
-    SearchResultsPaging,
-    TenureItem,
-    TenureMax,
-    TenureMin,
-)
-from .user import (
-    Birthdate,
-    Certification,
-    ContactInfo,
-    EducationItem,
-    Invitation,
-    Language,
-    LinkedinSection,
-    LinkedinUserMe,
-    LinkedinUserOrganization,
-    LinkedinUserPlanDisconnected,
-    LinkedinUserPlanInfo,
-    LinkedinUserProfile,
-    LinkedinUsersInvitePayload,
-    LinkedinUsersInviteResponse,
-    PrimaryLocale,
-    Project,
-    Skill,
-    Social,
-    UserRelation,
-    UsersRelationsResponse,
-    VolunteeringExperienceItem,
-    WorkExperienceItem,
-)
+"""
+Models of unipile API, each module is imported on first use of one of its names, so
+importing the SDK doesn't build every pydantic schema.
+"""
 
-__all__ = [
-    "Accounts",
-    "AccountSignature",
-    "AccountSource",
-    "DisabledFeature",
-    "LinkedinAccount",
-    "LinkedinAccountConnectionParams",
-    "LinkedinAccountIM",
-    "LinkedinAccountOrganization",
-    "LinkedinAccountsConnect",
-    "LinkedinAccountsConnectResponse",
-    "Attachment",
-    "AttachmentAudio",
-    "AttachmentFile",
-    "AttachementImg",
-    "AttachmentPost",
-    "AttachmentVideo",
-    "AttachementSize",
-    "Chat",
-    "ChatAttendee",
-    "ChatAttendeesResponse",
-    "ChatsMessagesResponse",
-    "ChatsResponse",
-    "ChatsSendMessageResponse",
-    "ChatsStartedResponse",
-    "LinkedinSpecificUserData",
-    "Message",
-    "MessageQuoted",
-    "MessageReaction",
-    "AccountType",
-    "ApiType",
-    "Author",
-    "CategoryType",
-    "CursorParam",
-    "DateRange",
-    "Education",
-    "LastOutreachActivity",
-    "NetworkDistance",
-    "Position",
-    "TenureInfo",
-    "WorkExperience",
-    "APIErrorTypes",
-    "BadRequestResponse",
-    "BadRequestType",
-    "ErrorResponse",
-    "ForbiddenType",
-    "InternalServerErrorType",
-    "NotFoundType",
-    "NotImplementedErrorType",
-    "RequestTimeoutErrorType",
-    "ServiceUnavailableErrorType",
-    "TooManyRequestsErrorType",
-    "UnauthorizedType",
-    "UnprocessableEntityType",
-    "AdvancedKeywords",
-    "ClassicPeopleSearch",
-    "CommonSearchParameter",
-    "CompanyParam",
-    "CompanySearchResult",
-    "LinkedinCompanyLocation",
-    "LinkedinCompanyMessaging",
-    "LinkedinCompanyProfile",
-    "LinkedinSalesNavSearchPayload",
-    "LinkedinSearchParameter",
-    "LinkedinSearchParametersResponse",
-    "LinkedinSearchPayload",
-    "LinkedinURLSearchPayload",
-    "LocationParam",
-    "NetworkDistanceEnum",
-    "OpenToEnum",
-    "Paging",
-    "PeopleSearchResult",
-    "RecruiterSearchParameter",
-    "SalesNavPayloadCompany",
-    "SalesNavPayloadIndustry",
-    "SalesNavPayloadLocation",
-    "SalesNavPayloadRole",
-    "SalesNavPayloadSchool",
-    "SalesNavSearchParameter",
-    "SearchClassicPeople",
-    "SearchCompanyResponse",
-    "SearchQuery",
-    "SearchResponse",
-    "SearchResultsPaging",
-    "TenureItem",
-    "TenureMax",
-    "TenureMin",
-    "Birthdate",
-    "Certification",
-    "ContactInfo",
-    "EducationItem",
-    "Invitation",
-    "Language",
-    "LinkedinSection",
-    "LinkedinUserMe",
-    "LinkedinUserOrganization",
-    "LinkedinUserPlanDisconnected",
-    "LinkedinUserPlanInfo",
-    "LinkedinUserProfile",
-    "LinkedinUsersInvitePayload",
-    "LinkedinUsersInviteResponse",
-    "PrimaryLocale",
-    "Project",
-    "Skill",
-    "Social",
-    "UserRelation",
-    "UsersRelationsResponse",
-    "VolunteeringExperienceItem",
-    "WorkExperienceItem",
-]
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .account import (  # noqa: F401
+        Accounts,
+        AccountSignature,
+        AccountSource,
+        DisabledFeature,
+        LinkedinAccount,
+        LinkedinAccountConnectionParams,
+        LinkedinAccountIM,
+        LinkedinAccountOrganization,
+        LinkedinAccountsConnect,
+        LinkedinAccountsConnectResponse,
+    )
+    from .chat import (  # noqa: F401
+        AttachementImg,
+        AttachementSize,
+        Attachment,
+        AttachmentAudio,
+        AttachmentFile,
+        AttachmentPost,
+        AttachmentVideo,
+        Chat,
+        ChatAttendee,
+        ChatAttendeesResponse,
+        ChatsMessagesResponse,
+        ChatsResponse,
+        ChatsSendMessageResponse,
+        ChatsStartedResponse,
+        LinkedinSpecificUserData,
+        Message,
+        MessageAttachment,
+        MessageQuoted,
+        MessageReaction,
+    )
+    from .common import (  # noqa: F401
+        AccountType,
+        ApiType,
+        Author,
+        CategoryType,
+        CursorParam,
+        DateRange,
+        Education,
+        LastOutreachActivity,
+        NetworkDistance,
+        Position,
+        TenureInfo,
+        WorkExperience,
+    )
+    from .error import (  # noqa: F401
+        APIErrorTypes,
+        BadRequestResponse,
+        BadRequestType,
+        ErrorResponse,
+        ForbiddenType,
+        InternalServerErrorType,
+        NotFoundType,
+        NotImplementedErrorType,
+        RequestTimeoutErrorType,
+        ServiceUnavailableErrorType,
+        TooManyRequestsErrorType,
+        UnauthorizedType,
+        UnprocessableEntityType,
+    )
+    from .search import (  # noqa: F401
+        AdvancedKeywords,
+        ClassicPeopleSearch,
+        CommonSearchParameter,
+        CompanyParam,
+        CompanySearchResult,
+        LazyPeopleSearchResult,
+        LazySearchResponse,
+        LinkedinCompanyLocation,
+        LinkedinCompanyMessaging,
+        LinkedinCompanyProfile,
+        LinkedinSalesNavSearchPayload,
+        LinkedinSearchParameter,
+        LinkedinSearchParametersResponse,
+        LinkedinSearchPayload,
+        LinkedinURLSearchPayload,
+        LocationParam,
+        NetworkDistanceEnum,
+        OpenToEnum,
+        OrganizationType,
+        Paging,
+        PeopleSearchResult,
+        RecruiterSearchParameter,
+        SalesNavPayloadCompany,
+        SalesNavPayloadIndustry,
+        SalesNavPayloadLocation,
+        SalesNavPayloadRole,
+        SalesNavPayloadSchool,
+        SalesNavSearchParameter,
+        SearchClassicPeople,
+        SearchCompanyResponse,
+        SearchQuery,
+        SearchResponse,
+        SearchResultsPaging,
+        TenureItem,
+        TenureMax,
+        TenureMin,
+    )
+    from .user import (  # noqa: F401
+        Birthdate,
+        Certification,
+        ContactInfo,
+        EducationItem,
+        Invitation,
+        Language,
+        LinkedinSection,
+        LinkedinUserMe,
+        LinkedinUserOrganization,
+        LinkedinUserPlan,
+        LinkedinUserPlanDisconnected,
+        LinkedinUserPlanInfo,
+        LinkedinUserProfile,
+        LinkedinUsersInvitePayload,
+        LinkedinUsersInviteResponse,
+        PrimaryLocale,
+        Project,
+        Skill,
+        Social,
+        UserRelation,
+        UsersRelationsResponse,
+        VolunteeringExperienceItem,
+        WorkExperienceItem,
+    )
+
+# Public names of each model module
+_EXPORTS: dict[str, tuple[str, ...]] = {
+    "account": (
+        "Accounts",
+        "AccountSignature",
+        "AccountSource",
+        "DisabledFeature",
+        "LinkedinAccount",
+        "LinkedinAccountConnectionParams",
+        "LinkedinAccountIM",
+        "LinkedinAccountOrganization",
+        "LinkedinAccountsConnect",
+        "LinkedinAccountsConnectResponse",
+    ),
+    "chat": (
+        "Attachment",
+        "AttachmentAudio",
+        "AttachmentFile",
+        "AttachementImg",
+        "AttachmentPost",
+        "AttachmentVideo",
+        "AttachementSize",
+        "Chat",
+        "ChatAttendee",
+        "ChatAttendeesResponse",
+        "ChatsMessagesResponse",
+        "ChatsResponse",
+        "ChatsSendMessageResponse",
+        "ChatsStartedResponse",
+        "LinkedinSpecificUserData",
+        "Message",
+        "MessageAttachment",
+        "MessageQuoted",
+        "MessageReaction",
+    ),
+    "common": (
+        "AccountType",
+        "ApiType",
+        "Author",
+        "CategoryType",
+        "CursorParam",
+        "DateRange",
+        "Education",
+        "LastOutreachActivity",
+        "NetworkDistance",
+        "Position",
+        "TenureInfo",
+        "WorkExperience",
+    ),
+    "error": (
+        "APIErrorTypes",
+        "BadRequestResponse",
+        "BadRequestType",
+        "ErrorResponse",
+        "ForbiddenType",
+        "InternalServerErrorType",
+        "NotFoundType",
+        "NotImplementedErrorType",
+        "RequestTimeoutErrorType",
+        "ServiceUnavailableErrorType",
+        "TooManyRequestsErrorType",
+        "UnauthorizedType",
+        "UnprocessableEntityType",
+    ),
+    "search": (
+        "AdvancedKeywords",
+        "ClassicPeopleSearch",
+        "CommonSearchParameter",
+        "CompanyParam",
+        "CompanySearchResult",
+        "LinkedinCompanyLocation",
+        "LinkedinCompanyMessaging",
+        "LinkedinCompanyProfile",
+        "LinkedinSalesNavSearchPayload",
+        "LinkedinSearchParameter",
+        "LinkedinSearchParametersResponse",
+        "LinkedinSearchPayload",
+        "LinkedinURLSearchPayload",
+        "LazyPeopleSearchResult",
+        "LazySearchResponse",
+        "LocationParam",
+        "NetworkDistanceEnum",
+        "OpenToEnum",
+        "OrganizationType",
+        "Paging",
+        "PeopleSearchResult",
+        "RecruiterSearchParameter",
+        "SalesNavPayloadCompany",
+        "SalesNavPayloadIndustry",
+        "SalesNavPayloadLocation",
+        "SalesNavPayloadRole",
+        "SalesNavPayloadSchool",
+        "SalesNavSearchParameter",
+        "SearchClassicPeople",
+        "SearchCompanyResponse",
+        "SearchQuery",
+        "SearchResponse",
+        "SearchResultsPaging",
+        "TenureItem",
+        "TenureMax",
+        "TenureMin",
+    ),
+    "user": (
+        "Birthdate",
+        "Certification",
+        "ContactInfo",
+        "EducationItem",
+        "Invitation",
+        "Language",
+        "LinkedinSection",
+        "LinkedinUserMe",
+        "LinkedinUserOrganization",
+        "LinkedinUserPlan",
+        "LinkedinUserPlanDisconnected",
+        "LinkedinUserPlanInfo",
+        "LinkedinUserProfile",
+        "LinkedinUsersInvitePayload",
+        "LinkedinUsersInviteResponse",
+        "PrimaryLocale",
+        "Project",
+        "Skill",
+        "Social",
+        "UserRelation",
+        "UsersRelationsResponse",
+        "VolunteeringExperienceItem",
+        "WorkExperienceItem",
+    ),
+}
+_MODULES = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Literal, Union
+from typing import Annotated, Any, Literal, Union
 
 from pydantic import BaseModel, Field
 
@@ -137,6 +137,13 @@ class AttachmentPost(Attachment):
     type: Literal["linkedin_post"]
 
 
+# NOTE: tagged by `type`, validated with a single lookup instead of trying each class
+MessageAttachment = Annotated[
+    Union[AttachementImg, AttachmentVideo, AttachmentAudio, AttachmentFile, AttachmentPost],
+    Field(discriminator="type"),
+]
+
+
 class MessageReaction(BaseModel):
     value: str
     sender_id: str
@@ -147,9 +154,7 @@ class MessageQuoted(BaseModel):
     provider_id: str
     sender_id: str
     text: Union[str, Any]
-    attachments: list[
-        Union[AttachementImg, AttachmentVideo, AttachmentAudio, AttachmentFile, AttachmentPost]
-    ]
+    attachments: list[MessageAttachment]
 
 
 class Message(BaseModel):
@@ -157,9 +162,7 @@ class Message(BaseModel):
     provider_id: str
     sender_id: str
     text: str | None = None
-    attachments: list[
-        AttachementImg | AttachmentVideo | AttachmentAudio | AttachmentFile | AttachmentPost
-    ]
+    attachments: list[MessageAttachment]
     id: str = Field(
         ..., description="A unique identifier.", min_length=1, title="Unique message id"
     )
@@ -0,0 +1,134 @@
+"""
+Lazy variants of models, nested collections are kept as decoded JSON until first access.
+"""
+
+from copy import deepcopy
+from functools import cached_property
+from typing import TYPE_CHECKING, Annotated, Any, Callable, TypeVar
+
+from pydantic import BaseModel, TypeAdapter, WrapSerializer, WrapValidator
+
+T = TypeVar("T")
+
+# Lazy variant of each model, e.g. `LazyPeopleSearchResult` of `PeopleSearchResult`
+_variants: dict[type[BaseModel], type[BaseModel]] = {}
+
+
+class Deferred:
+    """
+    Decoded JSON value of a lazy field, built into the field type on first access.
+    """
+
+    __slots__ = ("raw", "build", "_value")
+
+    def __init__(self, raw: Any, build: Callable[[Any], Any]) -> None:
+        self.raw = raw
+        self.build = build
+
+    def get(self) -> Any:
+        try:
+            return self._value
+        except AttributeError:
+            self._value = self.build(self.raw)
+            return self._value
+
+    def __eq__(self, other: Any) -> bool:
+        return self.get() == (other.get() if isinstance(other, Deferred) else other)
+
+    def __repr__(self) -> str:
+        return repr(self.get())
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return _resolved, (self.get(),)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Any:
+        return deepcopy(self.get(), memo)
+
+
+def _resolved(value: Any) -> Any:
+    return value
+
+
+class LazyMarker:
+    """
+    Metadata of a `Lazy[...]` field, holds its type.
+    """
+
+    def __init__(self, type_: Any) -> None:
+        self.type = type_
+
+    @cached_property
+    def validate(self) -> Callable[[Any], Any]:
+        # NOTE: compiled on first access of a lazy field, not when the model is defined
+        return TypeAdapter(self.type).validate_python
+
+    def defer(self, value: Any, handler: Any) -> Any:
+        return None if value is None else Deferred(value, self.validate)
+
+    def dump(self, value: Any, handler: Any) -> Any:
+        return handler(value.get() if isinstance(value, Deferred) else value)
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    # NOTE: for type checkers a lazy field has the type it wraps
+    Lazy = Annotated[T, LazyMarker]
+else:
+
+    class Lazy:
+        """
+        Type of a field validated on first access, e.g. `Lazy[list[Position] | None]`.
+        The field keeps its type, only its validation is deferred.
+        """
+
+        def __class_getitem__(cls, type_: Any) -> Any:
+            marker = LazyMarker(type_)
+            return Annotated[
+                type_, marker, WrapValidator(marker.defer), WrapSerializer(marker.dump)
+            ]
+
+
+class _LazyAttribute:
+    """
+    Builds a deferred field value on access and keeps the result in the instance.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: BaseModel | None, owner: type[BaseModel]) -> Any:
+        if instance is None:
+            return self
+        value = instance.__dict__[self.name]
+        if isinstance(value, Deferred):
+            value = instance.__dict__[self.name] = value.get()
+        return value
+
+    def __set__(self, instance: BaseModel, value: Any) -> None:
+        instance.__dict__[self.name] = value
+
+
+class LazyModel(BaseModel):
+    """
+    Base of lazy variants, subclasses of the eager models, so existing code keeps working:
+
+    class LazyPeopleSearchResult(LazyModel, PeopleSearchResult):
+        education: Lazy[list[Education] | None] = None
+    """
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        for name, field in cls.model_fields.items():
+            if any(isinstance(meta, LazyMarker) for meta in field.metadata):
+                type.__setattr__(cls, name, _LazyAttribute(name))
+
+        for base in cls.__bases__:
+            if base is not LazyModel and issubclass(base, BaseModel):
+                _variants.setdefault(base, cls)
+
+
+def lazy_variant(model: type[BaseModel]) -> type[BaseModel]:
+    """
+    Lazy variant of `model`, `model` itself when it has none.
+    """
+    return _variants.get(model, model)
@@ -12,6 +12,7 @@ from .common import (
     Position,
     WorkExperience,
 )
+from .lazy import Lazy, LazyModel
 
 
 class SearchQuery(BaseModel):
@@ -59,6 +60,16 @@ class PeopleSearchResult(BaseModel):
     work_experience: list[WorkExperience] | None = None
 
 
+class LazyPeopleSearchResult(LazyModel, PeopleSearchResult):
+    """
+    Positions, education and work experience are validated on first access.
+    """
+
+    current_positions: Lazy[list[Position] | None] = None
+    education: Lazy[list[Education] | None] = None
+    work_experience: Lazy[list[WorkExperience] | None] = None
+
+
 class CompanySearchResult(BaseModel):
     object: Literal["SearchResult"]
     type: Literal["COMPANY"]
@@ -110,6 +121,10 @@ class SearchResponse(BaseModel):
     cursor: str | None = None
 
 
+class LazySearchResponse(LazyModel, SearchResponse):
+    items: list[LazyPeopleSearchResult]
+
+
 class SearchCompanyResponse(BaseModel):
     object: Literal["LinkedinSearch"]
     items: list[CompanySearchResult]
@@ -466,6 +481,18 @@ class LinkedinCompanyLocation(BaseModel):
     area: str | None = None
 
 
+OrganizationType = Literal[
+    "PUBLIC_COMPANY",
+    "EDUCATIONAL",
+    "SELF_EMPLOYED",
+    "GOVERNMENT_AGENCY",
+    "NON_PROFIT",
+    "SELF_OWNED",
+    "PRIVATELY_HELD",
+    "PARTNERSHIP",
+]
+
+
 class LinkedinCompanyProfile(BaseModel):
     object: Literal["CompanyProfile"]
     id: str
@@ -481,17 +508,8 @@ class LinkedinCompanyProfile(BaseModel):
     messaging: LinkedinCompanyMessaging
     claimed: bool
     viewer_permissions: Any  # TODO: use real model here
-    organization_type: (
-        Literal["PUBLIC_COMPANY"]
-        | Literal["EDUCATIONAL"]
-        | Literal["SELF_EMPLOYED"]
-        | Literal["GOVERNMENT_AGENCY"]
-        | Literal["NON_PROFIT"]
-        | Literal["SELF_OWNED"]
-        | Literal["PRIVATELY_HELD"]
-        | Literal["PARTNERSHIP"]
-        | Any
-    )
+    # NOTE: known types are matched by one lookup, anything else is kept as is
+    organization_type: OrganizationType | Any = Field(union_mode="left_to_right")
     locations: list[LinkedinCompanyLocation] | None = None
     logo: str | None = None
     localized_description: list[dict[str, Any]] | None = None
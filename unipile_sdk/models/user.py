@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Any, Literal
+from typing import Annotated, Any, Literal, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Discriminator, Field, Tag
 
 
 class LinkedinSection(str, Enum):
@@ -99,8 +99,8 @@ class Project(BaseModel):
 
 
 class Invitation(BaseModel):
-    type: Literal["SENT"] | Literal["RECEIVED"]
-    status: Literal["PENDING"] | Literal["IGNORED"] | Literal["WITHDRAWN"]
+    type: Literal["SENT", "RECEIVED"]
+    status: Literal["PENDING", "IGNORED", "WITHDRAWN"]
 
 
 class LinkedinUserProfile(BaseModel):
@@ -184,6 +184,22 @@ class LinkedinUserPlanInfo(BaseModel):
     contract_id: str
 
 
+def _plan_tag(value: Any) -> str:
+    if isinstance(value, dict):
+        return "disconnected" if "error" in value else "info"
+    return "disconnected" if isinstance(value, LinkedinUserPlanDisconnected) else "info"
+
+
+# NOTE: a disconnected plan is told apart by its `error` key, only one model is validated
+LinkedinUserPlan = Annotated[
+    Union[
+        Annotated[LinkedinUserPlanInfo, Tag("info")],
+        Annotated[LinkedinUserPlanDisconnected, Tag("disconnected")],
+    ],
+    Discriminator(_plan_tag),
+]
+
+
 class LinkedinUserMe(BaseModel):
     provider: Literal["LINKEDIN"]
     provider_id: str
@@ -201,8 +217,8 @@ class LinkedinUserMe(BaseModel):
     open_profile: bool
     occupation: str | None = None
     organizations: list[LinkedinUserOrganization | None]
-    recruiter: LinkedinUserPlanInfo | LinkedinUserPlanDisconnected | None = None
-    sales_navigator: LinkedinUserPlanInfo | LinkedinUserPlanDisconnected | None = None
+    recruiter: LinkedinUserPlan | None = None
+    sales_navigator: LinkedinUserPlan | None = None
     object: Literal["AccountOwnerProfile"]
 
 class LinkedinUsersInvitePayload(BaseModel):
@@ -0,0 +1,154 @@
+"""
+Page sizes (`limit`) of paginated endpoints tuned per account from observed latency,
+payload size and errors.
+"""
+
+import threading
+from dataclasses import dataclass
+
+from .concurrency import is_overload
+
+
+@dataclass
+class PageSizePolicy:
+    """
+    Bounds and targets of the page size of an endpoint.
+    Attributes:
+        min_limit: Lower bound of the page size.
+        max_limit: Upper bound of the page size.
+        target_latency: Number of seconds a page request should take.
+        max_payload: Number of bytes a page body should stay under.
+        max_error_rate: Smoothed rate of failed page requests above which failures cut
+            pages (not only overloads) and pages don't grow.
+        increase: Page size is multiplied by at most this factor per page.
+        decrease: Page size is multiplied by this factor on overload (429, 503,
+            timeouts), and by at least this factor per page otherwise.
+        smoothing: Weight of a new sample in the smoothed per item latency and size.
+    """
+
+    min_limit: int = 10
+    max_limit: int = 250
+    target_latency: float = 2.0
+    max_payload: int = 2_000_000
+    max_error_rate: float = 0.1
+    increase: float = 1.5
+    decrease: float = 0.5
+    smoothing: float = 0.3
+
+
+@dataclass
+class PageSizeStats:
+    """
+    Tuning state of an endpoint for an account.
+    Attributes:
+        limit: Page size of the next request.
+        item_latency: Smoothed seconds per requested item.
+        item_payload: Smoothed bytes per requested item.
+        error_rate: Smoothed rate of failed page requests.
+        pages: Number of observed page requests.
+    """
+
+    limit: float
+    item_latency: float | None = None
+    item_payload: float | None = None
+    error_rate: float = 0.0
+    pages: int = 0
+
+
+class PageSizeTuner:
+    """
+    Choose the `limit` of paginated requests sent without an explicit one, per endpoint
+    and account, e.g. shrinking pages of a slow account before they time out:
+
+    PageSizeTuner(
+        PageSizePolicy(max_limit=250), {"messages.messages": PageSizePolicy(max_limit=50)}
+    )
+
+    Pages start at the endpoint default (`unipile_sdk.config`) and move towards the size
+    fitting `target_latency` and `max_payload`, estimated from the previous pages.
+    Streamed responses aren't observed. Tuned sizes are in `limits` and `stats`.
+    """
+
+    def __init__(
+        self,
+        policy: PageSizePolicy | None = None,
+        policies: dict[str, PageSizePolicy] | None = None,
+    ) -> None:
+        self.policy = policy or PageSizePolicy()
+        self.policies = policies or {}
+        self.stats: dict[tuple[str, str], PageSizeStats] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def limits(self) -> dict[tuple[str, str], int]:
+        """
+        Page size of the next request, by endpoint and account id ("" when the endpoint
+        isn't bound to an account).
+        """
+        with self._lock:
+            return {key: round(stats.limit) for key, stats in self.stats.items()}
+
+    def policy_of(self, endpoint: str) -> PageSizePolicy:
+        return self.policies.get(endpoint, self.policy)
+
+    def limit(
+        self, endpoint: str, account_id: str, default: int, maximum: int | None = None
+    ) -> int:
+        """
+        Page size of the next request, `maximum` lowers the upper bound of the policy, e.g.
+        for an endpoint which rejects larger pages.
+        """
+        policy = self.policy_of(endpoint)
+        with self._lock:
+            stats = self.stats.get((endpoint, account_id))
+            if stats is None:
+                initial = min(max(default, policy.min_limit), policy.max_limit)
+                stats = self.stats[(endpoint, account_id)] = PageSizeStats(float(initial))
+            limit = round(stats.limit)
+        return min(limit, maximum) if maximum is not None else limit
+
+    def record(
+        self,
+        endpoint: str,
+        account_id: str,
+        limit: int,
+        latency: float,
+        payload: int | None,
+        error: BaseException | None = None,
+    ) -> None:
+        """
+        Adapt the page size to a page request of `limit` items, which took `latency`
+        seconds and returned `payload` bytes or failed with `error`.
+        """
+        policy = self.policy_of(endpoint)
+        with self._lock:
+            stats = self.stats.setdefault((endpoint, account_id), PageSizeStats(float(limit)))
+            stats.pages += 1
+            failed = 1.0 if error is not None else 0.0
+            stats.error_rate += policy.smoothing * (failed - stats.error_rate)
+
+            if error is not None:
+                if is_overload(error) or stats.error_rate > policy.max_error_rate:
+                    stats.limit = max(policy.min_limit, stats.limit * policy.decrease)
+                return
+
+            stats.item_latency = _smoothed(stats.item_latency, latency / limit, policy)
+            target = policy.target_latency / max(stats.item_latency, 1e-9)
+            if payload is not None:
+                stats.item_payload = _smoothed(stats.item_payload, payload / limit, policy)
+                target = min(target, policy.max_payload / max(stats.item_payload, 1e-9))
+            if stats.error_rate > policy.max_error_rate:
+                # NOTE: pages were cut by the errors, they don't grow until errors are rare
+                target = min(target, stats.limit)
+
+            # NOTE: pages move towards the target gradually, a single outlier page doesn't
+            # swing the size from one bound to the other
+            if target < stats.limit:
+                stats.limit = max(target, stats.limit * policy.decrease)
+            else:
+                stats.limit = min(target, stats.limit * policy.increase)
+            stats.limit = min(max(stats.limit, policy.min_limit), policy.max_limit)
+
+
+def _smoothed(value: float | None, sample: float, policy: PageSizePolicy) -> float:
+    return sample if value is None else value + policy.smoothing * (sample - value)
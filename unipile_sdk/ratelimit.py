@@ -0,0 +1,141 @@
+"""
+In-process rate limiting of provider actions, per account.
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from .errors import RateLimitExceededError
+from .typing import RequestAction
+
+
+@dataclass
+class RateLimit:
+    """
+    Token bucket budget.
+    Attributes:
+        capacity: Number of actions allowed in a burst.
+        period: Number of seconds to refill the whole bucket, so the sustained rate is
+            `capacity / period` actions per second.
+    """
+
+    capacity: int
+    period: float
+
+    @property
+    def rate(self) -> float:
+        return self.capacity / self.period
+
+
+class TokenBucket:
+    """
+    Token bucket, not thread safe by itself, `RateLimiter` guards it with a lock.
+    """
+
+    def __init__(self, limit: RateLimit, clock: Callable[[], float] = time.monotonic) -> None:
+        self.limit = limit
+        self.clock = clock
+        self.tokens = float(limit.capacity)
+        self.updated_at = clock()
+
+    def _refill(self) -> None:
+        now = self.clock()
+        elapsed = now - self.updated_at
+        self.tokens = min(self.limit.capacity, self.tokens + elapsed * self.limit.rate)
+        self.updated_at = now
+
+    def wait_time(self) -> float:
+        """
+        Seconds until a token is available.
+        """
+        self._refill()
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.limit.rate
+
+    def reserve(self) -> float:
+        """
+        Take a token (possibly from future refills) and return seconds to wait before
+        the action may run. Waiters are served in reservation order.
+        """
+        wait = self.wait_time()
+        self.tokens -= 1
+        return wait
+
+
+class RateLimiter:
+    """
+    Token buckets keyed by account id and action, shared by all threads (or tasks) of
+    a client.
+
+    When `block` is set, callers sleep until their action fits in the budget, otherwise
+    `RateLimitExceededError` is raised right away.
+    """
+
+    def __init__(
+        self,
+        limits: dict[RequestAction, RateLimit],
+        block: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.limits = limits
+        self.block = block
+        self.clock = clock
+        self._buckets: dict[tuple[str, RequestAction], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, account_id: str, action: RequestAction, limit: RateLimit) -> TokenBucket:
+        bucket = self._buckets.get((account_id, action))
+        if bucket is None:
+            bucket = self._buckets[(account_id, action)] = TokenBucket(limit, self.clock)
+        return bucket
+
+    def _reserve(self, account_id: str, action: RequestAction) -> float:
+        limit = self.limits.get(action)
+        if limit is None:
+            return 0.0
+
+        with self._lock:
+            bucket = self._bucket(account_id, action, limit)
+
+            if not self.block:
+                wait = bucket.wait_time()
+                if wait > 0:
+                    raise RateLimitExceededError(account_id, action, retry_after=wait)
+
+            return bucket.reserve()
+
+    def try_acquire(self, account_id: str, action: RequestAction) -> bool:
+        """
+        Spend one action of account budget if it's available right now, never waits.
+        """
+        limit = self.limits.get(action)
+        if limit is None:
+            return True
+
+        with self._lock:
+            bucket = self._bucket(account_id, action, limit)
+            if bucket.wait_time() > 0:
+                return False
+
+            bucket.reserve()
+            return True
+
+    def acquire(self, account_id: str, action: RequestAction) -> None:
+        """
+        Spend one action of account budget, sleeping if required.
+        """
+        wait = self._reserve(account_id, action)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self, account_id: str, action: RequestAction) -> None:
+        """
+        Spend one action of account budget, without blocking the event loop.
+        """
+        wait = self._reserve(account_id, action)
+        if wait > 0:
+            await asyncio.sleep(wait)
@@ -0,0 +1,90 @@
+"""
+Undecoded responses, for forwarding unipile bodies without building Python objects.
+"""
+
+from typing import Any, AsyncIterator, Iterator
+
+import httpx
+
+JSON_HEADERS = httpx.Headers({"content-type": "application/json"})
+
+
+class RawResponse:
+    """
+    Status, headers and body bytes of a successful response, errors are raised as usual
+    (`APIResponseError`...). A streamed response is read with `iter_bytes()` (or
+    `aiter_bytes()`) and must be closed:
+
+    with client.request_raw("users/relations", "GET", stream=True) as response:
+        for chunk in response.iter_bytes():
+            ...
+    """
+
+    def __init__(self, response: httpx.Response | None, content: bytes | None = None) -> None:
+        self.response = response
+        self._content = content
+
+    @classmethod
+    def cached(cls, content: bytes) -> "RawResponse":
+        """
+        Response served from `ClientOptions.cache`, only successful bodies are cached.
+        """
+        return cls(None, content)
+
+    @property
+    def status(self) -> int:
+        return 200 if self.response is None else self.response.status_code
+
+    @property
+    def headers(self) -> httpx.Headers:
+        return JSON_HEADERS if self.response is None else self.response.headers
+
+    @property
+    def content(self) -> bytes:
+        """
+        Body bytes, read first if the response is streamed.
+        """
+        if self._content is None:
+            self._content = self.response.read()
+        return self._content
+
+    async def aread(self) -> bytes:
+        if self._content is None:
+            self._content = await self.response.aread()
+        return self._content
+
+    def iter_bytes(self, chunk_size: int | None = None) -> Iterator[bytes]:
+        if self._content is not None:
+            yield self._content
+            return
+        yield from self.response.iter_bytes(chunk_size)
+
+    async def aiter_bytes(self, chunk_size: int | None = None) -> AsyncIterator[bytes]:
+        if self._content is not None:
+            yield self._content
+            return
+        async for chunk in self.response.aiter_bytes(chunk_size):
+            yield chunk
+
+    def close(self) -> None:
+        if self.response is not None:
+            self.response.close()
+
+    async def aclose(self) -> None:
+        if self.response is not None:
+            await self.response.aclose()
+
+    def __enter__(self) -> "RawResponse":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "RawResponse":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    def __repr__(self) -> str:
+        return f"<RawResponse [{self.status}]>"
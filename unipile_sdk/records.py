@@ -0,0 +1,174 @@
+"""
+Compact `__slots__` records of list items, for keeping millions of them in memory.
+"""
+
+import types
+from functools import cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Iterator,
+    NotRequired,
+    TypedDict,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel
+
+from . import models
+from .validation import construct
+
+# Records of hot list items, created on first use like the models themselves
+_PREDEFINED = {
+    "PeopleSearchResultRecord": "PeopleSearchResult",
+    "UserRelationRecord": "UserRelation",
+}
+
+
+class Record:
+    """
+    Values of a model's fields without a per instance `__dict__`, nested models are records
+    too and lists are tuples. Built from decoded JSON (or a model) and converted back:
+
+    record = UserRelationRecord.from_dict(data)
+    relation = record.to_model()
+
+    Records skip validation, only the shape of the data is converted.
+    """
+
+    __slots__ = ()
+
+    model: ClassVar[type[BaseModel]]
+    # (attribute, JSON key, default, converter of a present value)
+    _fields: ClassVar[list[tuple[str, str, Any, Callable[[Any], Any] | None]]]
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Record":
+        record = cls.__new__(cls)
+        for name, key, default, convert in cls._fields:
+            value = data.get(key, default)
+            if convert is not None and value is not None:
+                value = convert(value)
+            object.__setattr__(record, name, value)
+        return record
+
+    @classmethod
+    def from_model(cls, instance: BaseModel) -> "Record":
+        return cls.from_dict(instance.model_dump(mode="json", by_alias=True))
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Decoded JSON of the record, keyed like the API response.
+        """
+        return {key: _plain(getattr(self, name)) for name, key, _, _ in self._fields}
+
+    def to_model(self, validate: bool = True) -> BaseModel:
+        data = self.to_dict()
+        return self.model.model_validate(data) if validate else construct(self.model, data)
+
+    def __iter__(self) -> Iterator[tuple[str, Any]]:
+        for name, *_ in self._fields:
+            yield name, getattr(self, name)
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name, *_ in self._fields)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={value!r}" for name, value in self)
+        return f"{type(self).__name__}({values})"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # NOTE: record classes are created at runtime, pickles refer to their models
+        return _rebuild, (self.model, tuple(getattr(self, name) for name, *_ in self._fields))
+
+    if TYPE_CHECKING:  # pragma: no cover
+        # NOTE: fields are the slots of record classes created at runtime
+        def __getattr__(self, name: str) -> Any: ...
+
+
+class CompactPage(TypedDict):
+    """
+    Page of a list endpoint with records as items, other fields are kept as decoded.
+    """
+
+    items: list[Record]
+    cursor: NotRequired[str | None]
+
+
+def _rebuild(model: type[BaseModel], values: tuple[Any, ...]) -> Record:
+    record_class = record_type(model)
+    record = record_class.__new__(record_class)
+    for (name, *_), value in zip(record_class._fields, values, strict=True):
+        object.__setattr__(record, name, value)
+    return record
+
+
+@cache
+def record_type(model: type[BaseModel]) -> type[Record]:
+    """
+    Record class of `model`, created once, e.g. `record_type(UserRelation)`.
+    """
+    names = tuple(model.model_fields)
+    record = types.new_class(
+        f"{model.__name__}Record",
+        (Record,),
+        exec_body=lambda namespace: namespace.update(
+            {"__slots__": names, "__module__": __name__, "model": model}
+        ),
+    )
+    record._fields = [
+        (
+            name,
+            field.alias or name,
+            None if field.is_required() else field.get_default(call_default_factory=True),
+            _converter(field.annotation),
+        )
+        for name, field in model.model_fields.items()
+    ]
+    return record
+
+
+def _converter(annotation: Any) -> Callable[[Any], Any] | None:
+    """
+    Converter of decoded JSON values of `annotation` into compact values.
+    """
+    origin = get_origin(annotation)
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return record_type(annotation).from_dict
+
+    if origin in (list, set, frozenset, tuple):
+        args = [arg for arg in get_args(annotation) if arg is not Ellipsis]
+        item = _converter(args[0]) if len(args) == 1 else None
+        if item is None:
+            return tuple
+        return lambda value: tuple(item(v) if v is not None else v for v in value)
+
+    if origin in (Union, types.UnionType):
+        # NOTE: only optional values (`X | None`) are compacted, other unions are kept as is
+        arms = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return _converter(arms[0]) if len(arms) == 1 else None
+
+    return None
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, tuple):
+        return [_plain(v) for v in value]
+    return value
+
+
+def __getattr__(name: str) -> Any:
+    model = _PREDEFINED.get(name)
+    if model is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return record_type(getattr(models, model))
@@ -0,0 +1,112 @@
+"""
+Retry policy for transient unipile and provider errors.
+"""
+
+import random
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from enum import Enum
+
+from .errors import APIResponseError, HTTPResponseError, RequestTimeoutError
+from .models import (
+    InternalServerErrorType,
+    RequestTimeoutErrorType,
+    ServiceUnavailableErrorType,
+    TooManyRequestsErrorType,
+    UnprocessableEntityType,
+)
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+DEFAULT_RETRYABLE_ERRORS: frozenset[Enum] = frozenset(
+    {
+        TooManyRequestsErrorType.ERRORS_TOO_MANY_REQUESTS,
+        ServiceUnavailableErrorType.ERRORS_NO_CLIENT_SESSION,
+        ServiceUnavailableErrorType.ERRORS_NO_CHANNEL,
+        ServiceUnavailableErrorType.ERRORS_NO_HANDLER,
+        ServiceUnavailableErrorType.ERRORS_NETWORK_DOWN,
+        ServiceUnavailableErrorType.ERRORS_SERVICE_UNAVAILABLE,
+        RequestTimeoutErrorType.ERRORS_REQUEST_TIMEOUT,
+        InternalServerErrorType.ERRORS_PROVIDER_ERROR,
+        UnprocessableEntityType.ERRORS_PROVIDER_UNREACHABLE,
+    }
+)
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Options to retry failed requests.
+    Attributes:
+        max_attempts: Total number of attempts, including the first one.
+        backoff: Delay in seconds before the first retry, doubled on each next retry.
+        max_backoff: Upper bound of a computed backoff delay.
+        jitter: Randomize backoff delays (full jitter), so parallel workers don't retry
+            in lockstep.
+        max_retry_after: Upper bound of a delay requested by `Retry-After` header, longer
+            delays fail immediately.
+        retryable_errors: Unipile error types (see `models/error.py`) worth retrying.
+        retryable_statuses: Statuses retried when response has no unipile error type,
+            e.g. from a gateway.
+        retry_timeouts: Retry requests which timed out locally.
+    """
+
+    max_attempts: int = 3
+    backoff: float = 0.5
+    max_backoff: float = 30.0
+    jitter: bool = True
+    max_retry_after: float = 60.0
+    retryable_errors: frozenset[Enum] = DEFAULT_RETRYABLE_ERRORS
+    retryable_statuses: frozenset[int] = field(default_factory=lambda: frozenset({502, 503, 504}))
+    retry_timeouts: bool = True
+
+    def should_retry(self, method: str, idempotent: bool | None = None) -> bool:
+        """
+        Only idempotent calls are retried, unless explicitly opted in by `idempotent`.
+        """
+        if idempotent is None:
+            return method.upper() in IDEMPOTENT_METHODS
+        return idempotent
+
+    def is_retryable(self, error: Exception) -> bool:
+        if isinstance(error, RequestTimeoutError):
+            return self.retry_timeouts
+        if isinstance(error, APIResponseError):
+            return error.error in self.retryable_errors
+        if isinstance(error, HTTPResponseError):
+            return error.status in self.retryable_statuses
+        return False
+
+    def delay(self, attempt: int, error: Exception) -> float | None:
+        """
+        Seconds to wait before the next attempt, `None` means don't retry.
+        """
+        retry_after = _retry_after(error)
+        if retry_after is not None:
+            return retry_after if retry_after <= self.max_retry_after else None
+
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+def _retry_after(error: Exception) -> float | None:
+    if not isinstance(error, HTTPResponseError):
+        return None
+
+    value = error.headers.get("Retry-After")
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,26 @@
+"""
+JSON encoding and decoding, with orjson when it's installed (`pip install i-unipile-sdk[orjson]`).
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def loads(content: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Compact UTF-8 JSON, like the request bodies encoded by httpx.
+    """
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode()
@@ -0,0 +1,63 @@
+"""
+Coalescing of identical in-flight calls.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Identical calls (same key) overlapping in time share one execution: the first caller
+    runs it, the others wait for its result (or exception).
+
+    Threads and asyncio tasks are coalesced separately, counters are shared.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._calls: dict[Hashable, Future[Any]] = {}
+        self._tasks: dict[Hashable, asyncio.Future[Any]] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, function: Callable[[], T]) -> T:
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                self.misses += 1
+                future = self._calls[key] = Future()
+            else:
+                self.hits += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = function()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    async def ado(self, key: Hashable, function: Callable[[], Awaitable[T]]) -> T:
+        with self._lock:
+            task = self._tasks.get(key)
+            if task is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+                task = self._tasks[key] = asyncio.ensure_future(function())
+                task.add_done_callback(lambda _: self._tasks.pop(key, None))
+
+        # NOTE: shield, so a cancelled caller doesn't cancel the call for everyone
+        return await asyncio.shield(task)
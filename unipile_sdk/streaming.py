@@ -0,0 +1,228 @@
+"""
+Incremental parsing of list responses, items are yielded while the body downloads.
+"""
+
+import codecs
+import json
+from typing import Any, AsyncIterator, Awaitable, Callable, Generic, Iterator, TypeVar
+
+import httpx
+
+T = TypeVar("T")
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = ",]}" + _WHITESPACE
+
+
+class ItemsParser:
+    """
+    Push parser of a JSON object with an `items` array (unipile list responses). Fed with
+    body chunks, it returns every completed item of `items`, other members of the object
+    (e.g. `cursor`) are collected into `fields`.
+
+    Only one item (and one chunk) is kept in memory, not the whole body.
+    """
+
+    def __init__(self) -> None:
+        self.fields: dict[str, Any] = {}
+        self.done = False
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._state = "start"
+        self._key = ""
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        self._buffer = self._buffer[self._pos :] + self._text.decode(chunk)
+        self._pos = 0
+        return self._parse(final=False)
+
+    def close(self) -> list[Any]:
+        """
+        Parse the rest of the body, it must be a complete object.
+        """
+        self._buffer = self._buffer[self._pos :] + self._text.decode(b"", final=True)
+        self._pos = 0
+        items = self._parse(final=True)
+        if not self.done:
+            raise json.JSONDecodeError("Incomplete list response", self._buffer, self._pos)
+        return items
+
+    def _skip_whitespace(self) -> str | None:
+        """
+        Next significant character, `None` when more data is needed.
+        """
+        buffer, pos = self._buffer, self._pos
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+        return buffer[pos] if pos < len(buffer) else None
+
+    def _value(self, final: bool) -> tuple[bool, Any]:
+        """
+        Decode a complete JSON value at the current position.
+        """
+        try:
+            value, end = _decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return False, None
+
+        # NOTE: a number (or literal) may continue in the next chunk, e.g. "1." + "5", it's
+        # complete once a delimiter follows it
+        buffer = self._buffer
+        if not final and buffer[end - 1] not in '"]}':
+            if end == len(buffer) or buffer[end] not in _DELIMITERS:
+                return False, None
+        self._pos = end
+        return True, value
+
+    def _parse(self, final: bool) -> list[Any]:
+        items = []
+        while not self.done:
+            char = self._skip_whitespace()
+            if char is None:
+                break
+
+            state = self._state
+            if state == "start":
+                if char != "{":
+                    raise json.JSONDecodeError("Expecting object", self._buffer, self._pos)
+                self._pos += 1
+                self._state = "key"
+            elif state == "key":
+                if char == "}":
+                    self._pos += 1
+                    self.done = True
+                    break
+                if char == ",":
+                    self._pos += 1
+                    continue
+                complete, key = self._value(final)
+                if not complete:
+                    break
+                if not isinstance(key, str):
+                    raise json.JSONDecodeError("Expecting property name", self._buffer, self._pos)
+                self._key = key
+                self._state = "colon"
+            elif state == "colon":
+                if char != ":":
+                    raise json.JSONDecodeError("Expecting ':'", self._buffer, self._pos)
+                self._pos += 1
+                self._state = "value"
+            elif state == "value":
+                if self._key == "items" and char == "[":
+                    self._pos += 1
+                    self._state = "items"
+                    continue
+                complete, value = self._value(final)
+                if not complete:
+                    break
+                self.fields[self._key] = value
+                self._state = "key"
+            elif state == "items":
+                if char == "]":
+                    self._pos += 1
+                    self._state = "key"
+                    continue
+                if char == ",":
+                    self._pos += 1
+                    continue
+                complete, item = self._value(final)
+                if not complete:
+                    break
+                items.append(item)
+        return items
+
+
+class ItemStream(Generic[T]):
+    """
+    Items of a list response, parsed and built one at a time while the body downloads.
+    Other fields (e.g. `cursor`) are available once all items are consumed:
+
+    with stream_items(client.users.relations)() as relations:
+        for relation in relations:
+            ...
+        cursor = relations.cursor
+    """
+
+    def __init__(self, response: httpx.Response, build: Callable[[Any], T]) -> None:
+        self.response = response
+        self.build = build
+        self.parser = ItemsParser()
+        self.count = 0
+
+    @property
+    def fields(self) -> dict[str, Any]:
+        if not self.parser.done:
+            raise RuntimeError("Fields are available after all items are consumed")
+        return self.parser.fields
+
+    @property
+    def cursor(self) -> Any:
+        return self.fields.get("cursor")
+
+    def __iter__(self) -> Iterator[T]:
+        try:
+            for chunk in self.response.iter_bytes():
+                yield from self._build(self.parser.feed(chunk))
+            yield from self._build(self.parser.close())
+        finally:
+            self.response.close()
+
+    def _build(self, items: list[Any]) -> Iterator[T]:
+        for item in items:
+            self.count += 1
+            yield self.build(item)
+
+    def close(self) -> None:
+        self.response.close()
+
+    def __enter__(self) -> "ItemStream[T]":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class AsyncItemStream(ItemStream[T]):
+    """
+    Items of a list response of `AsyncClient`, iterated with `async for`. The request is
+    sent on iteration.
+    """
+
+    def __init__(self, response: Awaitable[httpx.Response], build: Callable[[Any], T]) -> None:
+        self._pending = response
+        self.response: httpx.Response | None = None
+        self.build = build
+        self.parser = ItemsParser()
+        self.count = 0
+
+    def __iter__(self) -> Iterator[T]:
+        raise TypeError("Use `async for` to iterate items of AsyncClient responses")
+
+    async def __aiter__(self) -> AsyncIterator[T]:
+        self.response = await self._pending
+        try:
+            async for chunk in self.response.aiter_bytes():
+                for item in self._build(self.parser.feed(chunk)):
+                    yield item
+            for item in self._build(self.parser.close()):
+                yield item
+        finally:
+            await self.response.aclose()
+
+    async def aclose(self) -> None:
+        if self.response is None:
+            # NOTE: request was never sent, close the coroutine
+            getattr(self._pending, "close", lambda: None)()
+        else:
+            await self.response.aclose()
+
+    async def __aenter__(self) -> "AsyncItemStream[T]":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
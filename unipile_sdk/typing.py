@@ -2,11 +2,22 @@
 Custom type definitions for unipile client.
 """
 
-from typing import Awaitable, TypeVar, Literal
+from typing import Awaitable, Literal, Protocol, Sequence, TypeVar
 
 T = TypeVar("T")
+T_co = TypeVar("T_co", covariant=True)
 SyncAsync = T | Awaitable[T]
 
+
+class ListResponse(Protocol[T_co]):
+    """
+    Page of a list endpoint, a response model with `items`.
+    """
+
+    @property
+    def items(self) -> Sequence[T_co]: ...
+
+
 AccountLinkType = Literal["create", "reconnect"]
 AccountProvider = Literal[
     "*",  # Any provider
@@ -23,3 +34,18 @@ AccountProvider = Literal[
     "TWITTER",
 ]
 
+# Provider actions with their own limits, see
+# https://developer.unipile.com/docs/provider-limits-and-restrictions
+RequestAction = Literal[
+    "profile_view",
+    "invite",
+    "search",
+    "message_send",
+]
+
+# How response bodies are turned into models: "validate" with pydantic, or return "dict"
+# bodies as decoded
+ValidationMode = Literal["validate", "dict"]
+
+# "use" reads and writes cache, "refresh" only writes fresh response, "bypass" skips cache
+CacheMode = Literal["use", "refresh", "bypass"]
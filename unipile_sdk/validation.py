@@ -0,0 +1,276 @@
+"""
+Trusted construction of response models, without validation, and validation of responses
+tolerating schema drift.
+"""
+
+import logging
+import threading
+import types
+from dataclasses import dataclass
+from enum import Enum
+from functools import cache
+from typing import Annotated, Any, Callable, Literal, TypeVar, Union, get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from .models.lazy import Deferred, LazyMarker
+from .serialization import loads
+
+M = TypeVar("M", bound=BaseModel)
+
+# Converts a decoded JSON value into the value of an annotated field
+Converter = Callable[[Any], Any]
+
+_builders: dict[type[BaseModel], Converter] = {}
+_setattr = object.__setattr__
+
+
+@cache
+def adapter(type_: Any) -> TypeAdapter[Any]:
+    """
+    Validator of `type_`, compiled once.
+    """
+    return TypeAdapter(type_)
+
+
+def construct(model: type[M], data: dict[str, Any]) -> M:
+    """
+    Build `model` from trusted JSON data, like `model.model_construct(**data)`, but nested
+    models (also in lists, dicts and unions) are constructed too and enum values are
+    converted to enum members. Other values are kept as decoded, nothing is validated.
+    """
+    return _builder(model)(data)
+
+
+def _builder(model: type[BaseModel]) -> Converter:
+    builder = _builders.get(model)
+    if builder is not None:
+        return builder
+
+    # NOTE: fields are compiled on first use, so recursive models are supported
+    plan: _Plan | None = None
+
+    def build(data: Any) -> Any:
+        nonlocal plan
+        if not isinstance(data, dict):
+            return data
+        if plan is None:
+            plan = _Plan(model)
+
+        if plan.aliases:
+            data = {plan.aliases.get(key, key): value for key, value in data.items()}
+
+        # NOTE: bulk dict and set operations run in C, only fields holding models or
+        # enums are visited one by one
+        values = {**plan.defaults, **data}
+        if not values.keys() <= plan.names:
+            for key in values.keys() - plan.names:
+                del values[key]
+        for name, convert in plan.converters:
+            value = values.get(name)
+            if value is not None:
+                values[name] = convert(value)
+
+        # NOTE: same as `model_construct`
+        instance = model.__new__(model)
+        _setattr(instance, "__dict__", values)
+        _setattr(instance, "__pydantic_fields_set__", plan.names & data.keys())
+        _setattr(instance, "__pydantic_extra__", None)
+        _setattr(instance, "__pydantic_private__", None)
+        return instance
+
+    _builders[model] = build
+    return build
+
+
+class _Plan:
+    """
+    Fields of a model compiled for construction.
+    """
+
+    def __init__(self, model: type[BaseModel]) -> None:
+        if model.__pydantic_post_init__ or model.model_config.get("extra") == "allow":
+            raise TypeError(f"{model.__name__} can't be constructed without validation")
+
+        self.names = frozenset(model.model_fields)
+        self.aliases = {
+            field.alias: name
+            for name, field in model.model_fields.items()
+            if field.alias and field.alias != name
+        }
+        self.defaults = {
+            name: field.get_default(call_default_factory=True)
+            for name, field in model.model_fields.items()
+            if not field.is_required()
+        }
+        self.converters = [
+            (name, _deferring(convert) if _is_lazy(field.metadata) else convert)
+            for name, field in model.model_fields.items()
+            if (convert := _converter(field.annotation)) is not None
+        ]
+
+
+def _is_lazy(metadata: list[Any]) -> bool:
+    return any(isinstance(meta, LazyMarker) for meta in metadata)
+
+
+def _deferring(convert: Converter) -> Converter:
+    """
+    Converter of a lazy field, the value is converted on first access.
+    """
+    return lambda value: Deferred(value, convert)
+
+
+def _converter(annotation: Any) -> Converter | None:
+    """
+    Converter of values of `annotation` type, `None` when values are kept as is.
+    """
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _converter(get_args(annotation)[0])
+
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return _builder(annotation)
+        if issubclass(annotation, Enum):
+            members = annotation._value2member_map_
+            return lambda value: members.get(value, value)
+
+    if origin in (list, set, frozenset, tuple):
+        args = [arg for arg in get_args(annotation) if arg is not Ellipsis]
+        item = _converter(args[0]) if len(args) == 1 or origin is not tuple else None
+        if item is None:
+            return None
+        return lambda value: [item(v) if v is not None else v for v in value]
+
+    if origin is dict:
+        item = _converter(get_args(annotation)[1])
+        if item is None:
+            return None
+        return lambda value: {k: item(v) if v is not None else v for k, v in value.items()}
+
+    if origin in (Union, types.UnionType):
+        # NOTE: arms of tagged unions are annotated with their `Tag`
+        arms = [
+            get_args(arg)[0] if get_origin(arg) is Annotated else arg
+            for arg in get_args(annotation)
+        ]
+        return _union_converter([arm for arm in arms if arm is not type(None)])
+
+    return None
+
+
+def _union_converter(arms: list[Any]) -> Converter | None:
+    models = [arm for arm in arms if isinstance(arm, type) and issubclass(arm, BaseModel)]
+    others = [_converter(arm) for arm in arms if arm not in models]
+    others = [convert for convert in others if convert is not None]
+    if not models:
+        return others[0] if len(others) == 1 else None
+    if len(models) == 1 and not others:
+        return _builder(models[0])
+
+    # NOTE: pick the model by its literal fields (e.g. `type: Literal["img"]`), like
+    # a discriminated union, otherwise by required fields
+    choices = [(_literals(model), _required(model), _builder(model)) for model in models]
+
+    def convert(value: Any) -> Any:
+        if not isinstance(value, dict):
+            return others[0](value) if others else value
+
+        for literals, required, build in choices:
+            matches = all(value.get(key) in allowed for key, allowed in literals)
+            if matches and required <= value.keys():
+                return build(value)
+        return value
+
+    return convert
+
+
+def _literals(model: type[BaseModel]) -> list[tuple[str, tuple[Any, ...]]]:
+    return [
+        (field.alias or name, get_args(field.annotation))
+        for name, field in model.model_fields.items()
+        if field.is_required() and get_origin(field.annotation) is Literal
+    ]
+
+
+def _required(model: type[BaseModel]) -> set[str]:
+    return {
+        field.alias or name for name, field in model.model_fields.items() if field.is_required()
+    }
+
+
+@dataclass
+class ValidationStats:
+    validated: int = 0
+    failures: int = 0
+    reported: int = 0
+
+
+class ValidationPolicy:
+    """
+    Validate responses with pydantic without crashing the job on schema drift: a response
+    that fails validation is counted and constructed instead (see `construct()`), and a
+    fraction of the failures of each endpoint is reported to `on_failure` (or logged),
+    e.g. 1% of search failures:
+
+    ValidationPolicy(rate=0.1, rates={"ln_search.search": 0.01})
+
+    The first failure of each endpoint is always reported. Every response is validated:
+    pydantic builds models natively, no trusted construction is cheaper.
+    """
+
+    def __init__(
+        self,
+        rate: float = 0.01,
+        rates: dict[str, float] | None = None,
+        on_failure: Callable[[str, ValidationError, dict[str, Any]], None] | None = None,
+    ) -> None:
+        self.rate = rate
+        self.rates = rates or {}
+        self.on_failure = on_failure
+        self.stats: dict[str, ValidationStats] = {}
+        self._credits: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _count(self, endpoint: str, failed: bool) -> bool:
+        """
+        Count a validated response, whether its failure is reported. Reports are spread
+        evenly: each failure earns the endpoint `rate` of a report.
+        """
+        with self._lock:
+            stats = self.stats.setdefault(endpoint, ValidationStats())
+            stats.validated += 1
+            if not failed:
+                return False
+
+            stats.failures += 1
+            credit = self._credits.get(endpoint, 1.0)
+            reported = credit >= 1
+            if reported:
+                credit -= 1
+                stats.reported += 1
+            self._credits[endpoint] = credit + self.rates.get(endpoint, self.rate)
+            return reported
+
+    def build(self, endpoint: str, model: type[M], content: bytes | dict[str, Any]) -> M:
+        """
+        Model of a response body (or an item of a streamed list) of endpoint.
+        """
+        try:
+            if isinstance(content, bytes):
+                result = model.model_validate_json(content)
+            else:
+                result = model.model_validate(content)
+        except ValidationError as e:
+            data = loads(content) if isinstance(content, bytes) else content
+            if self._count(endpoint, failed=True):
+                if self.on_failure is not None:
+                    self.on_failure(endpoint, e, data)
+                else:
+                    logging.getLogger(__package__).warning(
+                        f"Response of {endpoint} doesn't match {model.__name__}: {e}"
+                    )
+            return construct(model, data)
+        self._count(endpoint, failed=False)
+        return result